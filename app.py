@@ -4,26 +4,117 @@ import streamlit as st
 from datetime import timedelta
 from streamlit_autorefresh import st_autorefresh
 from src import (
-    load_csv_bytes,
+    upload_hash,
+    scan_csv_upload,
+    load_csv_upload,
     load_csv_path_live,
+    parquet_cache_dir,
+    load_parquet_manifest,
+    read_parquet_days,
+    start_parquet_sync,
+    dir_manifest,
+    load_csv_dir,
     enrich,
     filter_df,
     kpis,
     fig_time_series,
     fig_cpm_distribution,
+    count_histogram,
+    db_count_histogram,
+    preview_page,
+    format_preview,
+    df_to_csv_bytes,
+    export_enriched,
     get_engine,
     safe_ident,
     db_min_max,
     db_distinct_notes,
-    db_fetch_slice,
+    db_row_count,
+    db_fetch_resolution,
+    db_kpis,
 )
+from src.data_prep import (
+    PARQUET_ENABLED,
+    DAILY_GLOB,
+    GMC_COLUMNS,
+    DIR_PATTERN,
+    PREVIEW_COLUMNS,
+    EXPORT_FORMATS,
+)
+from src.backend import META_TTL
+from src.plots import PLOT_POINTS
 
 DEFAULT_CONV = 0.0065  # µSv/hr per CPM (adjust if you've calibrated)
+EXPORT_DIR = os.getenv("GMC_EXPORT_DIR", "./data/exports")
+# Finished server-side exports up to this size are also offered for download.
+EXPORT_DOWNLOAD_MB = float(os.getenv("GMC_EXPORT_DOWNLOAD_MB", "200"))
 PAGE_BG = "#0f172a"
 
 st.set_page_config(page_title="GQ GMC-SE Dashboard", page_icon="☢️", layout="wide")
 
 
+def show_kpis(kpi_vals: tuple[str, str, str, str]) -> None:
+    cpm_cur, usv_cur, avg_roll, max_cpm = kpi_vals
+
+    c1, c2, c3, c4 = st.columns(4)
+
+    c1.metric("Current CPM", cpm_cur)
+
+    c2.metric("Current µSv/hr", usv_cur)
+
+    c3.metric(f"{roll_window}-min Avg (CPM)", avg_roll)
+
+    c4.metric("Max CPM (range)", max_cpm)
+
+
+def date_controls(min_dt, max_dt) -> None:
+    """Date picker bounded by the data, kept in st.session_state.date_range."""
+    min_date = pd.to_datetime(min_dt).date()
+    max_date = pd.to_datetime(max_dt).date()
+
+    if "date_range" not in st.session_state:
+        default_start = max(min_date, max_date - timedelta(days=1))
+        st.session_state.date_range = (default_start, max_date)
+
+    if follow_latest:
+        cur_start, cur_end = st.session_state.date_range
+        st.session_state.date_range = (
+            max(min_date, cur_start),
+            max_date,  # always extend to latest
+        )
+
+    else:
+        st.session_state.date_range = (
+            max(min_date, st.session_state.date_range[0]),
+            min(max_date, st.session_state.date_range[1]),
+        )
+
+    date_range = st.date_input(
+        "Date range",
+        value=st.session_state.date_range,
+        min_value=min_date,
+        max_value=max_date,
+        key="date_range_picker",
+    )
+
+    # Keep session_state in sync
+    if isinstance(date_range, tuple) and len(date_range) == 2:
+        st.session_state.date_range = date_range
+
+
+@st.cache_data(ttl=META_TTL, show_spinner=False)
+def table_meta(_engine, table: str):
+    """
+    Date bounds, notes options and row count of ``table`` for the controls,
+    cached for ``GMC_META_TTL`` seconds so reruns don't ask the DB each time.
+    """
+    return (
+        db_min_max(_engine, table),
+        db_distinct_notes(_engine, table),
+        db_row_count(_engine, table),
+    )
+
+
 # MARK: Sidebar
 
 st.sidebar.title("Controls")
@@ -31,7 +122,12 @@ st.sidebar.title("Controls")
 # Default source = Postgres
 source_mode = st.sidebar.radio(
     "Data source",
-    ["Postgres (Live)", "Upload CSV", "Read from file path (Live)"],
+    [
+        "Postgres (Live)",
+        "Upload CSV",
+        "Read from file path (Live)",
+        "Directory of daily files (Live)",
+    ],
     index=0,
 )
 
@@ -41,9 +137,16 @@ conv_factor = st.sidebar.number_input(
 roll_window = st.sidebar.number_input(
     "Rolling window (minutes)", min_value=1, value=15, step=1
 )
+plot_points = st.sidebar.number_input(
+    "Chart pixel budget (points drawn per series)",
+    min_value=200,
+    value=PLOT_POINTS,
+    step=200,
+)
 
 uploaded = None
 file_path = None
+data_dir = None
 follow_latest = False
 refresh_secs = 10
 
@@ -68,6 +171,21 @@ elif source_mode == "Read from file path (Live)":
 
     st_autorefresh(interval=int(refresh_secs * 1000), key="autorefresh_file")
 
+elif source_mode == "Directory of daily files (Live)":
+    data_dir = st.sidebar.text_input(
+        f"Directory with {DIR_PATTERN} files", value="./data"
+    )
+
+    follow_latest = st.sidebar.checkbox(
+        "Follow latest (auto-extend end date)", value=True
+    )
+
+    refresh_secs = st.sidebar.number_input(
+        "Auto-refresh seconds", min_value=2, value=10, step=1
+    )
+
+    st_autorefresh(interval=int(refresh_secs * 1000), key="autorefresh_dir")
+
 else:
     # MARK: Postgres controls
     st.sidebar.text_input(
@@ -88,6 +206,13 @@ else:
         "Auto-refresh seconds", min_value=2, value=10, step=1
     )
 
+    max_points = st.sidebar.number_input(
+        "Max chart points (larger ranges are bucketed in SQL)",
+        min_value=100,
+        value=4000,
+        step=500,
+    )
+
     st_autorefresh(interval=int(refresh_secs * 1000), key="autorefresh_db")
 
 
@@ -97,14 +222,102 @@ st.title("☢️GQ GMC-SE Radiation Dashboard☢️")
 
 df = pd.DataFrame()
 info_msg = None
+notes_vals = []
+kpis_shown = False
+filtered = False
+bucket = None
+engine = None
 
 try:
     if source_mode == "Upload CSV" and uploaded is not None:
-        df = load_csv_bytes(uploaded.getvalue())
-        info_msg = "Loaded from upload."
+        # Stream the upload twice: once for the control bounds, then again
+        # keeping only the selected range/notes. Both are cached on a hash.
+        content_hash = upload_hash(uploaded)
+        scan = scan_csv_upload(content_hash, uploaded)
+        if scan["min_dt"] is None or scan["max_dt"] is None:
+            st.info("No valid datetimes found in the data.")
+            st.stop()
+
+        date_controls(scan["min_dt"], scan["max_dt"])
+
+        notes_vals = st.multiselect(
+            "Filter by notes/location", options=scan["notes"], default=[]
+        )
+
+        df = load_csv_upload(
+            content_hash, uploaded, st.session_state.date_range, notes_vals
+        )
+        info_msg = f"Loaded from upload ({scan['rows']:,} readings)."
+        if scan["dropped"]:
+            info_msg += f" Skipped {scan['dropped']} bad line(s)."
 
     elif source_mode == "Read from file path (Live)" and file_path:
-        df, info_msg = load_csv_path_live(file_path)
+        manifest = None
+        if PARQUET_ENABLED:
+            # Mirror the file (and the dailies) into day-partitioned Parquet in
+            # the background; once built, only the picked days are read.
+            start_parquet_sync(file_path, DAILY_GLOB)
+            cache_dir = parquet_cache_dir(file_path)
+            manifest = load_parquet_manifest(cache_dir)
+
+        if manifest and manifest["days"]:
+            days = manifest["days"]
+            date_controls(
+                min(d["min"] for d in days.values()),
+                max(d["max"] for d in days.values()),
+            )
+
+            notes_vals = st.multiselect(
+                "Filter by notes/location",
+                options=sorted(set().union(*(d["notes"] for d in days.values()))),
+                default=[],
+            )
+
+            df = read_parquet_days(
+                cache_dir,
+                st.session_state.date_range,
+                notes_vals,
+                columns=GMC_COLUMNS,
+                manifest=manifest,
+            )
+            filtered = True
+            info_msg = (
+                f"Loaded from Parquet cache of {file_path} "
+                f"(synced {manifest['synced_at']})."
+            )
+            if manifest["dropped"]:
+                info_msg += f" Skipped {manifest['dropped']} bad line(s)."
+
+        else:
+            df, info_msg, _ = load_csv_path_live(file_path)
+            if PARQUET_ENABLED:
+                info_msg = (
+                    f"{info_msg} Building Parquet cache in the background.".strip()
+                )
+
+    elif source_mode == "Directory of daily files (Live)" and data_dir:
+        # MARK: Directory
+        if PARQUET_ENABLED:
+            start_parquet_sync(os.path.join(data_dir, DIR_PATTERN))
+
+        files = dir_manifest(data_dir)
+        bounds = [e for e in files.values() if e["min"] is not None]
+        if not bounds:
+            st.info(f"No {DIR_PATTERN} files with readings found in {data_dir}.")
+            st.stop()
+
+        date_controls(min(e["min"] for e in bounds), max(e["max"] for e in bounds))
+
+        notes_vals = st.multiselect(
+            "Filter by notes/location",
+            options=sorted(set().union(*(e["notes"] for e in bounds))),
+            default=[],
+        )
+
+        df, info_msg = load_csv_dir(
+            data_dir, st.session_state.date_range, notes_vals, manifest=files
+        )
+        filtered = True
 
     else:
         # MARK: Postgres
@@ -119,62 +332,51 @@ try:
             st.stop()
 
         # Compute min/max and notes from DB for controls
-        min_dt, max_dt = db_min_max(engine, db_table)
+        (min_dt, max_dt), note_options, total_rows = table_meta(engine, db_table)
         if min_dt is None or max_dt is None:
             st.info(f"No data found in table {db_table}.")
             st.stop()
 
-        note_options = db_distinct_notes(engine, db_table)
-
-        # Initialize / update date_range in session state
-        min_date = pd.to_datetime(min_dt).date()
-        max_date = pd.to_datetime(max_dt).date()
-
-        if "date_range" not in st.session_state:
-            default_start = max(min_date, max_date - timedelta(days=1))
-            st.session_state.date_range = (default_start, max_date)
-
-        if follow_latest:
-            cur_start, cur_end = st.session_state.date_range
-            st.session_state.date_range = (
-                max(min_date, cur_start),
-                max_date,  # always extend to latest
-            )
-
-        else:
-            st.session_state.date_range = (
-                max(min_date, st.session_state.date_range[0]),
-                min(max_date, st.session_state.date_range[1]),
-            )
-
-        # Render controls now that we have bounds
-        date_range = st.date_input(
-            "Date range",
-            value=st.session_state.date_range,
-            min_value=min_date,
-            max_value=max_date,
-            key="date_range_picker",
-        )
-
-        # Keep session_state in sync
-        if isinstance(date_range, tuple) and len(date_range) == 2:
-            st.session_state.date_range = date_range
+        date_controls(min_dt, max_dt)
 
         notes_vals = st.multiselect(
             "Filter by notes/location", options=note_options, default=[]
         )
 
-        # Fetch only the slice we need from DB
-        df = db_fetch_slice(
+        # Metric row straight from SQL, before (and independent of) the slice
+        show_kpis(
+            db_kpis(
+                engine,
+                db_table,
+                st.session_state.date_range[0],
+                st.session_state.date_range[1],
+                notes_vals,
+                conv_factor,
+                roll_window,
+            )
+        )
+        kpis_shown = True
+
+        # Fetch only the slice we need from DB. Small ranges come back raw (then
+        # just the new tail on subsequent refreshes), long ranges are bucketed.
+        df, bucket, st.session_state["_db_live"] = db_fetch_resolution(
             engine,
             db_table,
             st.session_state.date_range[0],
             st.session_state.date_range[1],
             notes_vals,
+            max_points=int(max_points),
+            state=st.session_state.get("_db_live"),
         )
 
         info_msg = f"Loaded from Postgres table {db_table}."
 
+        if total_rows is not None:
+            info_msg += f" {total_rows:,} readings in table."
+
+        if bucket is not None:
+            info_msg += f" Downsampled to {bucket} buckets (avg CPM per bucket)."
+
 except Exception as e:
     st.error(f"Failed to load data: {e}")
 
@@ -182,8 +384,18 @@ if info_msg:
     st.caption(f"ℹ️ {info_msg}")
 
 # MARK: Date Bounds
-# If not using Postgres, we still need to build date bounds & controls
-if source_mode != "Postgres (Live)":
+# Uploads and the Parquet cache are filtered while reading; a plain file path
+# read still needs its date bounds & controls built from the frame
+if (source_mode == "Upload CSV" and uploaded is None) or (
+    source_mode == "Directory of daily files (Live)" and not data_dir
+):
+    st.info(
+        "Upload a CSV or provide a valid file path to begin. Expected columns: "
+        "`datetime, count, unit, mode, reference_datetime, notes`."
+    )
+    st.stop()
+
+if source_mode == "Read from file path (Live)" and not filtered:
     if df.empty:
         st.info(
             "Upload a CSV or provide a valid file path to begin. Expected columns: "
@@ -199,34 +411,7 @@ if source_mode != "Postgres (Live)":
         st.info("No valid datetimes found in the data.")
         st.stop()
 
-    min_date = min_dt.date()
-
-    max_date = max_dt.date()
-
-    if "date_range" not in st.session_state:
-        default_start = max(min_date, (max_date - timedelta(days=1)))
-        st.session_state.date_range = (default_start, max_date)
-
-    if follow_latest:
-        cur_start, cur_end = st.session_state.date_range
-        st.session_state.date_range = (max(min_date, cur_start), max_date)
-
-    else:
-        st.session_state.date_range = (
-            max(min_date, st.session_state.date_range[0]),
-            min(max_date, st.session_state.date_range[1]),
-        )
-
-    date_range = st.date_input(
-        "Date range",
-        value=st.session_state.date_range,
-        min_value=min_date,
-        max_value=max_date,
-        key="date_range_picker",
-    )
-
-    if isinstance(date_range, tuple) and len(date_range) == 2:
-        st.session_state.date_range = date_range
+    date_controls(min_dt, max_dt)
 
     # MARK: Notes filter
     note_options = (
@@ -241,64 +426,159 @@ if source_mode != "Postgres (Live)":
     df = filter_df(df, st.session_state.date_range, notes_vals)
 
 # MARK: Enrich & KPIs
-df = enrich(df, conv_factor, roll_window)
-
-cpm_cur, usv_cur, avg_roll, max_cpm = kpis(df)
-
-c1, c2, c3, c4 = st.columns(4)
-
-c1.metric("Current CPM", cpm_cur)
-
-c2.metric("Current µSv/hr", usv_cur)
-
-c3.metric(f"{roll_window}-min Avg (CPM)", avg_roll)
+# The rolling window state stays in the session so live refreshes that only
+# appended rows just compute the new tail.
+df, st.session_state["_enrich"] = enrich(
+    df, conv_factor, roll_window, state=st.session_state.get("_enrich")
+)
 
-c4.metric("Max CPM (range)", max_cpm)
+if not kpis_shown:
+    show_kpis(kpis(df))
 
 # MARK: Plots
 left, right = st.columns([2, 1])
 
 with left:
     st.subheader("Time Series (CPM & µSv/hr)")
-    st.plotly_chart(fig_time_series(df, PAGE_BG), use_container_width=True)
+    st.plotly_chart(
+        fig_time_series(df, PAGE_BG, max_points=int(plot_points)),
+        use_container_width=True,
+    )
 
 with right:
     st.subheader("CPM Distribution")
-    st.plotly_chart(fig_cpm_distribution(df, PAGE_BG), use_container_width=True)
+    # Bucketed DB frames only hold averages; count the raw readings in SQL.
+    if bucket is not None:
+        hist, st.session_state["_db_count_hist"] = db_count_histogram(
+            engine,
+            db_table,
+            st.session_state.date_range[0],
+            st.session_state.date_range[1],
+            notes_vals,
+            state=st.session_state.get("_db_count_hist"),
+        )
+    else:
+        hist = count_histogram(df)
+    st.plotly_chart(fig_cpm_distribution(hist, PAGE_BG), use_container_width=True)
 
 st.subheader("Data Preview")
 
-show_cols = [
-    c
-    for c in [
-        "datetime",
-        "count",
-        "usv_hr",
-        "unit",
-        "mode",
-        "reference_datetime",
-        "notes",
-    ]
-    if c in df.columns
-]
+# Only the visible page is materialized and sent to the browser.
+c1, c2, c3, c4 = st.columns(4)
+
+sort_col = c1.selectbox(
+    "Sort by", [c for c in PREVIEW_COLUMNS if c in df.columns] or ["datetime"]
+)
+
+sort_order = c2.selectbox("Order", ["Descending", "Ascending"])
+
+page_size = c3.selectbox("Rows per page", [50, 100, 250, 500], index=1)
 
-df_display = df[show_cols].copy()
+n_pages = max(1, -(-len(df) // page_size))
 
-if "usv_hr" in df_display.columns:
-    df_display["usv_hr"] = df_display["usv_hr"].round(4)
+page = min(
+    int(c4.number_input("Page", min_value=1, value=1, step=1)),
+    n_pages,
+)
 
-st.dataframe(df_display, use_container_width=True, height=360)
+st.dataframe(
+    preview_page(
+        df, page - 1, page_size, sort_col, descending=sort_order == "Descending"
+    ),
+    use_container_width=True,
+    height=360,
+)
 
-csv_bytes = df_display.to_csv(index=False).encode("utf-8")
+first_row = (page - 1) * page_size + 1 if len(df) else 0
+st.caption(
+    f"Page {page:,} of {n_pages:,}: rows {first_row:,}–"
+    f"{min(page * page_size, len(df)):,} of {len(df):,}"
+)
 
 # MARK: DL Button
-st.download_button(
-    "Download enriched CSV",
-    data=csv_bytes,
-    file_name="gmcse_enriched.csv",
-    mime="text/csv",
+# The CSV is only built when asked for (in chunks) and kept until the selection
+# changes, instead of encoding the whole range on every refresh.
+export_key = (
+    source_mode,
+    tuple(st.session_state.get("date_range", ())),
+    tuple(notes_vals),
 )
 
+if st.session_state.get("_export_csv", {}).get("key") != export_key:
+    st.session_state.pop("_export_csv", None)
+
+if st.button("Prepare enriched CSV", disabled=df.empty):
+    st.session_state["_export_csv"] = {
+        "key": export_key,
+        "rows": len(df),
+        "data": df_to_csv_bytes(df, fmt=format_preview),
+    }
+
+export = st.session_state.get("_export_csv")
+if export is not None:
+    st.download_button(
+        f"Download enriched CSV ({export['rows']:,} rows, "
+        f"{len(export['data']) / 2**20:,.1f} MiB)",
+        data=export["data"],
+        file_name="gmcse_enriched.csv",
+        mime="text/csv",
+    )
+
+# MARK: DB export
+# Full-resolution range straight from Postgres (the chart frame may be
+# bucketed), streamed to a file on the server in batches.
+if engine is not None:
+    with st.expander("Export full range from Postgres (CSV.gz / Parquet)"):
+        start_day, end_day = st.session_state.date_range[:2]
+        c1, c2 = st.columns([1, 3])
+        export_fmt = c1.radio("Format", EXPORT_FORMATS, horizontal=True)
+        export_name = c2.text_input(
+            f"File name (written to {EXPORT_DIR} on the server)",
+            value=f"gmc_{start_day}_{end_day}.{export_fmt}",
+        )
+        # Only a file name is taken from the page; anything that looks like a
+        # path is cut down to its last part so exports stay in EXPORT_DIR.
+        export_name = os.path.basename(export_name.strip())
+        export_path = os.path.join(EXPORT_DIR, export_name)
+
+        if st.button("Export", disabled=export_name in ("", ".", "..")):
+            progress = st.empty()
+            try:
+                st.session_state["_db_export"] = export_enriched(
+                    engine,
+                    db_table,
+                    export_path,
+                    start_day,
+                    end_day,
+                    notes_vals,
+                    conv_factor,
+                    roll_window,
+                    export_fmt,
+                    on_batch=lambda n: progress.caption(f"{n:,} rows written…"),
+                )
+            except Exception as e:
+                st.error(f"Export failed: {e}")
+            progress.empty()
+
+        done = st.session_state.get("_db_export")
+        if done is not None and os.path.exists(done["path"]):
+            size_mb = done["bytes"] / 2**20
+            st.success(
+                f"{done['rows']:,} rows written to {done['path']} ({size_mb:,.1f} MiB)."
+            )
+            if size_mb <= EXPORT_DOWNLOAD_MB:
+                with open(done["path"], "rb") as f:
+                    st.download_button(
+                        "Download export",
+                        data=f.read(),
+                        file_name=os.path.basename(done["path"]),
+                        mime=(
+                            "application/gzip"
+                            if done["format"] == "csv.gz"
+                            else "application/vnd.apache.parquet"
+                        ),
+                    )
+
 # MARK: Footer
 st.caption(
     "Note: µSv/hr is estimated from CPM using a fixed factor and is most accurate for the calibration energy (e.g., Cs-137 gamma)."
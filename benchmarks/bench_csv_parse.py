@@ -0,0 +1,82 @@
+"""
+Benchmark: the old ``pd.read_csv(engine="python") + normalize_df`` path vs
+``read_gmc_csv + normalize_df`` on synthetic GMC-SE files (with a sprinkling of
+bad lines). Files are written to a temp dir and removed afterwards.
+
+    python -m benchmarks.bench_csv_parse --rows 10000 100000 1000000 10000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from src.data_prep import normalize_df, read_gmc_csv
+
+
+def write_synthetic(path: str, rows: int, bad_every: int = 50_000) -> None:
+    ts = pd.date_range("2020-01-01", periods=rows, freq="min")
+    df = pd.DataFrame(
+        {
+            "datetime": ts.strftime("%Y-%m-%d %H:%M:%S"),
+            "count": np.random.default_rng(0).poisson(15, rows),
+            "unit": "CPM",
+            "mode": "every minute",
+            "reference_datetime": "2020-01-01 00:00:00",
+            "notes": "",
+        }
+    )
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for i, chunk in enumerate(range(0, rows, bad_every)):
+            df.iloc[chunk : chunk + bad_every].to_csv(f, index=False, header=i == 0)
+            f.write("garbage,line,with,too,many,fields,here\n")
+
+
+def old_path(path: str) -> pd.DataFrame:
+    df = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8")
+    return normalize_df(df)
+
+
+def new_path(path: str) -> pd.DataFrame:
+    return normalize_df(read_gmc_csv(path)[0])
+
+
+def timed(fn, path: str) -> tuple[pd.DataFrame, float]:
+    t = time.perf_counter()
+    df = fn(path)
+    return df, time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--skip-old-above",
+        type=int,
+        default=2_000_000,
+        help="Don't time the (slow) python engine above this many rows.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"GMC-SE_{rows}.csv")
+            write_synthetic(path, rows)
+            size = os.path.getsize(path) / 2**20
+
+            new_df, new_s = timed(new_path, path)
+            line = (
+                f"{rows:>11,} rows ({size:,.1f} MiB): "
+                f"new {new_s:.3f}s ({rows / new_s:,.0f} rows/s)"
+            )
+
+            if rows <= args.skip_old_above:
+                old_df, old_s = timed(old_path, path)
+                assert len(old_df) == len(new_df)
+                line += f", old {old_s:.3f}s, speedup {old_s / new_s:.1f}x"
+
+            print(line)
+            os.remove(path)
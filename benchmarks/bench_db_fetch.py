@@ -0,0 +1,111 @@
+"""
+Benchmark: pd.read_sql_query + normalize_df vs COPY TO STDOUT (db_read_copy)
+for a db_fetch_slice sized query. Builds a scratch table with ``--rows``
+synthetic one-minute readings, times both paths and how far each one raises
+the process's peak RSS (so pyarrow's and libpq's native buffers count too; each
+run happens in a forked child, Linux only), then drops the table.
+
+    DATABASE_URL=... python -m benchmarks.bench_db_fetch --rows 1000000
+"""
+
+import argparse
+import multiprocessing
+import time
+import pandas as pd
+from sqlalchemy import text
+from src.backend import (
+    get_engine,
+    normalize_df,
+    db_read_copy,
+    READING_DTYPES,
+    READING_DATES,
+)
+
+TABLE = "public.gmc_bench_fetch"
+
+QUERY = text(
+    f"""
+    SELECT "datetime", "count", "unit", "mode", "reference_datetime", "notes"
+    FROM {TABLE}
+    WHERE "datetime" >= :start AND "datetime" < :end_excl
+    ORDER BY "datetime" ASC
+    """
+)
+
+
+def _status_kib(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _run(fn, out) -> None:
+    get_engine().dispose(close=False)  # don't share the parent's connections
+    start = _status_kib("VmRSS")
+    t = time.perf_counter()
+    df = fn()
+    secs = time.perf_counter() - t
+    peak = (_status_kib("VmHWM") - start) * 1024
+    out.put((len(df), secs, peak, df.memory_usage(deep=True).sum()))
+
+
+def measure(fn):
+    """Rows, wall time, peak RSS growth and frame size of ``fn`` in a fresh child."""
+    ctx = multiprocessing.get_context("fork")
+    out = ctx.Queue()
+    p = ctx.Process(target=_run, args=(fn, out))
+    p.start()
+    result = out.get()
+    p.join()
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    engine = get_engine()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {TABLE}")
+        conn.exec_driver_sql(
+            f"""
+            CREATE TABLE {TABLE} AS
+            SELECT TIMESTAMP '2020-01-01' + g * INTERVAL '1 minute' AS "datetime",
+                   (random() * 40)::int AS "count",
+                   'CPM'::text AS "unit",
+                   'every minute'::text AS "mode",
+                   TIMESTAMP '2020-01-01' AS "reference_datetime",
+                   NULL::text AS "notes"
+            FROM generate_series(0, {args.rows - 1}) g
+            """
+        )
+
+    params = {
+        "start": pd.Timestamp("2020-01-01"),
+        "end_excl": pd.Timestamp("2020-01-01") + pd.Timedelta(minutes=args.rows),
+    }
+
+    def via_sql():
+        with engine.begin() as conn:
+            return normalize_df(pd.read_sql_query(QUERY, conn, params=params))
+
+    def via_copy():
+        return db_read_copy(engine, QUERY, params, READING_DTYPES, READING_DATES)
+
+    try:
+        results = {}
+        for name, fn in [("read_sql_query", via_sql), ("COPY TO STDOUT", via_copy)]:
+            rows, secs, peak, frame = measure(fn)
+            results[name] = secs
+            print(
+                f"{name:>15}: {rows:,} rows in {secs:.3f}s, "
+                f"peak RSS +{peak / 2**20:,.1f} MiB, frame {frame / 2**20:,.1f} MiB"
+            )
+        print(f"speedup: {results['read_sql_query'] / results['COPY TO STDOUT']:.1f}x")
+    finally:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {TABLE}")
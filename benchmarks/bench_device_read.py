@@ -0,0 +1,68 @@
+"""
+Benchmark: device history polls against the emulated GMC-SE on a
+pseudo-terminal (real pyserial + pygmc, no counter needed). Compares opening
+the port and redoing the handshake for every poll, the way the utilities used
+to (and reading the whole history every time), with the shared
+``DeviceSession``, which only reads the history written since its last poll
+(reopening the port per poll by default, or with ``keep_open``).
+The emulator holds ``--minutes`` of history, its clock runs at ``--speed``
+and replies are paced like a ``--baud`` serial line (the GMC-SE's 115200 by
+default).
+
+    python -m benchmarks.bench_device_read --minutes 1440 10080 --polls 5
+"""
+
+import argparse
+import sys
+import time
+import pygmc
+import pandas as pd
+from src.emulator import CountSource, EmulatedGMCSE, serve_pty
+
+sys.path.insert(0, "src")  # the device scripts import ``utilities`` top-level
+from utilities import DeviceSession  # noqa: E402
+
+
+def per_call(port: str) -> pd.DataFrame:
+    gc = pygmc.GMCSE(port=port)
+    gc.get_version()
+    gc.get_serial()
+    history = gc.get_history_data()
+    gc.connection.close_connection()
+    return pd.DataFrame(history[1:], columns=history[0])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=int, nargs="+", default=[1440, 10080])
+    parser.add_argument("--polls", type=int, default=5)
+    parser.add_argument("--speed", type=float, default=60.0)
+    parser.add_argument("--baud", type=int, default=115200)
+    args = parser.parse_args()
+
+    for minutes in args.minutes:
+        device = EmulatedGMCSE(
+            CountSource(seed=0), speed=args.speed, history_minutes=minutes
+        )
+        port = serve_pty(device, args.baud)
+        session = DeviceSession(port=port, lock_path=None)
+        kept = DeviceSession(port=port, lock_path=None, keep_open=True)
+
+        for name, poll in [
+            ("port per call", lambda: per_call(port)),
+            ("shared session", session.history_df),
+            ("kept open", kept.history_df),
+        ]:
+            t = time.perf_counter()
+            for _ in range(args.polls):
+                df = poll()
+            secs = (time.perf_counter() - t) / args.polls
+            print(
+                f"{minutes:>8,} min history, {name:>14}: {secs * 1000:8.1f} ms/poll "
+                f"({len(df):,} rows)"
+            )
+        for name, s in [("shared session", session), ("kept open", kept)]:
+            print(
+                f"{'':>8}   {name:>14}: {s.handshakes} handshake(s), "
+                f"{s.reader.bytes_read:,} history bytes read in total"
+            )
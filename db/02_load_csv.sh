@@ -19,12 +19,17 @@ for f in "$CSV_DIR"/*.csv; do
   [ -e "$f" ] || continue
   found_any=true
   echo "Loading: $f"
-  # Use the Unix-domain socket directory used by the entrypoint
+  # Use the Unix-domain socket directory used by the entrypoint.
+  # Stage then merge on the (datetime, notes) natural key so overlapping
+  # daily dumps don't duplicate rows.
   psql --no-psqlrc -v ON_ERROR_STOP=1 \
        -h /var/run/postgresql \
        -U "$USER" -d "$DB" \
-       -c "\COPY $TABLE (datetime, count, unit, mode, reference_datetime, notes)
-           FROM '$f' WITH (FORMAT csv, HEADER true)"
+       -c "CREATE TEMP TABLE gmc_stage (LIKE $TABLE INCLUDING DEFAULTS)" \
+       -c "\COPY gmc_stage (datetime, count, unit, mode, reference_datetime, notes)
+           FROM '$f' WITH (FORMAT csv, HEADER true)" \
+       -c "INSERT INTO $TABLE SELECT * FROM gmc_stage ORDER BY datetime
+           ON CONFLICT DO NOTHING"
 done
 
 if [ "$found_any" = false ]; then
@@ -17,3 +17,96 @@ CREATE TABLE IF NOT EXISTS public.gmc_readings (
 CREATE INDEX IF NOT EXISTS idx_gmc_readings_datetime ON public.gmc_readings ("datetime");
 
 CREATE INDEX IF NOT EXISTS idx_gmc_readings_notes     ON public.gmc_readings ("notes");
+
+-- Natural key so overlapping CSV dumps can be (re)loaded with ON CONFLICT DO NOTHING:
+CREATE UNIQUE INDEX IF NOT EXISTS uq_gmc_readings_datetime_notes
+  ON public.gmc_readings ("datetime", "notes") NULLS NOT DISTINCT;
+
+/*
+Minute/hour/day rollups of gmc_readings, per notes value, and a small per-day,
+per-notes summary (row count, min/max datetime) the dashboard reads its date
+bounds, row count and notes options from (summed on read). Kept up to date by a
+statement level trigger so every INSERT/COPY batch is folded in once. The
+summary is per day so concurrent writers only queue on each other's row locks
+when they insert into the same day and notes value. Both are append-only; after
+deleting raw rows rebuild them with:
+  python -m src.backend.db_rollup_backfill --start YYYY-MM-DD --end YYYY-MM-DD
+(src/backend/rollup_ddl.py generates the same DDL for other table names.)
+*/
+
+CREATE TABLE IF NOT EXISTS public.gmc_readings_1m (
+  "bucket"  TIMESTAMP NOT NULL,
+  "notes"   TEXT      NOT NULL DEFAULT '',
+  "n"       BIGINT    NOT NULL,
+  "sum"     BIGINT    NOT NULL,
+  "min"     INTEGER   NOT NULL,
+  "max"     INTEGER   NOT NULL,
+  PRIMARY KEY ("bucket", "notes")
+);
+
+CREATE TABLE IF NOT EXISTS public.gmc_readings_1h (LIKE public.gmc_readings_1m INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS public.gmc_readings_1d (LIKE public.gmc_readings_1m INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS public.gmc_readings_meta (
+  "day"     DATE      NOT NULL,
+  "notes"   TEXT      NOT NULL,
+  "n"       BIGINT    NOT NULL,
+  "min_dt"  TIMESTAMP NOT NULL,
+  "max_dt"  TIMESTAMP NOT NULL,
+  PRIMARY KEY ("day", "notes")
+);
+
+CREATE OR REPLACE FUNCTION public.gmc_readings_rollup_fn() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  INSERT INTO public.gmc_readings_1m AS r ("bucket", "notes", "n", "sum", "min", "max")
+  SELECT date_trunc('minute', "datetime"), COALESCE("notes", ''),
+         COUNT(*), SUM("count"), MIN("count"), MAX("count")
+  FROM new_rows
+  GROUP BY 1, 2
+  ON CONFLICT ("bucket", "notes") DO UPDATE SET
+    "n"   = r."n" + EXCLUDED."n",
+    "sum" = r."sum" + EXCLUDED."sum",
+    "min" = LEAST(r."min", EXCLUDED."min"),
+    "max" = GREATEST(r."max", EXCLUDED."max");
+
+  INSERT INTO public.gmc_readings_1h AS r ("bucket", "notes", "n", "sum", "min", "max")
+  SELECT date_trunc('hour', "datetime"), COALESCE("notes", ''),
+         COUNT(*), SUM("count"), MIN("count"), MAX("count")
+  FROM new_rows
+  GROUP BY 1, 2
+  ON CONFLICT ("bucket", "notes") DO UPDATE SET
+    "n"   = r."n" + EXCLUDED."n",
+    "sum" = r."sum" + EXCLUDED."sum",
+    "min" = LEAST(r."min", EXCLUDED."min"),
+    "max" = GREATEST(r."max", EXCLUDED."max");
+
+  INSERT INTO public.gmc_readings_1d AS r ("bucket", "notes", "n", "sum", "min", "max")
+  SELECT date_trunc('day', "datetime"), COALESCE("notes", ''),
+         COUNT(*), SUM("count"), MIN("count"), MAX("count")
+  FROM new_rows
+  GROUP BY 1, 2
+  ON CONFLICT ("bucket", "notes") DO UPDATE SET
+    "n"   = r."n" + EXCLUDED."n",
+    "sum" = r."sum" + EXCLUDED."sum",
+    "min" = LEAST(r."min", EXCLUDED."min"),
+    "max" = GREATEST(r."max", EXCLUDED."max");
+
+  INSERT INTO public.gmc_readings_meta AS m ("day", "notes", "n", "min_dt", "max_dt")
+  SELECT "datetime"::date, COALESCE("notes", ''), COUNT(*), MIN("datetime"), MAX("datetime")
+  FROM new_rows
+  GROUP BY 1, 2
+  ON CONFLICT ("day", "notes") DO UPDATE SET
+    "n"      = m."n" + EXCLUDED."n",
+    "min_dt" = LEAST(m."min_dt", EXCLUDED."min_dt"),
+    "max_dt" = GREATEST(m."max_dt", EXCLUDED."max_dt");
+
+  RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER gmc_readings_rollup
+AFTER INSERT ON public.gmc_readings
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION public.gmc_readings_rollup_fn();
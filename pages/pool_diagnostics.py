@@ -0,0 +1,86 @@
+import pandas as pd
+import streamlit as st
+from sqlalchemy import text
+from streamlit_autorefresh import st_autorefresh
+from src import get_engine, pool_metrics
+
+st.set_page_config(page_title="DB Pool Diagnostics", page_icon="☢️", layout="wide")
+
+st.title("DB Pool Diagnostics")
+
+refresh_secs = st.sidebar.number_input(
+    "Auto-refresh seconds", min_value=2, value=10, step=1
+)
+
+st_autorefresh(interval=int(refresh_secs * 1000), key="autorefresh_pool")
+
+try:
+    engine = get_engine()
+except Exception as e:
+    st.error(f"Could not create engine: {e}")
+    st.stop()
+
+if engine is None:
+    st.error("No database configured (DATABASE_URL).")
+    st.stop()
+
+m = pool_metrics(engine)
+
+st.caption(f"{m['pool_class']}: {m['status']}")
+
+# MARK: Gauges
+c1, c2, c3, c4 = st.columns(4)
+
+c1.metric("Pool size", m.get("size", "-"))
+
+c2.metric("Checked out", m.get("checkedout", "-"))
+
+c3.metric("Idle in pool", m.get("checkedin", "-"))
+
+c4.metric("Overflow", m.get("overflow", "-"))
+
+# MARK: Counters
+if "checkouts" in m:
+    c1, c2, c3, c4 = st.columns(4)
+
+    c1.metric("Checkouts", m["checkouts"])
+
+    c2.metric("New connections", m["connects"])
+
+    c3.metric("Overflow checkouts", m["overflow_checkouts"])
+
+    c4.metric("Timeouts", m["timeouts"])
+
+    c1, c2, c3, c4 = st.columns(4)
+
+    c1.metric("Avg checkout wait (ms)", f"{m['wait_avg_ms']:.2f}")
+
+    c2.metric("Max checkout wait (ms)", f"{m['wait_max_s'] * 1000.0:.2f}")
+
+    c3.metric("Overflow peak", m["overflow_peak"])
+
+    c4.metric("Checkins", m["checkins"])
+
+# MARK: Server side
+st.subheader("Server connections (pg_stat_activity)")
+
+try:
+    with engine.begin() as conn:
+        activity = pd.read_sql_query(
+            text(
+                """
+                SELECT
+                  COALESCE("application_name", '') AS application_name
+                  ,COALESCE("state", '') AS state
+                  ,COUNT(*) AS connections
+                FROM pg_stat_activity
+                WHERE "datname" = current_database()
+                GROUP BY 1, 2
+                ORDER BY 3 DESC
+                """
+            ),
+            conn,
+        )
+    st.dataframe(activity, use_container_width=True)
+except Exception as e:
+    st.warning(f"Could not read pg_stat_activity: {e}")
@@ -1,4 +1,7 @@
 from .utilities import (
+    HistoryReader,
+    DeviceSession,
+    get_device_session,
     device_info,
     get_history_length,
     erase_history,
@@ -9,28 +12,74 @@ from .utilities import (
 
 from .data_prep import (
     normalize_df,
+    concat_df,
+    read_gmc_csv,
     load_csv_bytes,
+    upload_hash,
+    scan_csv_upload,
+    load_csv_upload,
     copy_for_read,
     load_csv_path_live,
+    parquet_cache_dir,
+    sync_parquet_cache,
+    load_parquet_manifest,
+    read_parquet_days,
+    start_parquet_sync,
+    dir_manifest,
+    load_csv_dir,
+    rolling_time_mean,
+    enrich_settings,
+    enrich_columns,
     enrich,
+    enrich_batch,
     filter_df,
     kpis,
+    count_histogram,
+    preview_page,
+    format_preview,
+    df_to_csv_bytes,
+    export_enriched,
 )
 
-from .plots import fig_time_series, fig_cpm_distribution
+from .plots import lttb, fig_time_series, fig_cpm_distribution
 
 from .backend import (
     get_db_url,
     get_engine,
+    pool_metrics,
     safe_ident,
     quote_table,
     db_min_max,
     db_distinct_notes,
+    db_row_count,
     db_fetch_slice,
+    db_fetch_tail,
+    db_fetch_live,
+    pick_bucket,
+    db_fetch_buckets,
+    rollup_tables,
+    meta_table,
+    rollup_ddl,
+    db_rollup_backfill,
+    db_fetch_rollup,
+    db_ensure_partitions,
+    db_drop_partitions,
+    db_partition_migrate,
+    db_fetch_resolution,
+    db_ensure_natural_key,
+    db_load_csvs,
+    db_insert_readings,
+    db_read_copy,
+    db_kpis,
+    db_count_histogram,
+    db_iter_batches,
 )
 
 
 __all__ = [
+    "HistoryReader",
+    "DeviceSession",
+    "get_device_session",
     "device_info",
     "get_history_length",
     "erase_history",
@@ -38,21 +87,65 @@ __all__ = [
     "get_history_df",
     "set_device_clock",
     "normalize_df",
+    "concat_df",
+    "read_gmc_csv",
     "load_csv_bytes",
+    "upload_hash",
+    "scan_csv_upload",
+    "load_csv_upload",
     "copy_for_read",
     "load_csv_path_live",
+    "parquet_cache_dir",
+    "sync_parquet_cache",
+    "load_parquet_manifest",
+    "read_parquet_days",
+    "start_parquet_sync",
+    "dir_manifest",
+    "load_csv_dir",
+    "rolling_time_mean",
+    "enrich_settings",
+    "enrich_columns",
     "enrich",
+    "enrich_batch",
     "filter_df",
     "kpis",
+    "count_histogram",
+    "preview_page",
+    "format_preview",
+    "df_to_csv_bytes",
+    "export_enriched",
     # plots
+    "lttb",
     "fig_time_series",
     "fig_cpm_distribution",
     # backend
     "get_db_url",
     "get_engine",
+    "pool_metrics",
     "safe_ident",
     "quote_table",
     "db_min_max",
     "db_distinct_notes",
+    "db_row_count",
     "db_fetch_slice",
+    "db_fetch_tail",
+    "db_fetch_live",
+    "pick_bucket",
+    "db_fetch_buckets",
+    "rollup_tables",
+    "meta_table",
+    "rollup_ddl",
+    "db_rollup_backfill",
+    "db_fetch_rollup",
+    "db_ensure_partitions",
+    "db_drop_partitions",
+    "db_partition_migrate",
+    "db_fetch_resolution",
+    "db_ensure_natural_key",
+    "db_load_csvs",
+    "db_insert_readings",
+    "db_read_copy",
+    "db_kpis",
+    "db_count_histogram",
+    "db_iter_batches",
 ]
@@ -1,20 +1,82 @@
 from .get_db_url import get_db_url
+from .metered_queue_pool import MeteredQueuePool
 from .get_engine import get_engine
+from .pool_metrics import pool_metrics
 from .safe_indent import safe_ident
 from .quote_table import quote_table
+from .rollup_tables import rollup_tables, meta_table, ROLLUPS
+from .meta_ttl import META_TTL
 from .db_min_max import db_min_max
 from .db_distinct_notes import db_distinct_notes
-from .normalize_df import normalize_df
+from .db_row_count import db_row_count
+from .normalize_df import normalize_df, CATEGORY_COLUMNS
+from .concat_df import concat_df
+from .db_read_copy import db_read_copy, FETCH_ENGINE, READING_DTYPES, READING_DATES
 from .db_fetch_slice import db_fetch_slice
+from .db_fetch_tail import db_fetch_tail
+from .db_fetch_live import db_fetch_live
+from .pick_bucket import pick_bucket
+from .db_fetch_buckets import db_fetch_buckets
+from .rollup_ddl import rollup_ddl
+from .db_rollup_backfill import db_rollup_backfill
+from .db_fetch_rollup import db_fetch_rollup
+from .db_is_partitioned import db_is_partitioned
+from .db_ensure_natural_key import db_has_natural_key, db_ensure_natural_key
+from .db_ensure_partitions import db_ensure_partitions, month_starts
+from .db_drop_partitions import db_drop_partitions
+from .db_partition_migrate import db_partition_migrate
+from .db_load_csvs import db_load_csvs, expand_csv_paths
+from .db_insert_readings import db_insert_readings
+from .db_copy_readings import db_copy_readings
+from .db_fetch_resolution import db_fetch_resolution
+from .db_kpis import db_kpis
+from .db_count_histogram import db_count_histogram
+from .db_iter_batches import db_iter_batches, READING_COLUMNS
 
 
 __all__ = [
     "get_db_url",
+    "MeteredQueuePool",
     "get_engine",
+    "pool_metrics",
     "safe_ident",
     "quote_table",
     "db_min_max",
     "db_distinct_notes",
+    "db_row_count",
     "normalize_df",
+    "CATEGORY_COLUMNS",
+    "concat_df",
+    "db_read_copy",
+    "FETCH_ENGINE",
+    "READING_DTYPES",
+    "READING_DATES",
     "db_fetch_slice",
+    "db_fetch_tail",
+    "db_fetch_live",
+    "pick_bucket",
+    "db_fetch_buckets",
+    "rollup_tables",
+    "meta_table",
+    "ROLLUPS",
+    "META_TTL",
+    "rollup_ddl",
+    "db_rollup_backfill",
+    "db_fetch_rollup",
+    "db_is_partitioned",
+    "db_has_natural_key",
+    "db_ensure_natural_key",
+    "db_ensure_partitions",
+    "month_starts",
+    "db_drop_partitions",
+    "db_partition_migrate",
+    "db_load_csvs",
+    "expand_csv_paths",
+    "db_insert_readings",
+    "db_copy_readings",
+    "db_fetch_resolution",
+    "db_kpis",
+    "db_count_histogram",
+    "db_iter_batches",
+    "READING_COLUMNS",
 ]
@@ -0,0 +1,35 @@
+import pandas as pd
+from typing import Sequence
+
+
+def concat_df(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """
+    ``pd.concat`` for normalized frames that keeps categorical columns
+    categorical. Plain ``pd.concat`` falls back to object dtype whenever the
+    categories differ (e.g. a tail with a new note), which would undo the
+    compact dtypes on every append.
+    """
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    cats = [
+        c
+        for c in frames[0].columns
+        if isinstance(frames[0][c].dtype, pd.CategoricalDtype)
+        and all(c in f.columns for f in frames)
+    ]
+    if cats:
+        frames = [f.copy(deep=False) for f in frames]
+        for c in cats:
+            if not all(isinstance(f[c].dtype, pd.CategoricalDtype) for f in frames):
+                continue
+            categories = frames[0][c].cat.categories
+            for f in frames[1:]:
+                categories = categories.union(f[c].cat.categories)
+            for f in frames:
+                f[c] = f[c].cat.set_categories(categories)
+
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,51 @@
+import io
+import pandas as pd
+from sqlalchemy.engine import Engine
+from . import quote_table
+
+COLUMNS = '"datetime", "count", "unit", "mode", "reference_datetime", "notes"'
+
+
+def db_copy_readings(engine: Engine, table: str, df: pd.DataFrame) -> int:
+    """
+    Bulk insert for large frames of readings: ``COPY`` into a temp staging
+    table, then ``INSERT ... ON CONFLICT DO NOTHING`` into ``table`` (same
+    merge as ``db_load_csvs``, from memory instead of a file). Returns the
+    number of rows actually inserted.
+    """
+    if df is None or df.empty:
+        return 0
+
+    full = quote_table(table)
+
+    buf = io.StringIO()
+    df[["datetime", "count", "unit", "mode", "reference_datetime", "notes"]].to_csv(
+        buf, index=False, header=False, date_format="%Y-%m-%d %H:%M:%S"
+    )
+    buf.seek(0)
+
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            f"CREATE TEMP TABLE gmc_stage (LIKE {full} INCLUDING DEFAULTS) "
+            "ON COMMIT DROP"
+        )
+        cur.copy_expert(f"COPY gmc_stage ({COLUMNS}) FROM STDIN WITH (FORMAT csv)", buf)
+        cur.execute(
+            f"""
+            INSERT INTO {full} ({COLUMNS})
+            SELECT {COLUMNS} FROM gmc_stage
+            ORDER BY "datetime"
+            ON CONFLICT DO NOTHING
+            """
+        )
+        inserted = cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return inserted
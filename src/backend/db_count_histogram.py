@@ -0,0 +1,65 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence, Tuple
+from . import quote_table
+
+
+def _fetch(engine: Engine, table: str, params: dict, notes_vals, after=None):
+    base = f"""
+        SELECT ROUND("count")::int AS "cpm", COUNT(*) AS "n", MAX("datetime") AS "last"
+        FROM {quote_table(table)}
+        WHERE "datetime" >= :start
+          AND "datetime" < :end_excl
+    """
+    params = dict(params)
+    if after is not None:
+        base += ' AND "datetime" > :after'
+        params["after"] = after
+    if notes_vals:
+        base += ' AND "notes" = ANY(:notes)'
+        params["notes"] = list(notes_vals)
+
+    with engine.begin() as conn:
+        rows = conn.execute(text(base + " GROUP BY 1"), params).fetchall()
+
+    hist = pd.Series({int(r.cpm): int(r.n) for r in rows}, dtype="int64")
+    last = max((r.last for r in rows), default=None)
+    return hist.sort_index(), last
+
+
+def db_count_histogram(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    state: Optional[dict] = None,
+) -> Tuple[pd.Series, dict]:
+    """
+    Readings per CPM value over the selected range, counted in SQL (one row
+    per distinct CPM comes back instead of every reading). Takes and returns a
+    state like ``db_fetch_live``: later refreshes only count rows newer than
+    the last one seen and add them on. Same range/notes semantics as
+    ``db_fetch_slice``. Returns (hist, state).
+    """
+    key = (
+        table,
+        pd.to_datetime(start_date),
+        pd.to_datetime(end_date),
+        tuple(sorted(notes_vals)) if notes_vals else (),
+    )
+    params = {
+        "start": pd.to_datetime(start_date),
+        "end_excl": pd.to_datetime(end_date) + pd.Timedelta(days=1),
+    }
+
+    if state is None or state["key"] != key or state["last"] is None:
+        hist, last = _fetch(engine, table, params, notes_vals)
+    else:
+        tail, last = _fetch(engine, table, params, notes_vals, after=state["last"])
+        if tail.empty:
+            return state["hist"], state
+        hist = state["hist"].add(tail, fill_value=0).astype("int64")
+
+    return hist, {"key": key, "hist": hist, "last": last}
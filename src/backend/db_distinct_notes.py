@@ -1,14 +1,19 @@
 from typing import Sequence
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
-from . import quote_table
+from . import quote_table, meta_table
 
 
 def db_distinct_notes(engine: Engine, table: str) -> Sequence[str]:
+    """
+    Distinct non-empty ``notes`` of ``table``. Read from the meta table when it
+    exists (falls back to SELECT DISTINCT on the raw table).
+    """
 
     full = quote_table(table)
+    mfull = quote_table(meta_table(table))
 
-    query = text(
+    fallback = text(
         f"""\
         SELECT DISTINCT "notes"
         FROM {full}
@@ -18,6 +23,19 @@ def db_distinct_notes(engine: Engine, table: str) -> Sequence[str]:
     )
 
     with engine.begin() as conn:
+        if conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": mfull}
+        ).scalar():
+            query = text(
+                f"""\
+                SELECT DISTINCT "notes"
+                FROM {mfull}
+                WHERE "notes" <> ''
+                ORDER BY "notes"
+                """
+            )
+        else:
+            query = fallback
         rows = conn.execute(query).fetchall()
 
     return [r[0] for r in rows if r[0] is not None]
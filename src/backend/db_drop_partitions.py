@@ -0,0 +1,55 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from . import quote_table, meta_table
+
+
+def db_drop_partitions(engine: Engine, table: str, before) -> list[str]:
+    """
+    Retention for the partitioned layout: drops every monthly partition of
+    ``table`` that lies entirely before ``before``. Much cheaper than a bulk
+    DELETE. The meta rows for the dropped months are removed with them, while
+    rollups are left as they are, so aggregated history survives. Returns the
+    names of the dropped partitions.
+    """
+    before = pd.to_datetime(before)
+    schema = table.split(".", 1)[0] if "." in table else None
+
+    query = text(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(:parent)
+        ORDER BY c.relname
+        """
+    )
+
+    dropped = []
+
+    mfull = quote_table(meta_table(table))
+
+    with engine.begin() as conn:
+        names = conn.execute(query, {"parent": quote_table(table)}).scalars().all()
+        has_meta = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": mfull}
+        ).scalar()
+        for name in names:
+            suffix = name.rsplit("_p", 1)[-1]
+            if len(suffix) != 6 or not suffix.isdigit():
+                continue
+            lower = pd.Timestamp(f"{suffix[:4]}-{suffix[4:]}-01")
+            upper = lower + pd.DateOffset(months=1)
+            if upper <= before:
+                full = quote_table(f"{schema}.{name}" if schema else name)
+                conn.exec_driver_sql(f"DROP TABLE {full}")
+                # The default partition can't hold rows of a month that has
+                # its own partition, so nothing is left for these days.
+                if has_meta:
+                    conn.execute(
+                        text(f'DELETE FROM {mfull} WHERE "day" >= :lo AND "day" < :hi'),
+                        {"lo": lower, "hi": upper},
+                    )
+                dropped.append(name)
+
+    return dropped
@@ -0,0 +1,67 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from . import quote_table, meta_table, db_rollup_backfill
+
+
+def db_has_natural_key(conn: Connection, table: str) -> bool:
+    """True if ``table`` has a unique index on ("datetime", "notes")."""
+    query = text(
+        """
+        SELECT EXISTS (
+          SELECT 1
+          FROM pg_index i
+          WHERE i.indrelid = to_regclass(:name)
+            AND i.indisunique
+            AND i.indnkeyatts = 2
+            AND i.indkey[0] = (SELECT attnum FROM pg_attribute
+                               WHERE attrelid = i.indrelid AND attname = 'datetime')
+            AND i.indkey[1] = (SELECT attnum FROM pg_attribute
+                               WHERE attrelid = i.indrelid AND attname = 'notes')
+        )
+        """
+    )
+    return bool(conn.execute(query, {"name": quote_table(table)}).scalar())
+
+
+def db_ensure_natural_key(engine: Engine, table: str) -> int:
+    """
+    Makes (datetime, notes) the natural key of ``table`` so loads can use
+    ``INSERT ... ON CONFLICT DO NOTHING``: deletes existing duplicate rows (the
+    overlapping daily dumps loaded more than once) and adds the unique index
+    ``uq_<table>_datetime_notes`` (NULL notes compare equal). Rebuilds the
+    rollups if any duplicates were removed. Returns the number of rows deleted.
+    """
+    full = quote_table(table)
+    tbl = table.split(".")[-1]
+
+    with engine.begin() as conn:
+        if db_has_natural_key(conn, table):
+            return 0
+
+        deleted = conn.exec_driver_sql(
+            f"""
+            DELETE FROM {full} a
+            USING {full} b
+            WHERE a."datetime" = b."datetime"
+              AND a."notes" IS NOT DISTINCT FROM b."notes"
+              AND a.tableoid = b.tableoid
+              AND a.ctid > b.ctid
+            """
+        ).rowcount
+
+        conn.exec_driver_sql(
+            f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS "uq_{tbl}_datetime_notes"
+            ON {full} ("datetime", "notes") NULLS NOT DISTINCT
+            """
+        )
+
+        has_rollups = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"),
+            {"name": quote_table(meta_table(table))},
+        ).scalar()
+
+    if deleted and has_rollups:
+        db_rollup_backfill(engine, table)
+
+    return deleted
@@ -0,0 +1,95 @@
+import pandas as pd
+from typing import Optional
+from sqlalchemy.engine import Connection
+from . import quote_table
+
+
+def month_starts(start, end) -> list[pd.Timestamp]:
+    """First-of-month timestamps covering ``start`` through ``end`` (inclusive)."""
+    first = pd.to_datetime(start).to_period("M").to_timestamp()
+    last = pd.to_datetime(end).to_period("M").to_timestamp()
+    return list(pd.date_range(first, last, freq="MS"))
+
+
+def db_ensure_partitions(
+    conn: Connection,
+    table: str,
+    start=None,
+    months_ahead: int = 3,
+    parent: Optional[str] = None,
+    end=None,
+) -> int:
+    """
+    Creates any missing monthly partitions ``<table>_pYYYYMM`` from the month of
+    ``start`` (default: this month) through ``end`` or ``months_ahead`` months
+    from now, whichever is later, plus the ``<table>_default`` partition that
+    catches rows outside them (old dumps, a device clock set to the past). Rows
+    already sitting in the default partition for a month that gets its own
+    partition are moved into it. ``parent`` overrides the partitioned table
+    they attach to (used while migrating, when the new parent still has a
+    temporary name). The BRIN/notes indexes on the parent cascade to every new
+    partition. Returns the number of monthly partitions created.
+    """
+    parent_full = quote_table(parent or table)
+    default = quote_table(f"{table}_default")
+    now = pd.Timestamp.now()
+    start = pd.to_datetime(start) if start is not None else now
+    end = max(now + pd.DateOffset(months=months_ahead), pd.to_datetime(end or now))
+
+    if not conn.exec_driver_sql(
+        f"SELECT to_regclass('{default}') IS NOT NULL"
+    ).scalar():
+        conn.exec_driver_sql(
+            f"CREATE TABLE {default} PARTITION OF {parent_full} DEFAULT"
+        )
+
+    created = 0
+
+    for lo in month_starts(min(start, now), end):
+        hi = lo + pd.DateOffset(months=1)
+        name = quote_table(f"{table}_p{lo:%Y%m}")
+        exists = conn.exec_driver_sql(
+            f"SELECT to_regclass('{name}') IS NOT NULL"
+        ).scalar()
+        if exists:
+            continue
+        # Attaching checks the default partition holds nothing in the new
+        # range, so move those rows over first.
+        conn.exec_driver_sql(
+            f"""
+            CREATE TABLE {name}
+            (LIKE {parent_full} INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+
+            WITH moved AS (
+              DELETE FROM {default}
+              WHERE "datetime" >= '{lo:%Y-%m-%d}' AND "datetime" < '{hi:%Y-%m-%d}'
+              RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved;
+
+            ALTER TABLE {parent_full} ATTACH PARTITION {name}
+            FOR VALUES FROM ('{lo:%Y-%m-%d}') TO ('{hi:%Y-%m-%d}');
+            """
+        )
+        created += 1
+
+    return created
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from . import get_engine
+
+    parser = argparse.ArgumentParser(
+        description="Create the upcoming monthly partitions of a partitioned table."
+    )
+    parser.add_argument(
+        "--table", default=os.getenv("GMC_TABLE", "public.gmc_readings")
+    )
+    parser.add_argument("--months-ahead", type=int, default=3)
+    args = parser.parse_args()
+
+    with get_engine().begin() as conn:
+        n = db_ensure_partitions(conn, args.table, months_ahead=args.months_ahead)
+    print(f"Created {n} partition(s) for {args.table}.")
@@ -0,0 +1,51 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence
+from . import quote_table, normalize_df
+
+
+def db_fetch_buckets(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    bucket: pd.Timedelta,
+) -> pd.DataFrame:
+    """
+    Fetch the slice aggregated in SQL into fixed ``bucket`` wide bins with
+    ``date_bin``. Returns one row per bucket: ``datetime`` (bucket start),
+    ``count`` (avg CPM), ``count_min``, ``count_max`` and ``n`` (readings in the
+    bucket). Same end-date and notes semantics as ``db_fetch_slice``.
+    """
+    full = quote_table(table)
+
+    base = f"""
+        SELECT
+          date_bin(:bucket, "datetime", TIMESTAMP '2000-01-01') AS "datetime"
+          ,AVG("count")::float8 AS "count"
+          ,MIN("count") AS "count_min"
+          ,MAX("count") AS "count_max"
+          ,COUNT(*) AS "n"
+        FROM {full}
+        WHERE "datetime" >= :start
+          AND "datetime" < :end_excl
+    """
+
+    params = {
+        "bucket": pd.Timedelta(bucket).to_pytimedelta(),
+        "start": pd.to_datetime(start_date),
+        "end_excl": pd.to_datetime(end_date) + pd.Timedelta(days=1),
+    }
+
+    if notes_vals:
+        base += ' AND "notes" = ANY(:notes)'
+        params["notes"] = list(notes_vals)
+
+    query = text(base + " GROUP BY 1 ORDER BY 1 ASC")
+
+    with engine.begin() as conn:
+        df = pd.read_sql_query(query, conn, params=params)
+
+    return normalize_df(df)
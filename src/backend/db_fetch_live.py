@@ -0,0 +1,41 @@
+import pandas as pd
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence, Tuple
+from . import db_fetch_slice, db_fetch_tail, concat_df
+
+
+def db_fetch_live(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    state: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Live-mode fetch. Takes the state returned by the previous call and only
+    pulls rows with a ``datetime`` greater than the last one we've seen on each
+    refresh. Falls back to a full ``db_fetch_slice`` whenever the table, date
+    range or notes filter changes. Returns (df, state); keep the state (e.g. in
+    the Streamlit session) and pass it back in next time.
+    """
+    key = (
+        table,
+        pd.to_datetime(start_date),
+        pd.to_datetime(end_date),
+        tuple(sorted(notes_vals)) if notes_vals else (),
+    )
+
+    if state is None or state["key"] != key or state["df"].empty:
+        df = db_fetch_slice(engine, table, start_date, end_date, notes_vals)
+        return df, {"key": key, "df": df}
+
+    df = state["df"]
+
+    tail = db_fetch_tail(engine, table, df["datetime"].iloc[-1], end_date, notes_vals)
+
+    if tail.empty:
+        return df, state
+
+    df = concat_df([df, tail])
+    return df, {"key": key, "df": df}
@@ -0,0 +1,37 @@
+import pandas as pd
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence, Tuple
+from . import pick_bucket, db_fetch_buckets, db_fetch_live, db_fetch_rollup
+
+
+def db_fetch_resolution(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    max_points: int = 4000,
+    state: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, Optional[pd.Timedelta], Optional[dict]]:
+    """
+    Resolution-aware fetch. Returns raw rows (via the live tail fetch) when the
+    selected range fits in ``max_points``, otherwise SQL side time buckets sized
+    from the range, read from the rollup tables when they exist and from the raw
+    table otherwise. Returns (df, bucket, state) where bucket is None for raw
+    rows; ``state`` is the ``db_fetch_live`` tail state, passed through and
+    left unchanged while the range is bucketed.
+    """
+    bucket = pick_bucket(start_date, end_date, max_points)
+
+    if bucket is None:
+        df, state = db_fetch_live(
+            engine, table, start_date, end_date, notes_vals, state=state
+        )
+        return df, None, state
+
+    df = db_fetch_rollup(engine, table, start_date, end_date, notes_vals, bucket)
+
+    if df is None:
+        df = db_fetch_buckets(engine, table, start_date, end_date, notes_vals, bucket)
+
+    return df, bucket, state
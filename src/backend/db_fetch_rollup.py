@@ -0,0 +1,68 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence
+from . import quote_table, normalize_df, rollup_tables, ROLLUPS
+
+
+def db_fetch_rollup(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    bucket: pd.Timedelta,
+) -> Optional[pd.DataFrame]:
+    """
+    Router: answers a bucketed range query from the coarsest rollup table whose
+    granularity still divides ``bucket`` (day, hour or minute), re-binning its
+    rows into ``bucket`` wide bins. Same output as ``db_fetch_buckets``.
+    Returns None if the rollups haven't been created for ``table``.
+    """
+    bucket = pd.Timedelta(bucket)
+
+    suffix = None
+    for s, _, width in reversed(ROLLUPS):
+        if bucket >= width and bucket % width == pd.Timedelta(0):
+            suffix = s
+            break
+
+    if suffix is None:
+        return None
+
+    name = rollup_tables(table)[suffix]
+    rfull = quote_table(name)
+
+    base = f"""
+        SELECT
+          date_bin(:bucket, "bucket", TIMESTAMP '2000-01-01') AS "datetime"
+          ,(SUM("sum")::float8 / SUM("n")) AS "count"
+          ,MIN("min") AS "count_min"
+          ,MAX("max") AS "count_max"
+          ,SUM("n")::bigint AS "n"
+        FROM {rfull}
+        WHERE "bucket" >= :start
+          AND "bucket" < :end_excl
+    """
+
+    params = {
+        "bucket": bucket.to_pytimedelta(),
+        "start": pd.to_datetime(start_date),
+        "end_excl": pd.to_datetime(end_date) + pd.Timedelta(days=1),
+    }
+
+    if notes_vals:
+        base += ' AND "notes" = ANY(:notes)'
+        params["notes"] = list(notes_vals)
+
+    query = text(base + " GROUP BY 1 ORDER BY 1 ASC")
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": rfull}
+        ).scalar()
+        if not exists:
+            return None
+        df = pd.read_sql_query(query, conn, params=params)
+
+    return normalize_df(df)
@@ -2,7 +2,14 @@ import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from typing import Optional, Sequence
-from . import quote_table, normalize_df
+from . import (
+    quote_table,
+    normalize_df,
+    db_read_copy,
+    FETCH_ENGINE,
+    READING_DTYPES,
+    READING_DATES,
+)
 
 
 def db_fetch_slice(
@@ -14,7 +21,8 @@ def db_fetch_slice(
 ) -> pd.DataFrame:
     """
     Fetch filtered rows from DB. We apply end-date as exclusive (end + 1 day).
-    Uses array ANY() for notes if provided.
+    Uses array ANY() for notes if provided. With ``GMC_FETCH_ENGINE=copy`` (the
+    default) rows are streamed with COPY TO STDOUT into typed columns.
     """
     full = quote_table(table)
 
@@ -42,6 +50,10 @@ def db_fetch_slice(
 
     query = text(base + ' ORDER BY "datetime" ASC')
 
+    if FETCH_ENGINE == "copy":
+        # Already typed and ordered by the query, no normalize pass needed.
+        return db_read_copy(engine, query, params, READING_DTYPES, READING_DATES)
+
     with engine.begin() as conn:
         df = pd.read_sql_query(query, conn, params=params)
 
@@ -0,0 +1,60 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence
+from . import (
+    quote_table,
+    normalize_df,
+    db_read_copy,
+    FETCH_ENGINE,
+    READING_DTYPES,
+    READING_DATES,
+)
+
+
+def db_fetch_tail(
+    engine: Engine,
+    table: str,
+    after,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+) -> pd.DataFrame:
+    """
+    Fetch only the rows newer than ``after`` (exclusive) up to the end-date
+    (exclusive, end + 1 day), so live refreshes only pull what was appended
+    since the last tick. Same notes filtering as ``db_fetch_slice``.
+    """
+    full = quote_table(table)
+
+    base = f"""
+        SELECT 
+          "datetime"
+          ,"count"
+          ,"unit"
+          ,"mode"
+          ,"reference_datetime"
+          ,"notes"
+        FROM {full}
+        WHERE "datetime" > :after
+          AND "datetime" < :end_excl
+    """
+
+    params = {
+        "after": pd.to_datetime(after),
+        "end_excl": pd.to_datetime(end_date) + pd.Timedelta(days=1),
+    }
+
+    if notes_vals:
+        base += ' AND "notes" = ANY(:notes)'
+        params["notes"] = list(notes_vals)
+
+    query = text(base + ' ORDER BY "datetime" ASC')
+
+    if FETCH_ENGINE == "copy":
+        # Already typed and ordered by the query, no normalize pass needed.
+        return db_read_copy(engine, query, params, READING_DTYPES, READING_DATES)
+
+    with engine.begin() as conn:
+        df = pd.read_sql_query(query, conn, params=params)
+
+    return normalize_df(df)
@@ -0,0 +1,45 @@
+import pandas as pd
+from psycopg2.extras import execute_values
+from sqlalchemy.engine import Engine
+from . import quote_table
+
+COLUMNS = ["datetime", "count", "unit", "mode", "reference_datetime", "notes"]
+
+
+def db_insert_readings(
+    engine: Engine, table: str, df: pd.DataFrame, page_size: int = 1000
+) -> int:
+    """
+    Batched insert of readings (GMC-SE columns) into ``table`` with
+    ``INSERT ... ON CONFLICT DO NOTHING``, so replaying rows that are already
+    there is harmless. Returns the number of rows actually inserted.
+    """
+    if df is None or df.empty:
+        return 0
+
+    full = quote_table(table)
+    cols = ", ".join(f'"{c}"' for c in COLUMNS)
+
+    out = df.reindex(columns=COLUMNS).astype(object)
+    rows = list(out.where(out.notna(), None).itertuples(index=False, name=None))
+
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        inserted = 0
+        for i in range(0, len(rows), page_size):
+            execute_values(
+                cur,
+                f"INSERT INTO {full} ({cols}) VALUES %s ON CONFLICT DO NOTHING",
+                rows[i : i + page_size],
+                page_size=page_size,
+            )
+            inserted += cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return inserted
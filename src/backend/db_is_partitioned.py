@@ -0,0 +1,12 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from . import quote_table
+
+
+def db_is_partitioned(conn: Connection, table: str) -> bool:
+    """True if ``table`` exists and is a declaratively partitioned table."""
+    kind = conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": quote_table(table)},
+    ).scalar()
+    return kind == "p"
@@ -0,0 +1,64 @@
+import itertools
+import pandas as pd
+from sqlalchemy.engine import Engine
+from typing import Iterator, Optional, Sequence
+from . import quote_table, normalize_df
+
+READING_COLUMNS = ["datetime", "count", "unit", "mode", "reference_datetime", "notes"]
+
+_CURSOR_IDS = itertools.count()
+
+
+def db_iter_batches(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    batch_rows: int = 50_000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the filtered rows of ``table`` in time order, ``batch_rows`` at a
+    time, from a named (server-side) cursor. Postgres keeps the result set, so
+    only one batch is ever held here however long the range is. End-date is
+    exclusive (end + 1 day), same as ``db_fetch_slice``.
+    """
+    full = quote_table(table)
+    cols = ", ".join(f'"{c}"' for c in READING_COLUMNS)
+
+    sql = f"""
+        SELECT {cols}
+        FROM {full}
+        WHERE "datetime" >= %(start)s
+          AND "datetime" < %(end_excl)s
+    """
+
+    params = {
+        "start": pd.to_datetime(start_date).to_pydatetime(),
+        "end_excl": (pd.to_datetime(end_date) + pd.Timedelta(days=1)).to_pydatetime(),
+    }
+
+    if notes_vals:
+        sql += ' AND "notes" = ANY(%(notes)s)'
+        params["notes"] = list(notes_vals)
+
+    sql += ' ORDER BY "datetime" ASC'
+
+    conn = engine.raw_connection()
+    try:
+        # Named cursors live inside a transaction; the pooled connection is
+        # not in autocommit so the first execute opens one.
+        cur = conn.cursor(name=f"gmc_export_{next(_CURSOR_IDS)}")
+        cur.itersize = batch_rows
+        cur.execute(sql, params)
+
+        while True:
+            rows = cur.fetchmany(batch_rows)
+            if not rows:
+                break
+            yield normalize_df(pd.DataFrame.from_records(rows, columns=READING_COLUMNS))
+
+        cur.close()
+        conn.commit()
+    finally:
+        conn.close()
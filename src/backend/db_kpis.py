@@ -0,0 +1,95 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from typing import Optional, Sequence
+from . import quote_table, rollup_tables
+
+
+def db_kpis(
+    engine: Engine,
+    table: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]],
+    conv_factor: float,
+    roll_window: int,
+) -> tuple[str, str, str, str]:
+    """
+    The metric cards computed in SQL, without fetching the slice: current CPM,
+    current µSv/hr (CPM * conv_factor), the average CPM over the last
+    ``roll_window`` minutes and the max CPM over the range. Returns strings
+    formatted like ``kpis()``. The range max comes from the daily rollup when
+    it exists (the range is always whole days), else from the raw rows.
+    """
+    full = quote_table(table)
+    day_full = quote_table(rollup_tables(table)["1d"])
+
+    raw_where = """
+        "datetime" >= :start
+        AND "datetime" < :end_excl
+    """
+
+    params = {
+        "start": pd.to_datetime(start_date),
+        "end_excl": pd.to_datetime(end_date) + pd.Timedelta(days=1),
+        "window": pd.Timedelta(minutes=max(int(roll_window or 15), 1)).to_pytimedelta(),
+    }
+
+    if notes_vals:
+        raw_where += ' AND "notes" = ANY(:notes)'
+        params["notes"] = list(notes_vals)
+
+    with engine.begin() as conn:
+        has_rollup = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": day_full}
+        ).scalar()
+
+        if has_rollup:
+            max_expr = f"""(
+              SELECT MAX("max") FROM {day_full}
+              WHERE {raw_where.replace('"datetime"', '"bucket"')}
+            )"""
+        else:
+            max_expr = f"""(SELECT MAX("count") FROM {full} WHERE {raw_where})"""
+
+        query = text(
+            f"""
+            WITH last AS (
+              SELECT "datetime", "count"
+              FROM {full}
+              WHERE {raw_where}
+              ORDER BY "datetime" DESC
+              LIMIT 1
+            )
+            SELECT
+              last."count" AS cur_cpm
+              ,(
+                SELECT AVG("count")::float8
+                FROM {full}
+                WHERE {raw_where}
+                  AND "datetime" > last."datetime" - :window
+                  AND "datetime" <= last."datetime"
+              ) AS avg_roll
+              ,{max_expr} AS max_cpm
+            FROM last
+            """
+        )
+
+        row = conn.execute(query, params).mappings().first()
+
+    if not row:
+        return "-", "-", "-", "-"
+
+    cur_cpm = f"{row['cur_cpm']:.0f}" if row["cur_cpm"] is not None else "-"
+
+    cur_usv = (
+        f"{row['cur_cpm'] * conv_factor:.3f}"
+        if row["cur_cpm"] is not None and conv_factor
+        else "-"
+    )
+
+    avg_roll = f"{row['avg_roll']:.1f}" if row["avg_roll"] is not None else "-"
+
+    max_cpm = f"{row['max_cpm']:.0f}" if row["max_cpm"] is not None else "-"
+
+    return cur_cpm, cur_usv, avg_roll, max_cpm
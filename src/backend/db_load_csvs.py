@@ -0,0 +1,163 @@
+import glob
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterable
+from psycopg2 import errors
+from sqlalchemy.engine import Engine
+from . import (
+    quote_table,
+    db_ensure_natural_key,
+    db_is_partitioned,
+    db_ensure_partitions,
+)
+
+COLUMNS = '"datetime", "count", "unit", "mode", "reference_datetime", "notes"'
+
+
+def expand_csv_paths(paths: Iterable[str]) -> list[str]:
+    """Expands directories (``*.csv`` inside) and glob patterns into a sorted file list."""
+    out = set()
+    for p in paths:
+        if os.path.isdir(p):
+            out.update(glob.glob(os.path.join(p, "*.csv")))
+        else:
+            out.update(glob.glob(p) or [p])
+    return sorted(out)
+
+
+def _load_one(
+    engine: Engine,
+    table: str,
+    path: str,
+    merge_lock: threading.Lock,
+    partitioned: bool = False,
+    retries: int = 3,
+) -> dict[str, Any]:
+    full = quote_table(table)
+
+    for attempt in range(retries):
+        conn = engine.connect()
+        trans = conn.begin()
+        try:
+            cur = conn.connection.cursor()
+            cur.execute(
+                f"CREATE TEMP TABLE gmc_stage (LIKE {full} INCLUDING DEFAULTS) "
+                "ON COMMIT DROP"
+            )
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                cur.copy_expert(
+                    f"COPY gmc_stage ({COLUMNS}) FROM STDIN WITH (FORMAT csv, HEADER true)",
+                    f,
+                )
+            staged = cur.rowcount
+
+            # Merges go one at a time: they all fold into the same rollup and
+            # meta rows through the insert trigger, so running them side by
+            # side would only queue them on row locks (or deadlock).
+            with merge_lock:
+                if partitioned:
+                    lo, hi = conn.exec_driver_sql(
+                        'SELECT MIN("datetime"), MAX("datetime") FROM gmc_stage'
+                    ).one()
+                    if lo is not None:
+                        db_ensure_partitions(conn, table, start=lo, end=hi)
+                cur.execute(
+                    f"""
+                    INSERT INTO {full} ({COLUMNS})
+                    SELECT {COLUMNS} FROM gmc_stage
+                    ORDER BY "datetime"
+                    ON CONFLICT DO NOTHING
+                    """
+                )
+                inserted = cur.rowcount
+                trans.commit()
+            return {"file": path, "staged": staged, "inserted": inserted}
+        except (errors.DeadlockDetected, errors.SerializationFailure):
+            # Can still collide with other writers (e.g. the ingester); the
+            # load is idempotent so just go again.
+            trans.rollback()
+            if attempt == retries - 1:
+                raise
+            time.sleep(0.1 * (attempt + 1))
+        finally:
+            conn.close()
+
+
+def db_load_csvs(
+    engine: Engine, table: str, paths: Iterable[str], workers: int = 4
+) -> dict[str, Any]:
+    """
+    Idempotent bulk loader for GMC-SE CSV dumps. Each file is streamed with
+    ``COPY`` into a temp staging table and merged into ``table`` with
+    ``INSERT ... ON CONFLICT DO NOTHING`` on the (datetime, notes) natural key.
+    ``workers`` files are read and staged at a time, but merged one after the
+    other. On a partitioned ``table`` the partitions for each file's range are
+    created before its merge. Overlapping dumps and re-runs only add rows that
+    aren't there yet, so it is safe against a live database. Files that fail
+    to load are reported and skipped.
+
+    Returns totals: files, staged (rows read), inserted, failed, seconds,
+    rows_per_sec.
+    """
+    files = expand_csv_paths(paths)
+
+    db_ensure_natural_key(engine, table)
+
+    with engine.connect() as conn:
+        partitioned = db_is_partitioned(conn, table)
+    merge_lock = threading.Lock()
+
+    start = time.perf_counter()
+    staged = inserted = 0
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_load_one, engine, table, f, merge_lock, partitioned): f
+            for f in files
+        }
+        for fut in as_completed(futures):
+            try:
+                r = fut.result()
+            except Exception as e:
+                failed.append(futures[fut])
+                print(f"Failed: {futures[fut]} ({e})")
+                continue
+            staged += r["staged"]
+            inserted += r["inserted"]
+            print(f"Loaded: {r['file']} ({r['inserted']}/{r['staged']} new)")
+
+    secs = time.perf_counter() - start
+
+    return {
+        "files": len(files),
+        "staged": staged,
+        "inserted": inserted,
+        "failed": failed,
+        "seconds": secs,
+        "rows_per_sec": staged / secs if secs > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    from . import get_engine
+
+    parser = argparse.ArgumentParser(
+        description="Load GMC-SE CSV dumps into Postgres, skipping rows already there."
+    )
+    parser.add_argument("paths", nargs="+", help="CSV files, globs or directories.")
+    parser.add_argument(
+        "--table", default=os.getenv("GMC_TABLE", "public.gmc_readings")
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    s = db_load_csvs(get_engine(), args.table, args.paths, args.workers)
+    print(
+        f"{s['files']} file(s), {s['staged']} rows read, {s['inserted']} new, "
+        f"{len(s['failed'])} failed in {s['seconds']:.2f}s "
+        f"({s['rows_per_sec']:,.0f} rows/sec)."
+    )
@@ -2,15 +2,29 @@ import pandas as pd
 from typing import Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
-from . import quote_table
+from . import quote_table, meta_table
 
 
 def db_min_max(
     engine: Engine, table: str
 ) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """
+    Min/max ``datetime`` of ``table``. Read from the meta table when it exists
+    (falls back to MIN/MAX on the raw table).
+    """
     full = quote_table(table)
-    q = text(f'SELECT MIN("datetime") AS min_dt, MAX("datetime") AS max_dt FROM {full}')
+    mfull = quote_table(meta_table(table))
     with engine.begin() as conn:
+        if conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": mfull}
+        ).scalar():
+            q = text(
+                f'SELECT MIN("min_dt") AS min_dt, MAX("max_dt") AS max_dt FROM {mfull}'
+            )
+        else:
+            q = text(
+                f'SELECT MIN("datetime") AS min_dt, MAX("datetime") AS max_dt FROM {full}'
+            )
         row = conn.execute(q).mappings().first()
     if not row:
         return None, None
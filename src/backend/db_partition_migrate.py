@@ -0,0 +1,163 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from . import (
+    quote_table,
+    meta_table,
+    rollup_ddl,
+    db_is_partitioned,
+    db_has_natural_key,
+    db_ensure_partitions,
+    month_starts,
+)
+
+
+def db_partition_migrate(
+    engine: Engine, table: str, months_ahead: int = 3, drop_old: bool = False
+) -> dict[str, int]:
+    """
+    Moves ``table`` into the partitioned layout (monthly range partitions on
+    ``datetime`` with a BRIN index) while the dashboard and ingest keep running.
+
+    1. Build ``<table>_part`` partitioned by month, partitions named
+       ``<table>_pYYYYMM``, with a ``<table>_default`` partition for rows
+       outside them.
+    2. Copy the existing rows one month per transaction, up to the high-water
+       mark taken at the start.
+    3. In one transaction that blocks writers (readers keep going), copy every
+       row of ``<table>`` that isn't in ``<table>_part`` yet (so late rows
+       behind the high-water mark aren't lost), rename ``<table>`` to
+       ``<table>_old`` and ``<table>_part`` to ``<table>``, and move the rollup
+       trigger over.
+
+    The catch-up in step 3 compares the whole table: by the natural key when
+    there is one, else row by row (EXCEPT ALL, so duplicate readings keep
+    their count). ``<table>_old`` is dropped only with ``drop_old``. Returns
+    the number of rows copied per month (``"YYYY-MM"``).
+    """
+    schema, tbl = table.split(".", 1) if "." in table else (None, table)
+    full = quote_table(table)
+    part = f"{table}_part"
+    part_full = quote_table(part)
+    old_name = f"{tbl}_old"
+
+    with engine.begin() as conn:
+        if db_is_partitioned(conn, table):
+            return {}
+
+        conn.exec_driver_sql(
+            f"""
+            CREATE TABLE {part_full} (LIKE {full} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+            PARTITION BY RANGE ("datetime")
+            """
+        )
+        conn.exec_driver_sql(
+            f'CREATE INDEX "{tbl}_datetime_brin" ON {part_full} USING brin ("datetime")'
+        )
+        conn.exec_driver_sql(f'CREATE INDEX "{tbl}_notes_idx" ON {part_full} ("notes")')
+
+        natural_key = db_has_natural_key(conn, table)
+
+        if natural_key:
+            conn.exec_driver_sql(
+                f'CREATE UNIQUE INDEX "{tbl}_datetime_notes_key" ON {part_full} '
+                '("datetime", "notes") NULLS NOT DISTINCT'
+            )
+
+        lo_dt, hw = conn.exec_driver_sql(
+            f'SELECT MIN("datetime"), MAX("datetime") FROM {full}'
+        ).one()
+
+        db_ensure_partitions(conn, table, lo_dt, months_ahead, parent=part)
+
+    copied: dict[str, int] = {}
+
+    if hw is not None:
+        for lo in month_starts(lo_dt, hw):
+            with engine.begin() as conn:
+                res = conn.execute(
+                    text(
+                        f"""
+                        INSERT INTO {part_full}
+                        SELECT * FROM {full}
+                        WHERE "datetime" >= :lo
+                          AND "datetime" < :hi
+                          AND "datetime" <= :hw
+                        """
+                    ),
+                    {"lo": lo, "hi": lo + pd.DateOffset(months=1), "hw": hw},
+                )
+                copied[f"{lo:%Y-%m}"] = res.rowcount
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"LOCK TABLE {full} IN EXCLUSIVE MODE")
+
+        db_ensure_partitions(conn, table, hw, months_ahead, parent=part)
+
+        if natural_key:
+            missing = f"SELECT * FROM {full} ON CONFLICT DO NOTHING"
+        else:
+            missing = (
+                f"SELECT * FROM (SELECT * FROM {full} "
+                f"EXCEPT ALL SELECT * FROM {part_full}) AS missing"
+            )
+
+        res = conn.exec_driver_sql(
+            f"""
+            WITH ins AS (
+              INSERT INTO {part_full}
+              {missing}
+              RETURNING "datetime"
+            )
+            SELECT to_char("datetime", 'YYYY-MM'), COUNT(*) FROM ins GROUP BY 1
+            """
+        )
+        for month, n in res:
+            copied[month] = copied.get(month, 0) + n
+
+        has_rollups = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"),
+            {"name": quote_table(meta_table(table))},
+        ).scalar()
+
+        conn.exec_driver_sql(f'ALTER TABLE {full} RENAME TO "{old_name}"')
+        conn.exec_driver_sql(f'ALTER TABLE {part_full} RENAME TO "{tbl}"')
+
+        if has_rollups:
+            old_full = quote_table(f"{schema}.{old_name}" if schema else old_name)
+            conn.exec_driver_sql(f'DROP TRIGGER IF EXISTS "{tbl}_rollup" ON {old_full}')
+            conn.exec_driver_sql(rollup_ddl(table))
+
+        if drop_old:
+            old_full = quote_table(f"{schema}.{old_name}" if schema else old_name)
+            conn.exec_driver_sql(f"DROP TABLE {old_full}")
+
+    return copied
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from . import get_engine
+
+    parser = argparse.ArgumentParser(
+        description="Move a gmc_readings table into the monthly partitioned layout."
+    )
+    parser.add_argument(
+        "--table", default=os.getenv("GMC_TABLE", "public.gmc_readings")
+    )
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument(
+        "--drop-old", action="store_true", help="Drop <table>_old when done."
+    )
+    args = parser.parse_args()
+
+    copied = db_partition_migrate(
+        get_engine(), args.table, args.months_ahead, args.drop_old
+    )
+    for month, n in sorted(copied.items()):
+        print(f"Copied {month}: {n} rows")
+    print(
+        f"Migrated {args.table} to the partitioned layout "
+        f"({sum(copied.values())} rows copied)."
+    )
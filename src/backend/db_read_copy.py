@@ -0,0 +1,97 @@
+import os
+import threading
+import importlib.util
+import pandas as pd
+from typing import Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+# Use pyarrow's multithreaded CSV reader when it's installed.
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+# "copy" streams slices with COPY ... TO STDOUT, "sql" uses pd.read_sql_query.
+FETCH_ENGINE = os.getenv("GMC_FETCH_ENGINE", "copy")
+
+# Column types of a gmc_readings row as they come out of COPY.
+READING_DTYPES = {
+    "count": "int32",
+    "unit": "category",
+    "mode": "category",
+    "notes": "category",
+}
+READING_DATES = ["datetime", "reference_datetime"]
+
+
+def db_read_copy(
+    engine: Engine,
+    query: TextClause,
+    params: dict,
+    dtype: Optional[dict] = None,
+    parse_dates: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    Runs ``query`` as ``COPY (...) TO STDOUT`` and parses the CSV stream
+    straight into typed columns, instead of building a Python tuple per row
+    like ``pd.read_sql_query``. ``dtype`` maps columns to pandas dtypes and
+    ``parse_dates`` lists the timestamp columns (parsed as ISO8601).
+
+    The COPY output is written into a pipe from a helper thread while the CSV
+    reader consumes it, so the raw CSV is never held in memory as a whole.
+    """
+    compiled = query.compile(dialect=engine.dialect)
+    bound = compiled.construct_params(params)
+
+    dtype = dict(dtype or {})
+    parse_dates = list(parse_dates or [])
+
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        sql = cur.mogrify(str(compiled), bound).decode("utf-8")
+
+        r, w = os.pipe()
+        errors = []
+
+        def produce():
+            try:
+                with os.fdopen(w, "wb") as out:
+                    cur.copy_expert(
+                        f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER true)", out
+                    )
+                conn.commit()
+            except BrokenPipeError:
+                pass  # the reader gave up, its error is the one to raise
+            except Exception as e:
+                errors.append(e)
+
+        producer = threading.Thread(target=produce, name="db-read-copy", daemon=True)
+        producer.start()
+
+        try:
+            with os.fdopen(r, "rb") as src:
+                df = pd.read_csv(
+                    src,
+                    engine=CSV_ENGINE,
+                    dtype={c: t for c, t in dtype.items() if c not in parse_dates},
+                )
+        except Exception:
+            producer.join()
+            if errors:
+                raise errors[0]
+            raise
+
+        producer.join()
+        if errors:
+            raise errors[0]
+    finally:
+        conn.close()
+
+    for c in parse_dates:
+        if c not in df.columns:
+            continue
+        if not pd.api.types.is_datetime64_any_dtype(df[c]):
+            df[c] = pd.to_datetime(df[c], format="ISO8601")
+        if df[c].dtype != "datetime64[ns]":
+            df[c] = df[c].astype("datetime64[ns]")
+
+    return df
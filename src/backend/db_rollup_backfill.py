@@ -0,0 +1,100 @@
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from . import quote_table, rollup_tables, meta_table, rollup_ddl, ROLLUPS
+
+
+def db_rollup_backfill(
+    engine: Engine, table: str, start_date=None, end_date=None
+) -> int:
+    """
+    Creates the rollup/meta tables and trigger for ``table`` if missing and
+    rebuilds the rollups from the raw rows, either for everything or for the
+    days from ``start_date`` to ``end_date`` (inclusive), the meta table along
+    with them. Runs in one transaction holding a SHARE lock on the raw table so
+    ingest pauses (not fails) while it runs and nothing gets counted twice.
+    Returns the number of raw rows rolled up.
+    """
+    full = quote_table(table)
+    names = rollup_tables(table)
+
+    where = []
+    params = {}
+
+    if start_date is not None:
+        where.append('"datetime" >= :start')
+        params["start"] = pd.to_datetime(start_date)
+
+    if end_date is not None:
+        where.append('"datetime" < :end_excl')
+        params["end_excl"] = pd.to_datetime(end_date) + pd.Timedelta(days=1)
+
+    raw_where = f"WHERE {' AND '.join(where)}" if where else ""
+    bucket_where = raw_where.replace('"datetime"', '"bucket"')
+    day_where = raw_where.replace('"datetime"', '"day"')
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(rollup_ddl(table))
+        conn.exec_driver_sql(f"LOCK TABLE {full} IN SHARE MODE")
+
+        for suffix, field, _ in ROLLUPS:
+            rfull = quote_table(names[suffix])
+            conn.execute(text(f"DELETE FROM {rfull} {bucket_where}"), params)
+            conn.execute(
+                text(
+                    f"""
+                    INSERT INTO {rfull} ("bucket", "notes", "n", "sum", "min", "max")
+                    SELECT date_trunc('{field}', "datetime"), COALESCE("notes", ''),
+                           COUNT(*), SUM("count"), MIN("count"), MAX("count")
+                    FROM {full}
+                    {raw_where}
+                    GROUP BY 1, 2
+                    """
+                ),
+                params,
+            )
+
+        mfull = quote_table(meta_table(table))
+        conn.execute(text(f"DELETE FROM {mfull} {day_where}"), params)
+        conn.execute(
+            text(
+                f"""
+                INSERT INTO {mfull} ("day", "notes", "n", "min_dt", "max_dt")
+                SELECT "datetime"::date, COALESCE("notes", ''),
+                       COUNT(*), MIN("datetime"), MAX("datetime")
+                FROM {full}
+                {raw_where}
+                GROUP BY 1, 2
+                """
+            ),
+            params,
+        )
+
+        dfull = quote_table(names["1d"])
+        rows = conn.execute(
+            text(f'SELECT COALESCE(SUM("n"), 0) FROM {dfull} {bucket_where}'),
+            params,
+        ).scalar()
+
+    return int(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from . import get_engine
+
+    parser = argparse.ArgumentParser(
+        description="Create and (re)build the minute/hour/day rollups and meta table."
+    )
+    parser.add_argument(
+        "--table", default=os.getenv("GMC_TABLE", "public.gmc_readings")
+    )
+    parser.add_argument(
+        "--start", default=None, help="First day to rebuild (YYYY-MM-DD)."
+    )
+    parser.add_argument("--end", default=None, help="Last day to rebuild (YYYY-MM-DD).")
+    args = parser.parse_args()
+
+    n = db_rollup_backfill(get_engine(), args.table, args.start, args.end)
+    print(f"Rolled up {n} rows from {args.table}.")
@@ -0,0 +1,21 @@
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from . import quote_table, meta_table
+
+
+def db_row_count(engine: Engine, table: str) -> Optional[int]:
+    """
+    Row count of ``table`` from the meta table. Returns None when there is no
+    meta table, rather than paying for a COUNT(*) over the raw table.
+    """
+    mfull = quote_table(meta_table(table))
+
+    with engine.begin() as conn:
+        if not conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": mfull}
+        ).scalar():
+            return None
+        n = conn.execute(text(f'SELECT COALESCE(SUM("n"), 0) FROM {mfull}')).scalar()
+
+    return int(n)
@@ -1,11 +1,39 @@
+import os
+import threading
 from typing import Optional
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from . import get_db_url
+from . import get_db_url, MeteredQueuePool
+
+# One engine (and therefore one pool) per URL for the whole process, shared by
+# every Streamlit session and rerun.
+_ENGINES: dict[str, Engine] = {}
+_ENGINES_LOCK = threading.Lock()
 
 
 def get_engine() -> Optional[Engine]:
+    """
+    Returns the process-wide pooled engine for ``DATABASE_URL``, creating it on
+    first use. Pool sizing can be tuned with the env vars ``GMC_POOL_SIZE``
+    (default 5), ``GMC_POOL_MAX_OVERFLOW`` (default 10), ``GMC_POOL_RECYCLE``
+    (seconds, default 1800) and ``GMC_POOL_TIMEOUT`` (seconds, default 30).
+    """
     url = get_db_url()
     if not url:
         return None
-    return create_engine(url, pool_pre_ping=True)
+
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            engine = create_engine(
+                url,
+                poolclass=MeteredQueuePool,
+                pool_pre_ping=True,
+                pool_size=int(os.getenv("GMC_POOL_SIZE", "5")),
+                max_overflow=int(os.getenv("GMC_POOL_MAX_OVERFLOW", "10")),
+                pool_recycle=int(os.getenv("GMC_POOL_RECYCLE", "1800")),
+                pool_timeout=float(os.getenv("GMC_POOL_TIMEOUT", "30")),
+            )
+            _ENGINES[url] = engine
+
+    return engine
@@ -0,0 +1,5 @@
+import os
+
+# Seconds the dashboard may serve table metadata (date bounds, notes options,
+# row counts) from the in-process cache before asking the DB again.
+META_TTL = float(os.getenv("GMC_META_TTL", "30"))
@@ -0,0 +1,66 @@
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    A ``QueuePool`` that keeps running counters of checkouts, checkout wait
+    time, new physical connections, overflow use (checkouts made while the pool
+    was past ``pool_size``) and timeouts. The counters
+    survive ``recreate()`` (e.g. ``engine.dispose()``) so the diagnostics page
+    shows totals for the life of the process.
+    """
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.metrics_lock = threading.Lock()
+        self.metrics = {
+            "checkouts": 0,
+            "checkins": 0,
+            "connects": 0,
+            "overflow_checkouts": 0,
+            "overflow_peak": 0,
+            "timeouts": 0,
+            "wait_total_s": 0.0,
+            "wait_max_s": 0.0,
+        }
+
+    def _bump(self, **deltas) -> None:
+        with self.metrics_lock:
+            for k, v in deltas.items():
+                self.metrics[k] += v
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self._bump(timeouts=1)
+            raise
+        waited = time.perf_counter() - start
+        overflow = max(self.overflow(), 0)
+        with self.metrics_lock:
+            m = self.metrics
+            m["checkouts"] += 1
+            m["wait_total_s"] += waited
+            m["wait_max_s"] = max(m["wait_max_s"], waited)
+            if overflow:
+                m["overflow_checkouts"] += 1
+                m["overflow_peak"] = max(m["overflow_peak"], overflow)
+        return conn
+
+    def _do_return_conn(self, record) -> None:
+        self._bump(checkins=1)
+        super()._do_return_conn(record)
+
+    def _create_connection(self):
+        self._bump(connects=1)
+        return super()._create_connection()
+
+    def recreate(self) -> "MeteredQueuePool":
+        new = super().recreate()
+        new.metrics_lock = self.metrics_lock
+        new.metrics = self.metrics
+        return new
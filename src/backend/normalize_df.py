@@ -1,36 +1,72 @@
 import pandas as pd
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+
+# Low-cardinality text columns, kept as categoricals (1-byte codes per row
+# instead of a Python str object each).
+CATEGORY_COLUMNS = ("unit", "mode", "notes")
 
 
 def normalize_df(df: pd.DataFrame) -> pd.DataFrame:
-    """Standardize columns and types for the GMC-SE CSV format."""
+    """
+    Standardize columns and types for the GMC-SE CSV format: datetimes,
+    ``int32`` counts (bucket averages stay float) and categorical
+    unit/mode/notes. Columns that are already typed are passed through
+    untouched instead of copying the frame, and the sort is skipped when the
+    datetimes are already in order (always the case for DB slices).
+    """
 
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df = df.copy()
-
-    df.columns = [c.strip().lower() for c in df.columns]
+    cols = {}
+    for name, col in df.items():
+        key = str(name).strip().lower()
 
-    if "datetime" in df.columns:
-        df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce")
+        if key in ("datetime", "reference_datetime"):
+            if not is_datetime64_any_dtype(col):
+                col = pd.to_datetime(col, errors="coerce")
 
-    if "reference_datetime" in df.columns:
-        df["reference_datetime"] = pd.to_datetime(
-            df["reference_datetime"], errors="coerce"
-        )
+        elif key == "count":
+            if not is_numeric_dtype(col):
+                col = pd.to_numeric(col, errors="coerce")
 
-    if "count" in df.columns:
-        df["count"] = pd.to_numeric(df["count"], errors="coerce")
+        elif key in CATEGORY_COLUMNS:
+            if not isinstance(col.dtype, pd.CategoricalDtype):
+                col = col.astype("category")
 
-    if "notes" in df.columns:
-        df["notes"] = df["notes"].astype(str)
+        cols[key] = col
 
     # Drop rows missing core fields
-    core = [c for c in ["datetime", "count"] if c in df.columns]
+    core = [cols[c] for c in ["datetime", "count"] if c in cols]
     if core:
-        df = df.dropna(subset=core)
+        valid = core[0].notna()
+        for col in core[1:]:
+            valid &= col.notna()
+        if not valid.all():
+            cols = {k: col[valid] for k, col in cols.items()}
+
+    count = cols.get("count")
+    if (
+        count is not None
+        and count.dtype != "int32"
+        and (
+            is_integer_dtype(count)
+            or (is_float_dtype(count) and (count % 1 == 0).all())
+        )
+    ):
+        cols["count"] = count.astype("int32")
+
+    out = pd.DataFrame(cols, copy=False)
+
+    if "datetime" in out.columns and not out["datetime"].is_monotonic_increasing:
+        out = out.sort_values("datetime", kind="stable")
 
-    if "datetime" in df.columns:
-        df = df.sort_values("datetime")
+    if not out.index.equals(pd.RangeIndex(len(out))):
+        out.index = pd.RangeIndex(len(out))
 
-    return df.reset_index(drop=True)
+    return out
@@ -0,0 +1,39 @@
+import pandas as pd
+from typing import Optional
+
+# "Nice" bucket widths, smallest first. The device logs once a minute so
+# anything at or below a minute is just the raw rows.
+BUCKETS = [
+    pd.Timedelta(minutes=1),
+    pd.Timedelta(minutes=2),
+    pd.Timedelta(minutes=5),
+    pd.Timedelta(minutes=10),
+    pd.Timedelta(minutes=15),
+    pd.Timedelta(minutes=30),
+    pd.Timedelta(hours=1),
+    pd.Timedelta(hours=2),
+    pd.Timedelta(hours=3),
+    pd.Timedelta(hours=6),
+    pd.Timedelta(hours=12),
+    pd.Timedelta(days=1),
+    pd.Timedelta(days=2),
+    pd.Timedelta(days=7),
+]
+
+
+def pick_bucket(start_date, end_date, max_points: int) -> Optional[pd.Timedelta]:
+    """
+    Picks the smallest bucket width that keeps the selected range (end date
+    inclusive) under ``max_points`` points. Returns None when the raw rows
+    already fit, i.e. no downsampling is needed.
+    """
+    span = pd.to_datetime(end_date) + pd.Timedelta(days=1) - pd.to_datetime(start_date)
+
+    if max_points < 1 or span <= BUCKETS[0] * max_points:
+        return None
+
+    for bucket in BUCKETS[1:]:
+        if span <= bucket * max_points:
+            return bucket
+
+    return BUCKETS[-1]
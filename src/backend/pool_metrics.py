@@ -0,0 +1,31 @@
+from typing import Any
+from sqlalchemy.engine import Engine
+
+
+def pool_metrics(engine: Engine) -> dict[str, Any]:
+    """
+    Snapshot of the engine's connection pool: live gauges (size, checked in/out,
+    overflow) plus the running counters kept by ``MeteredQueuePool``.
+    """
+    pool = engine.pool
+
+    out: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+
+    for gauge in ["size", "checkedin", "checkedout", "overflow"]:
+        fn = getattr(pool, gauge, None)
+        if callable(fn):
+            out[gauge] = fn()
+
+    counters = getattr(pool, "metrics", None)
+    if counters is not None:
+        with pool.metrics_lock:
+            out.update(counters)
+        checkouts = out["checkouts"]
+        out["wait_avg_ms"] = (
+            out["wait_total_s"] / checkouts * 1000.0 if checkouts else 0.0
+        )
+
+    return out
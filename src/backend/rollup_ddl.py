@@ -0,0 +1,103 @@
+from . import quote_table, rollup_tables, meta_table, ROLLUPS
+
+
+def rollup_ddl(table: str) -> str:
+    """
+    DDL for the minute/hour/day rollup tables and the per-day, per-notes
+    summary (meta) table of ``table``, plus the statement level AFTER INSERT
+    trigger that keeps them up to date as rows (or COPY batches) are ingested.
+    Idempotent. ``db/init.sql`` carries the expanded version of this for
+    ``public.gmc_readings``.
+
+    Rollups are append-only: deleting raw rows does not update them, re-run
+    the backfill for the affected days instead.
+    """
+    full = quote_table(table)
+    tbl = table.split(".")[-1]
+    fn = quote_table(f"{table}_rollup_fn")
+    names = rollup_tables(table)
+
+    parts = []
+    upserts = []
+
+    for suffix, field, _ in ROLLUPS:
+        rfull = quote_table(names[suffix])
+
+        parts.append(
+            f"""
+            CREATE TABLE IF NOT EXISTS {rfull} (
+              "bucket"  TIMESTAMP NOT NULL,
+              "notes"   TEXT      NOT NULL DEFAULT '',
+              "n"       BIGINT    NOT NULL,
+              "sum"     BIGINT    NOT NULL,
+              "min"     INTEGER   NOT NULL,
+              "max"     INTEGER   NOT NULL,
+              PRIMARY KEY ("bucket", "notes")
+            );
+            """
+        )
+
+        upserts.append(
+            f"""
+              INSERT INTO {rfull} AS r ("bucket", "notes", "n", "sum", "min", "max")
+              SELECT date_trunc('{field}', "datetime"), COALESCE("notes", ''),
+                     COUNT(*), SUM("count"), MIN("count"), MAX("count")
+              FROM new_rows
+              GROUP BY 1, 2
+              ON CONFLICT ("bucket", "notes") DO UPDATE SET
+                "n"   = r."n" + EXCLUDED."n",
+                "sum" = r."sum" + EXCLUDED."sum",
+                "min" = LEAST(r."min", EXCLUDED."min"),
+                "max" = GREATEST(r."max", EXCLUDED."max");
+            """
+        )
+
+    mfull = quote_table(meta_table(table))
+
+    # One row per (day, notes) rather than per notes, so writers loading
+    # different days don't all wait on the same row lock.
+    parts.append(
+        f"""
+        CREATE TABLE IF NOT EXISTS {mfull} (
+          "day"     DATE      NOT NULL,
+          "notes"   TEXT      NOT NULL,
+          "n"       BIGINT    NOT NULL,
+          "min_dt"  TIMESTAMP NOT NULL,
+          "max_dt"  TIMESTAMP NOT NULL,
+          PRIMARY KEY ("day", "notes")
+        );
+        """
+    )
+
+    upserts.append(
+        f"""
+              INSERT INTO {mfull} AS m ("day", "notes", "n", "min_dt", "max_dt")
+              SELECT "datetime"::date, COALESCE("notes", ''),
+                     COUNT(*), MIN("datetime"), MAX("datetime")
+              FROM new_rows
+              GROUP BY 1, 2
+              ON CONFLICT ("day", "notes") DO UPDATE SET
+                "n"      = m."n" + EXCLUDED."n",
+                "min_dt" = LEAST(m."min_dt", EXCLUDED."min_dt"),
+                "max_dt" = GREATEST(m."max_dt", EXCLUDED."max_dt");
+            """
+    )
+
+    parts.append(
+        f"""
+        CREATE OR REPLACE FUNCTION {fn}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+          {"".join(upserts)}
+          RETURN NULL;
+        END;
+        $$;
+
+        CREATE OR REPLACE TRIGGER "{tbl}_rollup"
+        AFTER INSERT ON {full}
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION {fn}();
+        """
+    )
+
+    return "".join(parts)
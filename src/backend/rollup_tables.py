@@ -0,0 +1,24 @@
+import pandas as pd
+
+# (suffix, date_trunc field, bucket width), finest first.
+ROLLUPS = [
+    ("1m", "minute", pd.Timedelta(minutes=1)),
+    ("1h", "hour", pd.Timedelta(hours=1)),
+    ("1d", "day", pd.Timedelta(days=1)),
+]
+
+
+def rollup_tables(table: str) -> dict[str, str]:
+    """
+    Maps each rollup suffix to its (unquoted) table name, e.g.
+    ``public.gmc_readings`` -> ``{"1m": "public.gmc_readings_1m", ...}``.
+    """
+    return {suffix: f"{table}_{suffix}" for suffix, _, _ in ROLLUPS}
+
+
+def meta_table(table: str) -> str:
+    """
+    Name of the per-day, per-notes summary table (row count, min/max
+    datetime) of ``table``, e.g. ``public.gmc_readings`` -> ``public.gmc_readings_meta``.
+    """
+    return f"{table}_meta"
@@ -0,0 +1,19 @@
+import os
+import time
+from schedule import every, repeat, run_pending
+from backend import get_engine, db_is_partitioned, db_ensure_partitions
+
+
+@repeat(every().day.at("00:05"))
+def daily_ensure_partitions():
+    table = os.getenv("GMC_TABLE", "public.gmc_readings")
+    with get_engine().begin() as conn:
+        if db_is_partitioned(conn, table):
+            db_ensure_partitions(conn, table, months_ahead=3)
+
+
+if __name__ == "__main__":
+    daily_ensure_partitions()
+    while True:
+        run_pending()
+        time.sleep(1)
@@ -1,6 +1,7 @@
 import time
 from schedule import every, repeat, run_pending
 from utilities import (
+    get_device_session,
     set_device_clock,
     erase_history,
     get_device_log,
@@ -10,12 +11,16 @@ from utilities import (
 
 @repeat(every().day.at("23:59"))
 def daily_reset_device_log():
+    session = get_device_session()
 
-    get_device_log()
-    set_device_clock()
-    erase_history()
-    if get_history_length() > 1:
-        erase_history()
+    # Hold the device for the whole sequence so no other job talks to it
+    # between pulling the log and erasing it.
+    with session:
+        get_device_log(session=session)
+        set_device_clock(session)
+        erase_history(session)
+        if get_history_length(session) > 1:
+            erase_history(session)
 
 
 if __name__ == "__main__":
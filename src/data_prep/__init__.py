@@ -1,18 +1,77 @@
-from .normalize_df import normalize_df
+from ..backend.normalize_df import normalize_df, CATEGORY_COLUMNS
+from ..backend.concat_df import concat_df
+from .read_gmc_csv import read_gmc_csv, read_gmc_csv_chunks, GMC_COLUMNS
 from .load_csv_bytes import load_csv_bytes
+from .filter_df import filter_df
+from .upload_hash import upload_hash
+from .scan_csv_upload import scan_csv_upload
+from .load_csv_upload import load_csv_upload
 from .copy_for_read import copy_for_read
 from .load_csv_path_live import load_csv_path_live
+from .parquet_cache_dir import parquet_cache_dir, PARQUET_CACHE_ROOT, PARQUET_ENABLED
+from .sync_parquet_cache import (
+    sync_parquet_cache,
+    load_parquet_manifest,
+    synced_parquet_manifest,
+    day_file,
+)
+from .read_parquet_days import read_parquet_days
+from .parquet_sync import start_parquet_sync, DAILY_GLOB
+from .dir_manifest import dir_manifest, DIR_PATTERN
+from .load_csv_dir import load_csv_dir
+from .appended_since import appended_since, frame_fingerprint
+from .rolling_time_mean import rolling_time_mean
+from .enrich_columns import enrich_settings, enrich_columns
 from .enrich import enrich
-from .filter_df import filter_df
+from .enrich_batch import enrich_batch
 from .kips import kpis
+from .count_histogram import count_histogram
+from .preview_page import preview_page, format_preview, PREVIEW_COLUMNS
+from .df_to_csv_bytes import df_to_csv_bytes
+from .export_enriched import export_enriched, EXPORT_FORMATS, EXPORT_COLUMNS
 
 
 __all__ = [
     "normalize_df",
+    "CATEGORY_COLUMNS",
+    "concat_df",
+    "read_gmc_csv",
+    "read_gmc_csv_chunks",
+    "GMC_COLUMNS",
     "load_csv_bytes",
+    "upload_hash",
+    "scan_csv_upload",
+    "load_csv_upload",
     "copy_for_read",
     "load_csv_path_live",
+    "parquet_cache_dir",
+    "PARQUET_CACHE_ROOT",
+    "PARQUET_ENABLED",
+    "sync_parquet_cache",
+    "load_parquet_manifest",
+    "synced_parquet_manifest",
+    "day_file",
+    "read_parquet_days",
+    "start_parquet_sync",
+    "DAILY_GLOB",
+    "dir_manifest",
+    "DIR_PATTERN",
+    "load_csv_dir",
+    "appended_since",
+    "frame_fingerprint",
+    "rolling_time_mean",
+    "enrich_settings",
+    "enrich_columns",
     "enrich",
+    "enrich_batch",
     "filter_df",
     "kpis",
+    "count_histogram",
+    "preview_page",
+    "format_preview",
+    "PREVIEW_COLUMNS",
+    "df_to_csv_bytes",
+    "export_enriched",
+    "EXPORT_FORMATS",
+    "EXPORT_COLUMNS",
 ]
@@ -0,0 +1,35 @@
+import pandas as pd
+from typing import Optional
+
+
+def frame_fingerprint(df: pd.DataFrame) -> dict:
+    """Cheap fingerprint of a frame's rows (endpoints and sums of datetime/count)."""
+    times = df["datetime"].to_numpy()
+    return {
+        "n": len(df),
+        "first": times[0] if len(df) else None,
+        "last": times[-1] if len(df) else None,
+        "count_sum": df["count"].to_numpy().sum(dtype="float64"),
+        "time_sum": times.view("i8").sum(),
+    }
+
+
+def appended_since(df: pd.DataFrame, fingerprint: Optional[dict]) -> Optional[int]:
+    """
+    If ``df`` is the frame ``fingerprint`` was taken of plus rows appended at
+    the end, returns the index of the first new row (``len(df)`` if nothing
+    was appended). Otherwise None, and the caller should start over.
+    """
+    if not fingerprint or not 0 < fingerprint["n"] <= len(df):
+        return None
+
+    n = fingerprint["n"]
+    times = df["datetime"].to_numpy()
+    if (
+        times[0] == fingerprint["first"]
+        and times[n - 1] == fingerprint["last"]
+        and df["count"].to_numpy()[:n].sum(dtype="float64") == fingerprint["count_sum"]
+        and times[:n].view("i8").sum() == fingerprint["time_sum"]
+    ):
+        return n
+    return None
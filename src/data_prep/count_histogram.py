@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from . import appended_since, frame_fingerprint
+
+
+def _value_counts(counts: np.ndarray) -> pd.Series:
+    # np.unique sizes its output by the distinct values, where bincount would
+    # allocate one slot per integer between the smallest and the largest.
+    values, freq = np.unique(np.rint(counts).astype(np.int64), return_counts=True)
+    return pd.Series(freq.astype(np.int64), index=values)
+
+
+def count_histogram(df: pd.DataFrame) -> pd.Series:
+    """
+    Readings per CPM value (index: CPM, values: number of readings), counted
+    with ``np.unique``. Kept in the session and, when the frame only grew
+    by a tail since the last call, updated from the new rows alone.
+    """
+    if df.empty or "count" not in df.columns:
+        st.session_state.pop("_count_hist", None)
+        return pd.Series(dtype="int64")
+
+    cached = st.session_state.get("_count_hist")
+    start = appended_since(df, cached["fingerprint"]) if cached else None
+
+    if start is None:
+        hist = _value_counts(df["count"].to_numpy())
+    elif start == len(df):
+        return cached["hist"]
+    else:
+        tail = _value_counts(df["count"].to_numpy()[start:])
+        hist = cached["hist"].add(tail, fill_value=0).astype("int64")
+
+    st.session_state["_count_hist"] = {
+        "fingerprint": frame_fingerprint(df),
+        "hist": hist,
+    }
+    return hist
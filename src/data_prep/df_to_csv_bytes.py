@@ -0,0 +1,27 @@
+import io
+import pandas as pd
+from typing import Callable, Optional
+
+
+def df_to_csv_bytes(
+    df: pd.DataFrame,
+    chunk_rows: int = 100_000,
+    fmt: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> bytes:
+    """
+    CSV-encodes ``df`` ``chunk_rows`` at a time straight into one byte buffer
+    (optionally passing each chunk through ``fmt`` first), instead of building
+    the whole text with ``to_csv()`` and then encoding a second copy of it.
+    """
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+
+    for i in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[i : i + chunk_rows]
+        if fmt is not None:
+            chunk = fmt(chunk)
+        chunk.to_csv(text, index=False, header=i == 0)
+
+    text.flush()
+    text.detach()
+    return buf.getvalue()
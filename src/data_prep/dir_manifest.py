@@ -0,0 +1,82 @@
+import glob
+import json
+import os
+from . import read_gmc_csv_chunks, synced_parquet_manifest
+
+# The dailies written by get_device_log.
+DIR_PATTERN = "GMC-SE_*.csv"
+
+DIR_MANIFEST = ".gmc_manifest.json"
+
+
+def _scan(path: str, size: int) -> dict:
+    """min/max datetime, row count and notes of one CSV, without keeping rows."""
+    mirror = synced_parquet_manifest(path, size)
+    if mirror is not None:
+        days = mirror["days"].values()
+        return {
+            "rows": sum(d["rows"] for d in days),
+            "min": min(d["min"] for d in days),
+            "max": max(d["max"] for d in days),
+            "notes": sorted(set().union(*(d["notes"] for d in days))),
+        }
+
+    lo = hi = None
+    rows = 0
+    notes = set()
+    for chunk, _ in read_gmc_csv_chunks(path):
+        if chunk.empty:
+            continue
+        rows += len(chunk)
+        c_lo, c_hi = chunk["datetime"].min(), chunk["datetime"].max()
+        lo = c_lo if lo is None else min(lo, c_lo)
+        hi = c_hi if hi is None else max(hi, c_hi)
+        if "notes" in chunk.columns:
+            notes.update(str(n) for n in chunk["notes"].dropna().unique())
+    return {
+        "rows": rows,
+        "min": None if lo is None else str(lo),
+        "max": None if hi is None else str(hi),
+        "notes": sorted(notes),
+    }
+
+
+def dir_manifest(directory: str, pattern: str = DIR_PATTERN) -> dict[str, dict]:
+    """
+    Per-file manifest of the CSVs matching ``pattern`` in ``directory``:
+    ``{path: {mtime, size, rows, min, max, notes}}``, kept in
+    ``<directory>/.gmc_manifest.json``. Only files whose mtime or size changed
+    since the last call are scanned again; removed files are dropped.
+    """
+    path = os.path.join(directory, DIR_MANIFEST)
+    try:
+        with open(path, encoding="utf-8") as f:
+            old = json.load(f)
+    except (FileNotFoundError, ValueError):
+        old = {}
+
+    files = {}
+    for csv_path in sorted(glob.glob(os.path.join(directory, pattern))):
+        try:
+            st_ = os.stat(csv_path)
+        except OSError:
+            continue
+        entry = old.get(csv_path)
+        if entry and entry["mtime"] == st_.st_mtime and entry["size"] == st_.st_size:
+            files[csv_path] = entry
+            continue
+        try:
+            stats = _scan(csv_path, st_.st_size)
+        except Exception:
+            continue
+        files[csv_path] = {"mtime": st_.st_mtime, "size": st_.st_size, **stats}
+
+    if files != old:
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(files, f)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass  # read-only directory, just rescan next time
+
+    return files
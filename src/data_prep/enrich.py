@@ -1,4 +1,13 @@
+import numpy as np
 import pandas as pd
+from typing import Optional, Tuple
+from . import (
+    rolling_time_mean,
+    appended_since,
+    frame_fingerprint,
+    enrich_settings,
+    enrich_columns,
+)
 
 
 def enrich(
@@ -6,24 +15,58 @@ def enrich(
     conv_factor: float,
     roll_window: int,
     default_conv_factor: float = None,
-) -> pd.DataFrame:
+    state: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, Optional[dict]]:
     """
     Calculates µSv/hr based on CPM * conv_factor and adds it as a column to the returned dataframe. µSv/hr is estimated from CPM using a fixed factor and is most accurate for the calibration energy (e.g., Cs-137 gamma). Default conversion factor of 0.0065 is set at the app level.
+
+    ``rolling_cpm``/``rolling_usv`` are averaged over the last ``roll_window``
+    minutes of readings (a time window, not a row count). Returns the enriched
+    frame and the window state; pass that back as ``state`` with the next call
+    and, when that frame is the last one plus appended rows, just the new tail
+    is computed (the dashboard keeps it in the session).
     """
 
     if df.empty:
-        return df
-
-    df = df.copy()
+        return df, None
 
-    conv = conv_factor if (conv_factor and conv_factor > 0) else default_conv_factor
+    conv, w = enrich_settings(conv_factor, roll_window, default_conv_factor)
 
-    w = int(roll_window) if (roll_window and roll_window >= 1) else 15
+    times = df["datetime"].to_numpy()
+    counts = df["count"].to_numpy()
 
-    df["usv_hr"] = df["count"] * conv
+    start, prev, carry = 0, None, None
+    if state is not None and state["window"] == w:
+        n = appended_since(df, state["fingerprint"])
+        if n is not None:
+            start, prev, carry = n, state["rolling"], state["carry"]
 
-    df["rolling_cpm"] = df["count"].rolling(window=w, min_periods=1).mean()
+    # Only the new tail needs checking when the cached rows were sorted.
+    if start:
+        new = times[start - 1 :]
+        in_order = bool((new[1:] >= new[:-1]).all())
+    else:
+        in_order = df["datetime"].is_monotonic_increasing
 
-    df["rolling_usv"] = df["usv_hr"].rolling(window=w, min_periods=1).mean()
+    if not in_order:
+        # Time windows need time order; don't keep state for unsorted input.
+        order = np.argsort(times, kind="stable")
+        means, _ = rolling_time_mean(
+            times[order], counts[order], pd.Timedelta(minutes=w)
+        )
+        rolling = np.empty(len(df))
+        rolling[order] = means
+        state = None
+    else:
+        tail, carry = rolling_time_mean(
+            times[start:], counts[start:], pd.Timedelta(minutes=w), carry
+        )
+        rolling = np.concatenate([prev, tail]) if start else tail
+        state = {
+            "window": w,
+            "fingerprint": frame_fingerprint(df),
+            "rolling": rolling,
+            "carry": carry,
+        }
 
-    return df
+    return enrich_columns(df, rolling, conv), state
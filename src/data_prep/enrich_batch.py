@@ -0,0 +1,28 @@
+import pandas as pd
+from typing import Optional, Tuple
+from . import rolling_time_mean, enrich_settings, enrich_columns
+
+
+def enrich_batch(
+    df: pd.DataFrame,
+    conv_factor: float,
+    roll_window: int,
+    carry: Optional[dict] = None,
+    default_conv_factor: float = None,
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Same columns as ``enrich`` for one time-ordered batch of a longer series,
+    without touching the session. ``carry`` is the rolling-window state
+    returned for the previous batch, so the rows at the start of this batch
+    still average over the tail of the last one.
+    """
+    conv, w = enrich_settings(conv_factor, roll_window, default_conv_factor)
+
+    rolling, carry = rolling_time_mean(
+        df["datetime"].to_numpy(),
+        df["count"].to_numpy(),
+        pd.Timedelta(minutes=w),
+        carry,
+    )
+
+    return enrich_columns(df, rolling, conv), carry
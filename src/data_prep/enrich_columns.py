@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+
+def enrich_settings(
+    conv_factor: float, roll_window: int, default_conv_factor: Optional[float] = None
+) -> Tuple[float, int]:
+    """
+    The conversion factor and rolling window (minutes) ``enrich`` and
+    ``enrich_batch`` actually use: ``default_conv_factor`` when ``conv_factor``
+    isn't positive, 15 minutes when ``roll_window`` is below 1.
+    """
+    conv = conv_factor if (conv_factor and conv_factor > 0) else default_conv_factor
+    w = int(roll_window) if (roll_window and roll_window >= 1) else 15
+    return conv, w
+
+
+def enrich_columns(df: pd.DataFrame, rolling: np.ndarray, conv: float) -> pd.DataFrame:
+    """
+    ``df`` plus ``usv_hr``, ``rolling_cpm`` and ``rolling_usv`` from the
+    rolling mean of ``count`` (one value per row).
+    """
+    # The mean of count * conv is conv times the mean of count.
+    cols = {c: df[c] for c in df.columns}
+    cols["usv_hr"] = pd.Series(df["count"].to_numpy() * conv, index=df.index)
+    cols["rolling_cpm"] = pd.Series(rolling, index=df.index)
+    cols["rolling_usv"] = pd.Series(rolling * conv, index=df.index)
+
+    return pd.DataFrame(cols, copy=False)
@@ -0,0 +1,192 @@
+import argparse
+import gzip
+import os
+import pandas as pd
+from sqlalchemy.engine import Engine
+from typing import Callable, Optional, Sequence
+from ..backend import db_iter_batches, get_engine, db_min_max
+from . import enrich_batch, PARQUET_ENABLED, CATEGORY_COLUMNS
+
+EXPORT_FORMATS = ("csv.gz", "parquet")
+
+EXPORT_COLUMNS = [
+    "datetime",
+    "count",
+    "usv_hr",
+    "rolling_cpm",
+    "rolling_usv",
+    "unit",
+    "mode",
+    "reference_datetime",
+    "notes",
+]
+
+DEFAULT_CONV_FACTOR = 0.0065
+
+_EMPTY_DTYPES = {
+    "datetime": "datetime64[ns]",
+    "count": "int32",
+    "usv_hr": "float64",
+    "rolling_cpm": "float64",
+    "rolling_usv": "float64",
+    "unit": object,
+    "mode": object,
+    "reference_datetime": "datetime64[ns]",
+    "notes": object,
+}
+
+
+def _export_format(path: str, fmt: Optional[str]) -> str:
+    if fmt is None:
+        fmt = "parquet" if path.endswith(".parquet") else "csv.gz"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}, use one of {EXPORT_FORMATS}.")
+    if fmt == "parquet" and not PARQUET_ENABLED:
+        raise RuntimeError("Parquet export needs pyarrow installed.")
+    return fmt
+
+
+class _CsvGzWriter:
+    def __init__(self, path: str):
+        self.f = gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6)
+        self.header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self.f, index=False, header=self.header)
+        self.header = False
+
+    def close(self) -> None:
+        self.f.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.writer = None
+        self.schema = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Categories differ from batch to batch; plain strings keep the schema
+        # of every row group the same.
+        df = df.astype({c: object for c in CATEGORY_COLUMNS if c in df.columns})
+        if self.writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self.schema = table.schema
+            self.writer = pq.ParquetWriter(self.path, self.schema, compression="zstd")
+        else:
+            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def export_enriched(
+    engine: Engine,
+    table: str,
+    path: str,
+    start_date,
+    end_date,
+    notes_vals: Optional[Sequence[str]] = None,
+    conv_factor: float = DEFAULT_CONV_FACTOR,
+    roll_window: int = 15,
+    fmt: Optional[str] = None,
+    batch_rows: int = 50_000,
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Streams the filtered readings of ``table`` to ``path`` as gzip CSV or
+    Parquet (one row group per batch), enriched like the dashboard export plus
+    the rolling columns. Rows come from a server-side cursor ``batch_rows`` at
+    a time and the rolling window is carried across batches, so memory stays
+    at about one batch whatever the range. The file is written next to
+    ``path`` and only moved into place once complete. ``on_batch`` is called
+    with the running row count after each batch.
+    """
+    fmt = _export_format(path, fmt)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".part"
+    writer = _ParquetWriter(tmp) if fmt == "parquet" else _CsvGzWriter(tmp)
+
+    rows, batches, carry = 0, 0, None
+    try:
+        for batch in db_iter_batches(
+            engine, table, start_date, end_date, notes_vals, batch_rows
+        ):
+            batch, carry = enrich_batch(
+                batch, conv_factor, roll_window, carry, DEFAULT_CONV_FACTOR
+            )
+            writer.write(batch[EXPORT_COLUMNS])
+            rows += len(batch)
+            batches += 1
+            if on_batch is not None:
+                on_batch(rows)
+        if fmt == "parquet" and writer.writer is None:
+            # Nothing matched; still leave a readable (empty) file behind.
+            writer.write(
+                pd.DataFrame({c: pd.Series(dtype=t) for c, t in _EMPTY_DTYPES.items()})
+            )
+        writer.close()
+    except BaseException:
+        writer.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+    os.replace(tmp, path)
+
+    return {
+        "path": path,
+        "format": fmt,
+        "rows": rows,
+        "batches": batches,
+        "bytes": os.path.getsize(path),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export enriched GMC-SE readings from Postgres as CSV.gz or Parquet."
+    )
+    parser.add_argument("path", help="output file (.csv.gz or .parquet)")
+    parser.add_argument(
+        "--table", default=os.getenv("GMC_TABLE", "public.gmc_readings")
+    )
+    parser.add_argument("--start", help="first day (default: oldest reading)")
+    parser.add_argument("--end", help="last day, inclusive (default: newest reading)")
+    parser.add_argument("--notes", action="append", help="repeat for several")
+    parser.add_argument("--format", choices=EXPORT_FORMATS)
+    parser.add_argument("--conv", type=float, default=DEFAULT_CONV_FACTOR)
+    parser.add_argument("--window", type=int, default=15, help="rolling minutes")
+    parser.add_argument("--batch-rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    start, end = args.start, args.end
+    if start is None or end is None:
+        min_dt, max_dt = db_min_max(engine, args.table)
+        start = start or min_dt
+        end = end or max_dt
+
+    result = export_enriched(
+        engine,
+        args.table,
+        args.path,
+        start,
+        end,
+        args.notes,
+        args.conv,
+        args.window,
+        args.format,
+        args.batch_rows,
+        on_batch=lambda n: print(f"\r{n:,} rows", end="", flush=True),
+    )
+    print(
+        f"\r{result['rows']:,} rows in {result['batches']} batch(es) -> "
+        f"{result['path']} ({result['bytes'] / 2**20:,.1f} MiB)"
+    )
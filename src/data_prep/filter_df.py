@@ -1,9 +1,32 @@
+import numpy as np
 import pandas as pd
 
 
+def _notes_mask(notes: pd.Series, notes_vals) -> np.ndarray:
+    if isinstance(notes.dtype, pd.CategoricalDtype):
+        codes = notes.array.codes
+        wanted = notes.cat.categories.get_indexer(list(notes_vals))
+        wanted = wanted[wanted >= 0]
+        if len(wanted) <= 8:
+            # A few compares on the small int codes beat any gather.
+            mask = np.zeros(len(codes), dtype=bool)
+            for code in wanted:
+                mask |= codes == code
+            return mask
+        # Lookup table over the category codes; the extra last slot is for
+        # code -1 (missing notes) and stays False.
+        lut = np.zeros(len(notes.cat.categories) + 1, dtype=bool)
+        lut[wanted] = True
+        return lut[codes]
+    return notes.isin(notes_vals).to_numpy()
+
+
 def filter_df(df: pd.DataFrame, date_range, notes_vals) -> pd.DataFrame:
     """
-    Provides a filtered dataframe base on passed args.
+    Provides a filtered dataframe base on passed args. The end day is
+    inclusive up to (not including) the next midnight, same as the DB path.
+    A sorted ``datetime`` column is cut with ``searchsorted`` (a slice, no
+    copy); notes are matched on category codes.
 
     Args:
     df (dataframe): Pandas dataframe we want to apply filter to.
@@ -14,16 +37,41 @@ def filter_df(df: pd.DataFrame, date_range, notes_vals) -> pd.DataFrame:
     """
     out = df
 
-    if not out.empty and date_range and date_range[0]:
-        out = out[out["datetime"] >= pd.to_datetime(date_range[0])]
+    if out.empty:
+        return out
+
+    start = pd.to_datetime(date_range[0]) if date_range and date_range[0] else None
+    end_excl = (
+        pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)
+        if date_range and len(date_range) > 1 and date_range[1]
+        else None
+    )
 
-    if not out.empty and date_range and len(date_range) > 1 and date_range[1]:
-        # inclusive end-of-day
-        out = out[
-            out["datetime"] <= pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)
-        ]
+    if start is not None or end_excl is not None:
+        dt = out["datetime"]
+        if dt.is_monotonic_increasing:
+            values = dt.to_numpy()
+            lo = (
+                0
+                if start is None
+                else values.searchsorted(start.to_datetime64(), side="left")
+            )
+            hi = (
+                len(values)
+                if end_excl is None
+                else values.searchsorted(end_excl.to_datetime64(), side="left")
+            )
+            if lo > 0 or hi < len(values):
+                out = out.iloc[lo:hi]
+        else:
+            mask = np.ones(len(out), dtype=bool)
+            if start is not None:
+                mask &= (dt >= start).to_numpy()
+            if end_excl is not None:
+                mask &= (dt < end_excl).to_numpy()
+            out = out[mask]
 
     if not out.empty and notes_vals:
-        out = out[out["notes"].isin(notes_vals)]
+        out = out[_notes_mask(out["notes"], notes_vals)]
 
     return out
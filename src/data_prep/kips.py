@@ -32,9 +32,12 @@ def kpis(df: pd.DataFrame) -> tuple[str, str, str, str]:
         else "-"
     )
 
+    # Bucketed frames carry the true per-bucket max alongside the average.
+    max_col = "count_max" if "count_max" in df.columns else "count"
+
     max_cpm = (
-        f"{df['count'].max():.0f}"
-        if "count" in df.columns and not df["count"].empty
+        f"{df[max_col].max():.0f}"
+        if max_col in df.columns and not df[max_col].empty
         else "-"
     )
 
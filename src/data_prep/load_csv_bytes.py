@@ -1,15 +1,15 @@
 import pandas as pd
 import streamlit as st
-from . import normalize_df
+from . import normalize_df, read_gmc_csv
 
 
 @st.cache_data(show_spinner=False)
 def load_csv_bytes(bytes_data: bytes) -> pd.DataFrame:
-    """Load CSV from uploaded bytes (cache OK for uploads)."""
-    df = pd.read_csv(
-        pd.io.common.BytesIO(bytes_data),
-        engine="python",
-        on_bad_lines="skip",
-        encoding="utf-8",
-    )
-    return normalize_df(df)
+    """
+    Load CSV from uploaded bytes (cache OK for uploads). The number of lines
+    dropped while parsing is kept in ``df.attrs["dropped_lines"]``.
+    """
+    df, dropped = read_gmc_csv(pd.io.common.BytesIO(bytes_data))
+    df = normalize_df(df)
+    df.attrs["dropped_lines"] = dropped
+    return df
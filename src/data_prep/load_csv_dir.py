@@ -0,0 +1,110 @@
+import os
+import pandas as pd
+import streamlit as st
+from typing import Optional, Tuple
+from . import (
+    normalize_df,
+    concat_df,
+    filter_df,
+    read_gmc_csv,
+    read_parquet_days,
+    parquet_cache_dir,
+    synced_parquet_manifest,
+    dir_manifest,
+    DIR_PATTERN,
+)
+
+# Natural key of a reading, same as the unique index in Postgres.
+KEY_COLUMNS = ["datetime", "notes"]
+
+
+def _overlaps(entry: dict, start, end_excl) -> bool:
+    if entry["min"] is None:
+        return False
+    lo, hi = pd.Timestamp(entry["min"]), pd.Timestamp(entry["max"])
+    return (end_excl is None or lo < end_excl) and (start is None or hi >= start)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _read_file(path: str, mtime: float, size: int) -> pd.DataFrame:
+    """Whole CSV, normalized. Cached on (path, mtime, size)."""
+    return normalize_df(read_gmc_csv(path)[0])
+
+
+def _read_range(path: str, mtime: float, size: int, date_range, notes_vals):
+    mirror = synced_parquet_manifest(path, size)
+    if mirror is not None:
+        return read_parquet_days(
+            parquet_cache_dir(path), date_range, notes_vals, manifest=mirror
+        )
+    return filter_df(_read_file(path, mtime, size), date_range, notes_vals)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load(files: tuple, date_range, notes_vals) -> pd.DataFrame:
+    """
+    ``files`` is a tuple of (path, mtime, size, min, max) ordered by min, so
+    the cache is invalidated by any change to the files being read.
+    """
+    df = concat_df(
+        [
+            _read_range(path, mtime, size, date_range, notes_vals)
+            for path, mtime, size, _, _ in files
+        ]
+    )
+    if df.empty:
+        return df
+
+    # Back-to-back dailies concatenate in order; overlapping dumps (a day the
+    # device log wasn't erased) need a merge and dedupe on the natural key.
+    if any(a[4] >= b[3] for a, b in zip(files, files[1:])):
+        keys = [c for c in KEY_COLUMNS if c in df.columns]
+        df = df.sort_values("datetime", kind="stable")
+        df = df.drop_duplicates(subset=keys, keep="last")
+    return normalize_df(df)
+
+
+def load_csv_dir(
+    directory: str,
+    date_range,
+    notes_vals,
+    pattern: str = DIR_PATTERN,
+    manifest: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Treats every CSV matching ``pattern`` in ``directory`` as one dataset.
+    Only files whose [min, max] datetime (from ``dir_manifest``) overlaps
+    ``date_range`` are opened, through their Parquet mirror when it's in sync.
+    Rows from overlapping dumps are merged and deduped on (datetime, notes).
+    Returns (df, info_message).
+    """
+    manifest = manifest if manifest is not None else dir_manifest(directory, pattern)
+
+    start = pd.to_datetime(date_range[0]) if date_range and date_range[0] else None
+    end_excl = (
+        pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)
+        if date_range and len(date_range) > 1 and date_range[1]
+        else None
+    )
+
+    files = sorted(
+        (
+            (path, e["mtime"], e["size"], e["min"], e["max"])
+            for path, e in manifest.items()
+            if _overlaps(e, start, end_excl)
+        ),
+        key=lambda f: f[3],
+    )
+
+    df = _load(
+        tuple(files),
+        tuple(date_range) if date_range else None,
+        tuple(notes_vals) if notes_vals else (),
+    )
+
+    rows = sum(e["rows"] for e in manifest.values())
+    info = (
+        f"Loaded {len(files)} of {len(manifest)} file(s) in "
+        f"{os.path.abspath(directory)} ({rows:,} readings in total)."
+    )
+    return df, info
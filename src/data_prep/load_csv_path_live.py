@@ -1,44 +1,129 @@
+import io
 import os
+import time
 import pandas as pd
+import streamlit as st
 from typing import Optional, Tuple
-from . import normalize_df, copy_for_read
+from . import normalize_df, concat_df, copy_for_read, read_gmc_csv
+
+# Bytes just before the saved offset we compare on every read, to notice a file
+# that was rewritten with different content but didn't shrink.
+SIG_BYTES = 64
+
+# A file untouched for this long isn't being written to, so a last line
+# without a newline is a finished row rather than one still being written.
+SETTLE_SECS = 2.0
+
+
+def _dropped_msg(dropped: int) -> str:
+    return f"Skipped {dropped} bad line(s)." if dropped else ""
+
+
+def _read_full(
+    path: str, settled: bool = False
+) -> Tuple[pd.DataFrame, str, Optional[dict]]:
+    """
+    Full read. Returns (df, info_message, tail_state or None). A last line
+    without a newline is kept only when the file has ``settled``.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        info = ""
+    except Exception as e1:
+        # If locked, try temp copy
+        tmp = copy_for_read(path)
+        if not tmp:
+            return pd.DataFrame(), f"Read failed (direct): {e1}", None
+        try:
+            with open(tmp, "rb") as f:
+                data = f.read()
+            info = "Read from temporary copy (source locked)."
+        except Exception as e2:
+            return pd.DataFrame(), f"Read failed (direct: {e1}) (temp: {e2})", None
+        finally:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
+
+    # Only consume complete lines while the file is being written; a partial
+    # last line is picked up next time.
+    end = len(data) if settled else data.rfind(b"\n") + 1
+    data = data[:end]
+
+    df, dropped = read_gmc_csv(io.BytesIO(data))
+    state = {
+        "header": list(df.columns),
+        "offset": end,
+        "sig": data[-SIG_BYTES:],
+        "dropped": dropped,
+    }
+    return normalize_df(df), info, state
 
 
 def load_csv_path_live(path: str) -> Tuple[pd.DataFrame, str, Optional[float]]:
     """
-    Live-mode read: no cache. Returns (df, info_message, mtime).
-    We read fresh on every rerun; auto-refresh triggers reruns.
+    Live-mode read. Returns (df, info_message, mtime).
+    Remembers the file identity (inode/size/mtime) and byte offset per session
+    and on each rerun only parses the bytes appended since the last one,
+    appending them to the cached normalized frame. A truncated, rotated or
+    rewritten file triggers a full re-read.
     """
     try:
-        mtime = os.path.getmtime(path)
+        st_ = os.stat(path)
     except FileNotFoundError:
         return pd.DataFrame(), f"File not found: {path}", None
     except Exception as e:
         return pd.DataFrame(), f"Could not stat file: {e}", None
 
-    # Try direct read first
-    try:
-        df = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8")
-        return normalize_df(df), "", mtime
-    except Exception as e1:
-        # If locked, try temp copy
-        tmp = copy_for_read(path)
-        if tmp:
+    mtime = st_.st_mtime
+    ident = (path, st_.st_dev, st_.st_ino)
+    cached = st.session_state.get("_csv_tail")
+
+    if cached is not None and cached["ident"] == ident:
+        if st_.st_size == cached["size"] and mtime == cached["mtime"]:
+            return cached["df"], _dropped_msg(cached["dropped"]), mtime
+
+        offset = cached["offset"]
+        if st_.st_size >= offset:
             try:
-                df = pd.read_csv(
-                    tmp, engine="python", on_bad_lines="skip", encoding="utf-8"
-                )
-                return (
-                    normalize_df(df),
-                    "Read from temporary copy (source locked).",
-                    mtime,
-                )
-            except Exception as e2:
-                return pd.DataFrame(), f"Read failed (direct: {e1}) (temp: {e2})", mtime
-            finally:
-                try:
-                    os.remove(tmp)
-                except Exception:
-                    pass
-        else:
-            return pd.DataFrame(), f"Read failed (direct): {e1}", mtime
+                with open(path, "rb") as f:
+                    f.seek(max(offset - len(cached["sig"]), 0))
+                    sig = f.read(len(cached["sig"]))
+                    new = f.read(st_.st_size - offset)
+            except Exception:
+                sig, new = None, b""
+
+            if sig == cached["sig"]:
+                end = new.rfind(b"\n") + 1
+                df = cached["df"]
+                if end:
+                    chunk, dropped = read_gmc_csv(
+                        io.BytesIO(new[:end]), names=cached["header"]
+                    )
+                    cached["dropped"] += dropped
+                    chunk = normalize_df(chunk)
+                    if not chunk.empty:
+                        df = concat_df([df, chunk])
+                        if not df["datetime"].is_monotonic_increasing:
+                            df = df.sort_values("datetime", ignore_index=True)
+                    cached["offset"] = offset + end
+                    cached["sig"] = (cached["sig"] + new[:end])[-SIG_BYTES:]
+                cached.update(df=df, size=st_.st_size, mtime=mtime)
+                return df, _dropped_msg(cached["dropped"]), mtime
+
+    df, info, state = _read_full(path, settled=time.time() - mtime >= SETTLE_SECS)
+
+    if state is None:
+        st.session_state.pop("_csv_tail", None)
+        return df, info, mtime
+
+    st.session_state["_csv_tail"] = {
+        "ident": ident,
+        "size": st_.st_size,
+        "mtime": mtime,
+        "df": df,
+        **state,
+    }
+    return df, " ".join(m for m in [info, _dropped_msg(state["dropped"])] if m), mtime
@@ -0,0 +1,32 @@
+import pandas as pd
+import streamlit as st
+from . import normalize_df, concat_df, read_gmc_csv_chunks, filter_df
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_csv_upload(
+    content_hash: str,
+    _uploaded,
+    date_range,
+    notes_vals,
+    chunksize: int = 500_000,
+) -> pd.DataFrame:
+    """
+    Streams an upload through the parser ``chunksize`` rows at a time and keeps
+    only rows inside ``date_range`` / ``notes_vals``, so a multi-GB export never
+    has to fit in memory as a whole. Cached on ``content_hash`` plus the
+    filters. Lines dropped while parsing end up in ``df.attrs["dropped_lines"]``.
+    """
+    parts = []
+    dropped = 0
+
+    _uploaded.seek(0)
+    for chunk, bad in read_gmc_csv_chunks(_uploaded, chunksize=chunksize):
+        dropped += bad
+        chunk = filter_df(chunk, date_range, notes_vals)
+        if not chunk.empty:
+            parts.append(normalize_df(chunk))
+
+    df = normalize_df(concat_df(parts))
+    df.attrs["dropped_lines"] = dropped
+    return df
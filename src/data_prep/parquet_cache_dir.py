@@ -0,0 +1,21 @@
+import hashlib
+import importlib.util
+import os
+from typing import Optional
+
+# Where the day-partitioned Parquet mirrors of CSV sources are kept.
+PARQUET_CACHE_ROOT = os.getenv("GMC_PARQUET_CACHE", "./data/.parquet")
+
+# The Parquet cache needs pyarrow; without it the CSV readers are used as before.
+PARQUET_ENABLED = importlib.util.find_spec("pyarrow") is not None
+
+
+def parquet_cache_dir(csv_path: str, root: Optional[str] = None) -> str:
+    """
+    Directory holding the Parquet mirror of ``csv_path``: the file's stem plus
+    a short hash of its absolute path, so same-named files don't collide.
+    """
+    path = os.path.abspath(csv_path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(root or PARQUET_CACHE_ROOT, f"{stem}-{key}")
@@ -0,0 +1,87 @@
+import argparse
+import glob
+import os
+import threading
+import time
+from . import sync_parquet_cache
+
+# How often the background thread re-checks the watched CSVs.
+PARQUET_SYNC_SECS = float(os.getenv("GMC_PARQUET_SYNC_SECS", "5"))
+
+# Patterns no session has asked for in this long are dropped from the watch
+# list (a later call adds them back and the sync picks up where it left off).
+PARQUET_WATCH_SECS = float(os.getenv("GMC_PARQUET_WATCH_SECS", "600"))
+
+# The dailies written by daily_live_file.py.
+DAILY_GLOB = "./data/GMC-SE_*.csv"
+
+_WATCHED: dict[str, float] = {}  # pattern -> last time it was asked for
+_THREAD = None
+_LOCK = threading.Lock()
+
+
+def _expand(patterns) -> list[str]:
+    out = set()
+    for p in patterns:
+        out.update(glob.glob(p) if glob.has_magic(p) else [p])
+    return sorted(out)
+
+
+def _sync_all(patterns, verbose: bool = False) -> None:
+    for path in _expand(patterns):
+        try:
+            manifest = sync_parquet_cache(path)
+        except Exception as e:
+            if verbose:
+                print(f"{path}: sync failed: {e}")
+            continue
+        if verbose and manifest is not None:
+            rows = sum(d["rows"] for d in manifest["days"].values())
+            print(f"{path}: {len(manifest['days'])} day(s), {rows:,} rows")
+
+
+def _run(interval: float) -> None:
+    while True:
+        with _LOCK:
+            cutoff = time.monotonic() - PARQUET_WATCH_SECS
+            for p in [p for p, seen in _WATCHED.items() if seen < cutoff]:
+                del _WATCHED[p]
+            patterns = list(_WATCHED)
+        _sync_all(patterns)
+        time.sleep(interval)
+
+
+def start_parquet_sync(*patterns: str, interval: float = PARQUET_SYNC_SECS) -> None:
+    """
+    Adds CSV paths / glob patterns to the process-wide watch list and starts
+    the background thread that keeps their Parquet mirrors in sync (once per
+    process; later calls just add patterns). Call it on every rerun: patterns
+    not asked for in ``GMC_PARQUET_WATCH_SECS`` are dropped from the list.
+    """
+    global _THREAD
+    with _LOCK:
+        now = time.monotonic()
+        _WATCHED.update((p, now) for p in patterns)
+        if _THREAD is None or not _THREAD.is_alive():
+            _THREAD = threading.Thread(
+                target=_run, args=(interval,), name="parquet-sync", daemon=True
+            )
+            _THREAD.start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mirror GMC-SE CSVs into day-partitioned Parquet datasets."
+    )
+    parser.add_argument("paths", nargs="*", default=[DAILY_GLOB])
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=f"keep syncing every GMC_PARQUET_SYNC_SECS ({PARQUET_SYNC_SECS:g}s)",
+    )
+    args = parser.parse_args()
+
+    _sync_all(args.paths, verbose=True)
+    while args.watch:
+        time.sleep(PARQUET_SYNC_SECS)
+        _sync_all(args.paths)
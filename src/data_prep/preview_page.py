@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from . import appended_since, frame_fingerprint
+
+PREVIEW_COLUMNS = [
+    "datetime",
+    "count",
+    "usv_hr",
+    "unit",
+    "mode",
+    "reference_datetime",
+    "notes",
+]
+
+
+def format_preview(df: pd.DataFrame) -> pd.DataFrame:
+    """The preview/export columns of ``df``, with µSv/hr rounded."""
+    out = df[[c for c in PREVIEW_COLUMNS if c in df.columns]]
+    if "usv_hr" in out.columns:
+        out = out.assign(usv_hr=out["usv_hr"].round(4))
+    return out
+
+
+def _sort_order(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Row order for ``col``, kept in the session until the frame changes."""
+    cached = st.session_state.get("_preview_order")
+    if (
+        cached is not None
+        and cached["col"] == col
+        and appended_since(df, cached["fingerprint"]) == len(df)
+    ):
+        return cached["order"]
+
+    values = df[col].array
+    keys = values.codes if isinstance(df[col].dtype, pd.CategoricalDtype) else values
+    order = np.argsort(np.asarray(keys), kind="stable")
+
+    st.session_state["_preview_order"] = {
+        "col": col,
+        "fingerprint": frame_fingerprint(df),
+        "order": order,
+    }
+    return order
+
+
+def preview_page(
+    df: pd.DataFrame,
+    page: int,
+    page_size: int,
+    sort_col: str = "datetime",
+    descending: bool = True,
+) -> pd.DataFrame:
+    """
+    Rows ``page * page_size`` to ``(page + 1) * page_size`` of ``df`` sorted by
+    ``sort_col``, formatted for display. Only the rows on the page are copied.
+    Sorting by ``datetime`` is free (the frame already is); other columns sort
+    once and reuse the order until the frame changes.
+    """
+    n = len(df)
+    lo = min(max(page, 0) * page_size, n)
+    hi = min(lo + page_size, n)
+
+    if sort_col == "datetime" or sort_col not in df.columns:
+        rows = np.arange(lo, hi)
+        if descending:
+            rows = n - 1 - rows
+    else:
+        order = _sort_order(df, sort_col)
+        rows = order[::-1][lo:hi] if descending else order[lo:hi]
+
+    return format_preview(df.iloc[rows]).reset_index(drop=True)
@@ -0,0 +1,181 @@
+import contextlib
+import importlib.util
+import io
+import os
+import numpy as np
+import pandas as pd
+from itertools import islice
+from typing import Iterator, Optional, Sequence, Tuple
+
+GMC_COLUMNS = ["datetime", "count", "unit", "mode", "reference_datetime", "notes"]
+
+GMC_DTYPES = {"unit": "category", "mode": "category", "notes": "category"}
+
+# pygmc writes str(datetime), e.g. 2025-01-01 00:00:00
+GMC_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Use pyarrow's multithreaded CSV reader when it's installed.
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+
+def _to_datetime(col: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col.astype("datetime64[ns]")
+    out = pd.to_datetime(col, format=GMC_DATETIME_FORMAT, errors="coerce")
+    # Only the odd value that doesn't match the fixed format pays for inference.
+    retry = out.isna() & col.notna()
+    if retry.any():
+        out[retry] = pd.to_datetime(col[retry], format="mixed", errors="coerce")
+    return out
+
+
+def _coerce(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """Types the columns and drops rows without a valid datetime/count."""
+    dropped = 0
+    df.columns = [str(c).strip().lower() for c in df.columns]
+
+    if "datetime" in df.columns:
+        df["datetime"] = _to_datetime(df["datetime"])
+
+    if "reference_datetime" in df.columns:
+        df["reference_datetime"] = _to_datetime(df["reference_datetime"])
+
+    if "count" in df.columns:
+        df["count"] = pd.to_numeric(df["count"], errors="coerce")
+
+    core = [c for c in ["datetime", "count"] if c in df.columns]
+    if core:
+        valid = df[core].notna().all(axis=1)
+        if not valid.all():
+            dropped += int((~valid).sum())
+            df = df.loc[valid].copy()
+
+    if "count" in df.columns and len(df):
+        df["count"] = df["count"].astype("int32")
+
+    return df, dropped
+
+
+def _read_bytes(source) -> bytes:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    data = source.read()
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def _bad_lines(data: bytes) -> list:
+    """
+    Line numbers (for ``skiprows``) whose field count differs from the header's,
+    i.e. the lines pyarrow's parser skips. The C and python engines would pad
+    short lines and take an extra field on the first data line as the index,
+    shifting every column. Counts commas, so it assumes no quoted fields (pygmc
+    writes none).
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord("\n"))
+    if not len(buf):
+        return []
+    if buf[-1] != ord("\n"):
+        ends = np.append(ends, len(buf))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    commas = np.flatnonzero(buf == ord(","))
+    fields = np.searchsorted(commas, ends) - np.searchsorted(commas, starts) + 1
+
+    length = ends - starts
+    cr = (length > 0) & (buf[np.maximum(ends - 1, 0)] == ord("\r"))
+    blank = length - cr == 0
+
+    return np.flatnonzero((fields != fields[:1]) & ~blank).tolist()
+
+
+def read_gmc_csv(
+    source, names: Optional[Sequence[str]] = None
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Parses a GMC-SE CSV (``datetime, count, unit, mode, reference_datetime,
+    notes``) with the pyarrow engine (C engine if pyarrow isn't installed),
+    fixed dtypes and an explicit datetime format.
+    Lines with the wrong number of fields, or without a valid datetime/count,
+    are dropped, whichever engine reads them. Falls back to the python engine
+    only when the fast parser can't cope with the file at all. ``names`` reads header-less input (e.g. the
+    appended tail of a file). Returns (df, number of lines dropped); the count
+    is also kept in ``df.attrs["dropped_lines"]``.
+    """
+    kw = dict(encoding="utf-8", dtype=GMC_DTYPES)
+    if names is not None:
+        # Put a header line in front rather than passing names, so a first line
+        # with an extra field is skipped instead of becoming the index.
+        source = io.BytesIO(",".join(names).encode() + b"\n" + _read_bytes(source))
+
+    if hasattr(source, "seek"):
+        start = source.tell()
+
+    try:
+        if CSV_ENGINE == "pyarrow":
+            skipped = []
+            df = pd.read_csv(
+                source,
+                engine="pyarrow",
+                on_bad_lines=lambda row: skipped.append(row) or "skip",
+                **kw,
+            )
+            bad = len(skipped)
+        else:
+            data = _read_bytes(source)
+            skip = _bad_lines(data)
+            df = pd.read_csv(io.BytesIO(data), engine=CSV_ENGINE, skiprows=skip, **kw)
+            bad = len(skip)
+    except (pd.errors.ParserError, UnicodeDecodeError, ValueError):
+        if hasattr(source, "seek"):
+            source.seek(start)
+        data = _read_bytes(source)
+        skip = _bad_lines(data)
+        skipped = []
+        df = pd.read_csv(
+            io.BytesIO(data),
+            engine="python",
+            skiprows=skip,
+            on_bad_lines=skipped.append,
+            **kw,
+        )
+        bad = len(skip) + len(skipped)
+
+    df, dropped = _coerce(df)
+    bad += dropped
+
+    df.attrs["dropped_lines"] = bad
+
+    return df, bad
+
+
+def read_gmc_csv_chunks(
+    source, chunksize: int = 500_000, names: Optional[Sequence[str]] = None
+) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Same as ``read_gmc_csv`` but yields ``chunksize`` rows at a time, so a huge
+    file never has to be in memory as one frame. Yields (chunk, lines dropped
+    from that chunk). ``source`` is a path or a binary file object.
+
+    The lines are split off here and each batch (with the header line put back
+    in front) goes through ``read_gmc_csv``, so chunks are parsed by the same
+    engine and drop the same bad lines as a whole-file read (the C engine's own
+    chunked reader keeps a line with too many fields when it happens to start
+    a chunk). GMC CSVs have no quoted newlines, so a line is always one row.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        opened = open(source, "rb")
+    else:
+        opened = contextlib.nullcontext(source)
+
+    with opened as f:
+        header = f.readline() if names is None else b""
+        yielded = False
+        while True:
+            lines = list(islice(f, chunksize))
+            # A header-only file still yields one (empty) chunk with its columns
+            if not lines and (yielded or not header):
+                return
+            yielded = True
+            yield read_gmc_csv(io.BytesIO(header + b"".join(lines)), names=names)
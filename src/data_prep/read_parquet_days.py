@@ -0,0 +1,44 @@
+import os
+import pandas as pd
+from typing import Optional, Sequence
+from . import normalize_df, concat_df, load_parquet_manifest, day_file
+
+
+def read_parquet_days(
+    cache_dir: str,
+    date_range,
+    notes_vals=None,
+    columns: Optional[Sequence[str]] = None,
+    manifest: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Reads a Parquet mirror built by ``sync_parquet_cache``, touching only the
+    day partitions inside ``date_range`` (inclusive days) and only ``columns``.
+    The notes filter is pushed down to the Parquet reader.
+    """
+    manifest = manifest or load_parquet_manifest(cache_dir)
+    if not manifest or not manifest["days"]:
+        return pd.DataFrame()
+
+    start = str(pd.to_datetime(date_range[0]).date()) if date_range else None
+    end = (
+        str(pd.to_datetime(date_range[1]).date())
+        if date_range and len(date_range) > 1 and date_range[1]
+        else None
+    )
+    days = [
+        d
+        for d in sorted(manifest["days"])
+        if (start is None or d >= start) and (end is None or d <= end)
+    ]
+
+    if columns is not None and "datetime" not in columns:
+        columns = ["datetime", *columns]
+    filters = [("notes", "in", list(notes_vals))] if notes_vals else None
+
+    parts = [
+        pd.read_parquet(day_file(cache_dir, d), columns=columns, filters=filters)
+        for d in days
+        if os.path.exists(day_file(cache_dir, d))
+    ]
+    return normalize_df(concat_df(parts))
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+
+def rolling_time_mean(
+    times: np.ndarray,
+    values: np.ndarray,
+    window: pd.Timedelta,
+    carry: Optional[dict] = None,
+) -> Tuple[np.ndarray, dict]:
+    """
+    Mean of ``values`` over the trailing time window ``(t - window, t]`` of each
+    row (same as ``Series.rolling("15min")`` on a sorted index), from prefix
+    sums and ``searchsorted`` instead of a per-row loop.
+
+    ``carry`` is the state returned by the previous call: the rows still inside
+    the window of the last timestamp and their prefix sums. Feeding a sorted
+    series in consecutive pieces gives the same result as one call over all of
+    it, while each call only costs as much as its own rows.
+    """
+    t = np.asarray(times, dtype="datetime64[ns]").view("i8")
+    v = np.asarray(values, dtype="float64")
+
+    if carry is not None and len(carry["t"]):
+        t_all = np.concatenate([carry["t"], t])
+        prefix = np.concatenate([carry["prefix"], carry["prefix"][-1] + np.cumsum(v)])
+    else:
+        t_all = t
+        prefix = np.concatenate([[0.0], np.cumsum(v)])
+
+    n_old = len(t_all) - len(t)
+    idx = np.arange(n_old, len(t_all))
+    lo = np.searchsorted(t_all, t - window.value, side="right")
+    means = (prefix[idx + 1] - prefix[lo]) / (idx + 1 - lo)
+
+    # Future rows are at or after the last timestamp, so only rows newer than
+    # (last - window) can still fall inside their windows.
+    if len(t_all):
+        keep = np.searchsorted(t_all, t_all[-1] - window.value, side="right")
+    else:
+        keep = 0
+    carry = {"t": t_all[keep:], "prefix": prefix[keep:]}
+
+    return means, carry
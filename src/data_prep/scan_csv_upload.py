@@ -0,0 +1,35 @@
+import pandas as pd
+import streamlit as st
+from . import read_gmc_csv_chunks
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def scan_csv_upload(content_hash: str, _uploaded, chunksize: int = 500_000) -> dict:
+    """
+    One streaming pass over an upload to get what the controls need (min/max
+    datetime, distinct notes, row count) without keeping any rows around.
+    Cached on ``content_hash``; the file object itself isn't hashed.
+    """
+    min_dt = max_dt = None
+    notes = set()
+    rows = dropped = 0
+
+    _uploaded.seek(0)
+    for chunk, bad in read_gmc_csv_chunks(_uploaded, chunksize=chunksize):
+        dropped += bad
+        if chunk.empty:
+            continue
+        rows += len(chunk)
+        lo, hi = chunk["datetime"].min(), chunk["datetime"].max()
+        min_dt = lo if min_dt is None else min(min_dt, lo)
+        max_dt = hi if max_dt is None else max(max_dt, hi)
+        if "notes" in chunk.columns:
+            notes.update(chunk["notes"].dropna().unique())
+
+    return {
+        "min_dt": None if min_dt is None else pd.Timestamp(min_dt),
+        "max_dt": None if max_dt is None else pd.Timestamp(max_dt),
+        "notes": sorted(notes),
+        "rows": rows,
+        "dropped": dropped,
+    }
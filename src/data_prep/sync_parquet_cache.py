@@ -0,0 +1,221 @@
+import io
+import json
+import os
+import shutil
+import threading
+import pandas as pd
+from datetime import datetime
+from typing import Optional
+from . import (
+    read_gmc_csv,
+    read_gmc_csv_chunks,
+    parquet_cache_dir,
+    PARQUET_ENABLED,
+    concat_df,
+    CATEGORY_COLUMNS,
+)
+
+MANIFEST = "_manifest.json"
+
+# Bytes just before the synced offset, compared on every sync to notice a CSV
+# that was rewritten with different content but didn't shrink.
+SIG_BYTES = 64
+
+_LOCKS: dict[str, threading.Lock] = {}
+_LOCKS_LOCK = threading.Lock()
+
+
+class _Prefix(io.RawIOBase):
+    """Read-only view of the first ``limit`` bytes of an open file."""
+
+    def __init__(self, f, limit: int):
+        self._f, self._left = f, limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._left <= 0:
+            return 0
+        n = self._f.readinto(memoryview(b)[: min(len(b), self._left)])
+        self._left -= n
+        return n
+
+
+def _lock_for(cache_dir: str) -> threading.Lock:
+    with _LOCKS_LOCK:
+        return _LOCKS.setdefault(os.path.abspath(cache_dir), threading.Lock())
+
+
+def load_parquet_manifest(cache_dir: str) -> Optional[dict]:
+    """The manifest of a Parquet mirror, or None if it hasn't been built yet."""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def synced_parquet_manifest(csv_path: str, size: int) -> Optional[dict]:
+    """
+    The manifest of ``csv_path``'s Parquet mirror if it has rows and is in
+    sync with a CSV of ``size`` bytes, else None.
+    """
+    if not PARQUET_ENABLED:
+        return None
+    manifest = load_parquet_manifest(parquet_cache_dir(csv_path))
+    if manifest and manifest["size"] == size and manifest["days"]:
+        return manifest
+    return None
+
+
+def _save_manifest(cache_dir: str, manifest: dict) -> None:
+    manifest["synced_at"] = datetime.now().isoformat(timespec="seconds")
+    tmp = os.path.join(cache_dir, MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, os.path.join(cache_dir, MANIFEST))
+
+
+def day_file(cache_dir: str, day: str) -> str:
+    return os.path.join(cache_dir, f"day={day}", "part-0.parquet")
+
+
+def _write_days(cache_dir: str, df: pd.DataFrame, days: dict) -> None:
+    """Writes ``df`` into its day partitions, merging with what's already there."""
+    if df.empty:
+        return
+    for ts, part in df.groupby(df["datetime"].dt.normalize(), sort=True):
+        day = ts.strftime("%Y-%m-%d")
+        path = day_file(cache_dir, day)
+        if os.path.exists(path):
+            part = concat_df([pd.read_parquet(path), part])
+        if not part["datetime"].is_monotonic_increasing:
+            part = part.sort_values("datetime", kind="stable", ignore_index=True)
+        part = part.reset_index(drop=True)
+        for c in CATEGORY_COLUMNS:
+            if c in part.columns:
+                part[c] = part[c].astype("category")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        part.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+        notes = part["notes"].dropna().unique() if "notes" in part.columns else []
+        days[day] = {
+            "rows": len(part),
+            "min": str(part["datetime"].iloc[0]),
+            "max": str(part["datetime"].iloc[-1]),
+            "notes": sorted(str(n) for n in notes),
+        }
+
+
+def _rebuild(csv_path: str, cache_dir: str, size: int, chunksize: int) -> dict:
+    """Converts the whole CSV into a fresh dataset and swaps it in."""
+    building = cache_dir + ".building"
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(building)
+
+    days: dict = {}
+    header, dropped = None, 0
+    with open(csv_path, "rb") as f:
+        # Only consume complete lines; a partial last line is picked up next sync.
+        f.seek(max(size - 65536, 0))
+        tail = f.read(size - f.tell())
+        end = size - len(tail) + tail.rfind(b"\n") + 1 if b"\n" in tail else 0
+        f.seek(max(end - SIG_BYTES, 0))
+        sig = f.read(end - f.tell())
+        f.seek(0)
+
+        if end:
+            source = io.BufferedReader(_Prefix(f, end))
+            for chunk, bad in read_gmc_csv_chunks(source, chunksize=chunksize):
+                header = header or list(chunk.columns)
+                dropped += bad
+                _write_days(building, chunk, days)
+
+        if end and header is None:
+            # Header only (or no valid rows): still keep the header so the
+            # next sync can append instead of converting again.
+            f.seek(0)
+            first = f.readline(end)
+            header = list(read_gmc_csv(io.BytesIO(first))[0].columns)
+
+    st_ = os.stat(csv_path)
+    manifest = {
+        "source": os.path.abspath(csv_path),
+        "size": size,
+        "mtime": st_.st_mtime if st_.st_size == size else None,
+        "offset": end,
+        "sig": sig.hex(),
+        "header": header,
+        "dropped": dropped,
+        "days": days,
+    }
+    _save_manifest(building, manifest)
+
+    old = cache_dir + ".old"
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(cache_dir):
+        os.rename(cache_dir, old)
+    os.rename(building, cache_dir)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+
+def sync_parquet_cache(
+    csv_path: str, cache_dir: Optional[str] = None, chunksize: int = 500_000
+) -> Optional[dict]:
+    """
+    Brings the day-partitioned Parquet mirror of ``csv_path`` up to date and
+    returns its manifest (None if the CSV can't be read). Lines appended since
+    the last sync are parsed on their own and only rewrite the day partitions
+    they fall in (normally just today's). A truncated or rewritten CSV, or one
+    without a mirror yet, is converted from scratch in chunks.
+    """
+    cache_dir = cache_dir or parquet_cache_dir(csv_path)
+    os.makedirs(os.path.dirname(os.path.abspath(cache_dir)), exist_ok=True)
+
+    with _lock_for(cache_dir):
+        try:
+            st_ = os.stat(csv_path)
+        except OSError:
+            return None
+
+        manifest = load_parquet_manifest(cache_dir)
+        if manifest is None:
+            return _rebuild(csv_path, cache_dir, st_.st_size, chunksize)
+
+        if st_.st_size == manifest["size"] and st_.st_mtime == manifest["mtime"]:
+            return manifest
+
+        # Nothing complete (not even a header line) was read last time.
+        if manifest.get("header") is None:
+            return _rebuild(csv_path, cache_dir, st_.st_size, chunksize)
+
+        offset = manifest["offset"]
+        if st_.st_size < offset:
+            return _rebuild(csv_path, cache_dir, st_.st_size, chunksize)
+
+        old_sig = bytes.fromhex(manifest["sig"])
+        with open(csv_path, "rb") as f:
+            f.seek(max(offset - len(old_sig), 0))
+            sig = f.read(len(old_sig))
+            new = f.read(st_.st_size - offset)
+
+        if sig != old_sig:
+            return _rebuild(csv_path, cache_dir, st_.st_size, chunksize)
+
+        end = new.rfind(b"\n") + 1
+        if end:
+            chunk, dropped = read_gmc_csv(
+                io.BytesIO(new[:end]), names=manifest["header"]
+            )
+            _write_days(cache_dir, chunk, manifest["days"])
+            manifest["dropped"] += dropped
+            manifest["offset"] = offset + end
+            manifest["sig"] = (old_sig + new[:end])[-SIG_BYTES:].hex()
+
+        manifest.update(size=st_.st_size, mtime=st_.st_mtime)
+        _save_manifest(cache_dir, manifest)
+        return manifest
@@ -0,0 +1,19 @@
+import hashlib
+import streamlit as st
+
+
+def upload_hash(uploaded) -> str:
+    """
+    sha256 of an uploaded file's content, used as the cache key for uploads so
+    Streamlit doesn't have to hash (and keep) the raw bytes. Remembered per
+    upload (``file_id`` and size) in the session, so reruns and autorefresh
+    ticks don't hash the whole buffer again.
+    """
+    key = (getattr(uploaded, "file_id", None), uploaded.size)
+    cached = st.session_state.get("_upload_hash")
+    if key[0] is not None and cached is not None and cached[0] == key:
+        return cached[1]
+
+    digest = hashlib.sha256(uploaded.getbuffer()).hexdigest()
+    st.session_state["_upload_hash"] = (key, digest)
+    return digest
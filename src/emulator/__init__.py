@@ -0,0 +1,23 @@
+from .count_source import CountSource
+from .history_flash import HistoryFlash, FLASH_SIZE, FLASH_PAGE
+from .emulated_gmcse import EmulatedGMCSE
+from .emulated_serial import EmulatedSerial, connect_emulated
+from .serve_pty import serve_pty
+from .generate_readings import generate_readings
+from .write_daily_csvs import write_daily_csvs
+from .load_generator import load_generator
+
+
+__all__ = [
+    "CountSource",
+    "HistoryFlash",
+    "FLASH_SIZE",
+    "FLASH_PAGE",
+    "EmulatedGMCSE",
+    "EmulatedSerial",
+    "connect_emulated",
+    "serve_pty",
+    "generate_readings",
+    "write_daily_csvs",
+    "load_generator",
+]
@@ -0,0 +1,47 @@
+import numpy as np
+from typing import Optional
+
+
+class CountSource:
+    """
+    Synthetic counts per minute: Poisson around ``cpm`` with spikes injected
+    at random. A spike starts on average once every ``spike_every`` minutes
+    (``None`` for no spikes) and adds ``spike_cpm`` for ``spike_minutes``
+    minutes. Successive ``counts()`` calls continue the same series, so a spike
+    that starts near the end of one call carries into the next.
+    """
+
+    def __init__(
+        self,
+        cpm: float = 20.0,
+        spike_every: Optional[float] = None,
+        spike_cpm: float = 400.0,
+        spike_minutes: int = 5,
+        seed: Optional[int] = None,
+    ):
+        self.cpm = cpm
+        self.spike_every = spike_every
+        self.spike_cpm = spike_cpm
+        self.spike_minutes = max(1, int(spike_minutes))
+        self.rng = np.random.default_rng(seed)
+        self._spike_left = 0  # minutes of a running spike still to come
+
+    def counts(self, n: int) -> np.ndarray:
+        """The next ``n`` minutes of counts (int64)."""
+        rate = np.full(n, float(self.cpm))
+
+        if self.spike_every and n:
+            starts = self.rng.random(n) < 1.0 / self.spike_every
+            active = (
+                np.convolve(starts, np.ones(self.spike_minutes, dtype=bool))[:n] > 0
+            )
+            active[: self._spike_left] = True
+            rate[active] += self.spike_cpm
+
+            left = max(0, self._spike_left - n)
+            hits = np.flatnonzero(starts)
+            if len(hits):
+                left = max(left, hits[-1] + self.spike_minutes - n)
+            self._spike_left = left
+
+        return self.rng.poisson(rate)
@@ -0,0 +1,176 @@
+import struct
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from . import CountSource, HistoryFlash
+
+# Command payload sizes that aren't delimited by ">>" alone.
+PAYLOAD_SIZES = {b"SPIR": 5, b"SETDATETIME": 6}
+
+# Key presses (S4, S3, S3, S4, ...) that reach and confirm "erase history" in
+# the device menu, same path utilities.erase_history walks.
+MENU_ERASE_KEYS = [3, 2, 2, 3, 2, 2, 2, 2, 3]
+
+# Three calibration points (CPM, µSv/h) at the app's default 0.0065 µSv/h/CPM.
+CALIBRATION = [(60, 0.39), (240, 1.56), (1000, 6.5)]
+
+
+def _config_bytes() -> bytes:
+    cfg = bytearray(256)
+    for i, (cpm, usv) in enumerate(CALIBRATION):
+        at = 8 + 6 * i
+        cfg[at : at + 2] = struct.pack(">H", cpm)
+        cfg[at + 2 : at + 6] = struct.pack("<f", usv)
+    cfg[32] = 2  # SaveDataType: CPM every minute
+    cfg[57] = 254  # 115200 baud
+    return bytes(cfg)
+
+
+class EmulatedGMCSE:
+    """
+    Stands in for a GMC-SE at the serial protocol level: bytes written by the
+    host go to ``feed()`` and the device's reply comes back. The history is a
+    ``HistoryFlash`` that gets one reading from ``source`` per (emulated)
+    minute. ``speed`` scales the clock (60 means a minute per second), and
+    ``history_minutes`` pre-fills that much history ending now. The menu is
+    only emulated as far as the erase-history key sequence.
+    """
+
+    version = b"GMC-SE Re 1.10"
+
+    def __init__(
+        self,
+        source: Optional[CountSource] = None,
+        flash: Optional[HistoryFlash] = None,
+        speed: float = 1.0,
+        history_minutes: int = 0,
+        note: Optional[str] = "emulator",
+        serial: bytes = b"\xf4\x88\x1a\x2b\x3c\x4d\x5e",
+    ):
+        self.source = source or CountSource()
+        self.flash = flash or HistoryFlash()
+        self.speed = speed
+        self.note = note
+        self.serial = serial
+
+        self.lock = threading.Lock()
+        self.commands = 0
+        self.last_cpm = 0
+        self._buf = b""
+        self._keys: list[int] = []
+
+        now = datetime.now().replace(microsecond=0)
+        self._wall0 = time.monotonic()
+        self._dev0 = now - timedelta(minutes=int(history_minutes))
+        self._offset = timedelta(0)
+        self._start_session()
+        self.advance(int(history_minutes))
+
+    # MARK: clock + history
+    def now(self) -> datetime:
+        """The device clock."""
+        wall = timedelta(seconds=(time.monotonic() - self._wall0) * self.speed)
+        return self._dev0 + self._offset + wall
+
+    def _start_session(self) -> None:
+        self._logged = self.now().replace(microsecond=0)
+        self.flash.context(self._logged)
+        if self.note:
+            self.flash.note(self.note)
+
+    def _log_until_now(self) -> None:
+        n = int((self.now() - self._logged) // timedelta(minutes=1))
+        if n <= 0:
+            return
+        counts = self.source.counts(n)
+        self.flash.counts(counts)
+        self.last_cpm = int(counts[-1])
+        self._logged += timedelta(minutes=n)
+
+    def advance(self, minutes: float) -> None:
+        """Moves the clock ``minutes`` ahead, logging the readings in between."""
+        with self.lock:
+            self._offset += timedelta(minutes=minutes)
+            self._log_until_now()
+
+    # MARK: protocol
+    def feed(self, data: bytes) -> bytes:
+        """Takes bytes from the host, returns the replies to any whole commands."""
+        with self.lock:
+            self._buf += data
+            out = b""
+            while True:
+                start = self._buf.find(b"<")
+                if start < 0:
+                    self._buf = b""
+                    break
+                buf = self._buf[start:]
+                end = None
+                for name, size in PAYLOAD_SIZES.items():
+                    if buf[1 : 1 + len(name)] == name:
+                        end = 1 + len(name) + size + 2
+                        break
+                if end is None:
+                    end = buf.find(b">>") + 2
+                    if end == 1:
+                        end = None
+                if end is None or len(buf) < end:
+                    self._buf = buf
+                    break
+                out += self._handle(buf[1 : end - 2])
+                self._buf = buf[end:]
+            return out
+
+    def _handle(self, cmd: bytes) -> bytes:
+        self.commands += 1
+        self._log_until_now()
+
+        if cmd == b"GETVER":
+            return self.version
+        if cmd == b"GETSERIAL":
+            return self.serial
+        if cmd == b"GETCPM":
+            return struct.pack(">H", min(self.last_cpm, 2**16 - 1))
+        if cmd == b"GETVOLT":
+            return bytes([42])  # 4.2 V
+        if cmd == b"GETTEMP":
+            return bytes([21, 5, 0, 0xAA])  # 21.5 °C
+        if cmd == b"GETGYRO":
+            return struct.pack(">hhhB", 0, 0, 0, 0xAA)
+        if cmd == b"GETCFG":
+            return _config_bytes()
+        if cmd == b"GETDATETIME":
+            t = self.now()
+            return (
+                struct.pack(
+                    ">BBBBBB",
+                    t.year - 2000,
+                    t.month,
+                    t.day,
+                    t.hour,
+                    t.minute,
+                    t.second,
+                )
+                + b"\xaa"
+            )
+        if cmd.startswith(b"SETDATETIME"):
+            yy, mo, dd, hh, mi, ss = cmd[len(b"SETDATETIME") :]
+            target = datetime(2000 + yy, mo, dd, hh, mi, ss)
+            self._offset += target - self.now()
+            # The device stamps a fresh reference time after a clock change.
+            self._start_session()
+            return b"\xaa"
+        if cmd.startswith(b"SPIR"):
+            position = int.from_bytes(cmd[4:7], "big")
+            (size,) = struct.unpack(">H", cmd[7:9])
+            return self.flash.read(position, size)
+        if cmd.startswith(b"KEY") and cmd[3:].isdigit():
+            self._keys = (self._keys + [int(cmd[3:])])[-len(MENU_ERASE_KEYS) :]
+            if self._keys == MENU_ERASE_KEYS:
+                self.flash.erase()
+                self._start_session()
+                self._keys = []
+            return b""
+        # HEARTBEAT0/1, POWERON/OFF, REBOOT and anything unknown: no reply.
+        return b""
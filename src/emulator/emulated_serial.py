@@ -0,0 +1,77 @@
+import pygmc
+from . import EmulatedGMCSE
+
+
+class EmulatedSerial:
+    """
+    The bits of ``serial.Serial`` that pygmc's ``Connection`` uses, wired
+    straight to an ``EmulatedGMCSE`` instead of a port. Replies are available
+    as soon as the command is written, so nothing waits on a timeout.
+    """
+
+    def __init__(
+        self,
+        device: EmulatedGMCSE,
+        port: str = "emulator",
+        baudrate: int = 115200,
+        timeout: float = 5,
+    ):
+        self.device = device
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.is_open = True
+        self._rx = bytearray()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    @property
+    def out_waiting(self) -> int:
+        return 0
+
+    def write(self, data: bytes) -> int:
+        if not self.is_open:
+            raise OSError(f"{self.port} is closed")
+        self._rx += self.device.feed(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def read(self, size: int = 1) -> bytes:
+        out = bytes(self._rx[:size])
+        del self._rx[:size]
+        return out
+
+    def read_all(self) -> bytes:
+        return self.read(len(self._rx))
+
+    def read_until(self, expected: bytes = b"\n", size=None) -> bytes:
+        n = len(self._rx) if size is None else min(size, len(self._rx))
+        if expected:
+            at = self._rx.find(expected)
+            if 0 <= at < n:
+                n = at + len(expected)
+        return self.read(n)
+
+    def reset_input_buffer(self) -> None:
+        self._rx.clear()
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+def connect_emulated(device: EmulatedGMCSE, port: str = "emulator") -> pygmc.GMCSE:
+    """
+    A real ``pygmc.GMCSE`` talking to ``device`` in-process, e.g.
+    ``DeviceSession(connect=lambda: connect_emulated(device))``.
+    """
+    conn = pygmc.Connection(
+        port=port, baudrate=115200, serial_connection=EmulatedSerial(device, port)
+    )
+    return pygmc.GMCSE(port=None, connection=conn)
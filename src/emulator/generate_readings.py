@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+from . import CountSource
+
+
+def generate_readings(
+    start,
+    n: int,
+    source: Optional[CountSource] = None,
+    notes: Optional[str] = "emulator",
+) -> pd.DataFrame:
+    """
+    ``n`` one-minute readings from ``start`` (exclusive, like the device logs
+    the first count a minute after its reference time) with the GMC-SE CSV
+    columns. ``source`` supplies the counts; pass the same one across calls to
+    continue a series.
+    """
+    source = source or CountSource()
+    start = pd.Timestamp(start).floor("s")
+
+    return pd.DataFrame(
+        {
+            "datetime": start + pd.to_timedelta(np.arange(1, n + 1), unit="min"),
+            "count": source.counts(n),
+            "unit": "CPM",
+            "mode": "every minute",
+            "reference_datetime": start,
+            "notes": notes,
+        }
+    )
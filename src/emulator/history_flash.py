@@ -0,0 +1,77 @@
+import struct
+import numpy as np
+from datetime import datetime
+
+FLASH_SIZE = 2**21  # GMC-SE: 2 MiB
+FLASH_PAGE = 2**11  # what pygmc reads per <SPIR> call
+
+# Save modes as stored in the context record (see pygmc.HistoryParser).
+SAVE_MODES = {"every second": 1, "every minute": 2, "every hour": 3}
+
+
+class HistoryFlash:
+    """
+    The device's history memory in the format pygmc's ``HistoryParser``
+    reads: a ``55 AA 00`` context record (reference time and save mode), then
+    one byte per count, with ``55 AA 01``/``03`` prefixes for counts that
+    don't fit (or would read as a command) and ``55 AA 02`` for notes. Erased
+    memory is ``0xFF``; once full, new records are dropped like on the device.
+    """
+
+    def __init__(self, size: int = FLASH_SIZE):
+        self.data = bytearray(b"\xff" * size)
+        self.used = 0
+
+    def _write(self, b: bytes) -> bool:
+        if self.used + len(b) > len(self.data):
+            return False
+        self.data[self.used : self.used + len(b)] = b
+        self.used += len(b)
+        return True
+
+    def context(self, ref: datetime, mode: str = "every minute") -> None:
+        self._write(
+            b"\x55\xaa\x00"
+            + struct.pack(
+                ">BBBBBB",
+                ref.year - 2000,
+                ref.month,
+                ref.day,
+                ref.hour,
+                ref.minute,
+                ref.second,
+            )
+            + b"\x55\xaa"
+            + bytes([SAVE_MODES[mode]])
+        )
+
+    def note(self, text: str) -> None:
+        raw = text.encode("utf8")[:255]
+        self._write(b"\x55\xaa\x02" + bytes([len(raw)]) + raw)
+
+    def counts(self, values) -> None:
+        values = np.asarray(values, dtype=np.int64)
+        # 0x55 could start a command and 0xFF reads as erased memory, so only
+        # smaller counts other than 85 go in as a single byte.
+        plain = (values < 255) & (values != 0x55)
+        if plain.all():
+            self._write(values.astype(np.uint8).tobytes())
+            return
+        for v in values.tolist():
+            if v < 255 and v != 0x55:
+                ok = self._write(bytes([v]))
+            elif v < 2**16:
+                ok = self._write(b"\x55\xaa\x01" + struct.pack(">H", v))
+            else:
+                ok = self._write(b"\x55\xaa\x03" + min(v, 2**24 - 1).to_bytes(3, "big"))
+            if not ok:
+                return
+
+    def erase(self) -> None:
+        self.data[: self.used] = b"\xff" * self.used
+        self.used = 0
+
+    def read(self, position: int, size: int) -> bytes:
+        """``size`` bytes from ``position``, ``0xFF`` past the end."""
+        out = bytes(self.data[position : position + size])
+        return out + b"\xff" * (size - len(out))
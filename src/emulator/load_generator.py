@@ -0,0 +1,114 @@
+import argparse
+import os
+import time
+import pandas as pd
+from sqlalchemy.engine import Engine
+from typing import Callable, Optional
+from ..backend import (
+    get_engine,
+    db_ensure_natural_key,
+    db_is_partitioned,
+    db_ensure_partitions,
+    db_copy_readings,
+)
+from . import CountSource, generate_readings, write_daily_csvs
+
+
+def load_generator(
+    engine: Engine,
+    table: str,
+    start,
+    n: int,
+    source: Optional[CountSource] = None,
+    notes: Optional[str] = "emulator",
+    batch_rows: int = 500_000,
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Inserts ``n`` synthetic one-minute readings from ``start`` into ``table``,
+    ``batch_rows`` at a time through ``db_copy_readings`` (so millions of rows
+    never sit in memory at once). Missing monthly partitions for the whole
+    range are created first. ``on_batch`` is called with the running row
+    count after each batch. Returns rows, inserted, seconds and rows_per_sec.
+    """
+    source = source or CountSource()
+    start = pd.Timestamp(start).floor("s")
+    # generate_readings stamps readings 1..n minutes after start
+    end = start + pd.Timedelta(minutes=n)
+
+    db_ensure_natural_key(engine, table)
+    with engine.begin() as conn:
+        if db_is_partitioned(conn, table):
+            db_ensure_partitions(conn, table, start=start, end=end)
+
+    t = time.perf_counter()
+    inserted = 0
+    for i in range(0, n, batch_rows):
+        m = min(batch_rows, n - i)
+        df = generate_readings(start + pd.Timedelta(minutes=i), m, source, notes)
+        inserted += db_copy_readings(engine, table, df)
+        if on_batch is not None:
+            on_batch(i + m)
+    secs = time.perf_counter() - t
+
+    return {
+        "rows": n,
+        "inserted": inserted,
+        "seconds": secs,
+        "rows_per_sec": n / secs if secs > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic GMC-SE readings as daily CSVs or Postgres rows."
+    )
+    sub = parser.add_subparsers(dest="target", required=True)
+
+    csv = sub.add_parser("csv", help="write GMC-SE_YYYYMMDD.csv files")
+    csv.add_argument("directory", nargs="?", default="./data")
+    csv.add_argument("--days", type=int, default=7)
+
+    pg = sub.add_parser("pg", help="insert rows into Postgres (DATABASE_URL)")
+    pg.add_argument("--rows", type=int, default=1_000_000)
+    pg.add_argument("--table", default=os.getenv("GMC_TABLE", "public.gmc_readings"))
+    pg.add_argument("--batch-rows", type=int, default=500_000)
+
+    for p in (csv, pg):
+        p.add_argument("--start", help="first day (default: ends today)")
+        p.add_argument("--cpm", type=float, default=20.0)
+        p.add_argument("--spike-every", type=float, help="mean minutes between spikes")
+        p.add_argument("--spike-cpm", type=float, default=400.0)
+        p.add_argument("--spike-minutes", type=int, default=5)
+        p.add_argument("--notes", default="emulator")
+        p.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    source = CountSource(
+        args.cpm, args.spike_every, args.spike_cpm, args.spike_minutes, args.seed
+    )
+    today = pd.Timestamp.now().normalize()
+
+    if args.target == "csv":
+        start = args.start or today - pd.Timedelta(days=args.days - 1)
+        paths = write_daily_csvs(args.directory, start, args.days, source, args.notes)
+        print(f"Wrote {len(paths)} file(s) to {args.directory}.")
+    else:
+        start = args.start or pd.Timestamp.now() - pd.Timedelta(minutes=args.rows)
+        s = load_generator(
+            get_engine(),
+            args.table,
+            start,
+            args.rows,
+            source,
+            args.notes,
+            args.batch_rows,
+            on_batch=lambda done: print(
+                f"\r{done:,}/{args.rows:,} rows", end="", flush=True
+            ),
+        )
+        print()
+        print(
+            f"{s['inserted']:,}/{s['rows']:,} rows inserted in {s['seconds']:.2f}s "
+            f"({s['rows_per_sec']:,.0f} rows/sec)."
+        )
@@ -0,0 +1,83 @@
+import argparse
+import os
+import threading
+import time
+from typing import Optional
+from . import EmulatedGMCSE, CountSource
+
+
+def serve_pty(device: EmulatedGMCSE, baudrate: Optional[int] = None) -> str:
+    """
+    Serves ``device`` on a new pseudo-terminal (Linux/macOS) from a daemon
+    thread and returns the port to open, e.g. ``/dev/pts/7``. Point
+    ``GMC_DEVICE_PORT`` at it and the device scripts use it like a real
+    counter, through pyserial and all. With ``baudrate`` replies are paced
+    like a serial line at that speed (10 bits a byte) instead of arriving
+    at once.
+    """
+    import tty
+
+    master, slave = os.openpty()
+    tty.setraw(slave)  # no echo or line editing, the protocol is binary
+    port = os.ttyname(slave)
+
+    def run():
+        # ``slave`` stays open here so reads don't fail between clients.
+        while True:
+            try:
+                data = os.read(master, 4096)
+            except OSError:
+                time.sleep(0.05)
+                continue
+            reply = device.feed(data)
+            if reply:
+                if baudrate:
+                    time.sleep(len(reply) * 10 / baudrate)
+                os.write(master, reply)
+
+    threading.Thread(target=run, name="gmc-emulator", daemon=True).start()
+
+    return port
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Emulated GMC-SE on a pseudo-terminal for testing without a counter."
+    )
+    parser.add_argument("--cpm", type=float, default=20.0, help="mean counts/minute")
+    parser.add_argument(
+        "--spike-every", type=float, help="mean minutes between spikes (default: none)"
+    )
+    parser.add_argument("--spike-cpm", type=float, default=400.0)
+    parser.add_argument("--spike-minutes", type=int, default=5)
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="clock speed-up, 60 = a minute/sec"
+    )
+    parser.add_argument(
+        "--history-minutes", type=int, default=0, help="history to pre-fill"
+    )
+    parser.add_argument(
+        "--baud", type=int, help="pace replies like a serial line at this speed"
+    )
+    parser.add_argument("--note", default="emulator")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    device = EmulatedGMCSE(
+        CountSource(
+            args.cpm, args.spike_every, args.spike_cpm, args.spike_minutes, args.seed
+        ),
+        speed=args.speed,
+        history_minutes=args.history_minutes,
+        note=args.note or None,
+    )
+    port = serve_pty(device, args.baud)
+    print(f"Emulated GMC-SE on {port}  (export GMC_DEVICE_PORT={port})", flush=True)
+
+    while True:
+        time.sleep(60)
+        print(
+            f"{device.now():%Y-%m-%d %H:%M}  {device.commands:,} commands, "
+            f"{device.flash.used:,} history bytes",
+            flush=True,
+        )
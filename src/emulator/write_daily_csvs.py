@@ -0,0 +1,32 @@
+import os
+import pandas as pd
+from typing import Optional
+from . import CountSource, generate_readings
+
+
+def write_daily_csvs(
+    directory: str,
+    start,
+    days: int,
+    source: Optional[CountSource] = None,
+    notes: Optional[str] = "emulator",
+    base_filename: str = "GMC-SE",
+) -> list[str]:
+    """
+    Writes ``days`` days of readings from ``start`` as one
+    ``<base_filename>_YYYYMMDD.csv`` per day, laid out like pygmc's
+    ``save_history_csv`` (what ``daily_live_file.py`` produces). Returns the
+    paths written.
+    """
+    source = source or CountSource()
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for day in pd.date_range(pd.Timestamp(start).normalize(), periods=days, freq="D"):
+        # 00:00 through 23:59, continuing the series from the day before.
+        df = generate_readings(day - pd.Timedelta(minutes=1), 24 * 60, source, notes)
+        path = os.path.join(directory, f"{base_filename}_{day:%Y%m%d}.csv")
+        df.to_csv(path, index=False, date_format="%Y-%m-%d %H:%M:%S")
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,137 @@
+import os
+import time
+import pandas as pd
+from schedule import every, repeat, run_pending
+from utilities import get_device_session
+from backend import get_engine, quote_table, db_ensure_natural_key, db_insert_readings
+
+TABLE = os.getenv("GMC_TABLE", "public.gmc_readings")
+POLL_SECS = int(os.getenv("GMC_INGEST_POLL_SECS", "10"))
+STATE_PATH = os.getenv("GMC_INGEST_STATE", "./data/.ingest_hwm")
+SPOOL_PATH = os.getenv("GMC_INGEST_SPOOL", "./data/.ingest_spool.csv")
+
+COLUMNS = ["datetime", "count", "unit", "mode", "reference_datetime", "notes"]
+
+_hwm = None  # newest reading datetime already stored (in DB or spool)
+_polled = False  # the first poll re-reads the device's whole history
+
+
+def _read_state() -> pd.Timestamp | None:
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            return pd.Timestamp(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_state(hwm: pd.Timestamp) -> None:
+    tmp = f"{STATE_PATH}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(hwm.isoformat())
+    os.replace(tmp, STATE_PATH)
+
+
+def _spool_append(df: pd.DataFrame) -> None:
+    """Buffer readings locally while the DB is unreachable."""
+    header = not os.path.exists(SPOOL_PATH)
+    df[COLUMNS].to_csv(SPOOL_PATH, mode="a", header=header, index=False)
+
+
+def _spool_flush(engine) -> int:
+    """Send buffered readings to the DB, then drop the spool file."""
+    if not os.path.exists(SPOOL_PATH):
+        return 0
+    spool = pd.read_csv(
+        SPOOL_PATH, parse_dates=["datetime", "reference_datetime"], encoding="utf-8"
+    )
+    n = db_insert_readings(engine, TABLE, spool)
+    os.remove(SPOOL_PATH)
+    return n
+
+
+def _db_hwm(engine) -> pd.Timestamp | None:
+    with engine.begin() as conn:
+        return pd.to_datetime(
+            conn.exec_driver_sql(
+                f'SELECT MAX("datetime") FROM {quote_table(TABLE)}'
+            ).scalar()
+        )
+
+
+def _start() -> None:
+    """Pick up the high-water mark from the state file and/or the DB."""
+    global _hwm
+    _hwm = _read_state()
+    try:
+        engine = get_engine()
+        db_ensure_natural_key(engine, TABLE)
+        db_hwm = _db_hwm(engine)
+        if db_hwm is not None and not pd.isna(db_hwm):
+            _hwm = db_hwm if _hwm is None else max(_hwm, db_hwm)
+    except Exception as e:
+        print(f"DB unavailable at start ({e}); using local state only.")
+
+
+@repeat(every(POLL_SECS).seconds)
+def ingest_device():
+    """
+    Polls the device and writes the new readings straight into Postgres.
+    The first poll after a (re)start re-reads the device's whole history, so
+    readings at or before the high-water mark are dropped there instead of
+    being sent again. On later polls they are inserted (device clock set back)
+    and duplicates are skipped on the (datetime, notes) natural key. If the DB
+    is down the readings go to a local spool file and are flushed on the next
+    successful poll.
+    """
+    global _hwm, _polled
+
+    try:
+        # Only the records written since the last poll come off the device
+        # (all of them on the first poll or after the history was erased).
+        rows = get_device_session().read_new()
+    except Exception as e:
+        print(f"Device read failed ({e}); retrying next poll.")
+        return
+
+    if not rows:
+        return
+
+    new = pd.DataFrame(rows, columns=COLUMNS)
+    new["datetime"] = pd.to_datetime(new["datetime"])
+
+    behind = new["datetime"] <= _hwm if _hwm is not None else None
+    if behind is not None and behind.any():
+        if not _polled:
+            # Already stored before the restart
+            new = new.loc[~behind]
+        else:
+            print(
+                f"{int(behind.sum())} reading(s) at or before {_hwm} (device clock "
+                "set back?); inserting them, duplicates are skipped."
+            )
+    _polled = True
+
+    if new.empty:
+        return
+
+    try:
+        engine = get_engine()
+        flushed = _spool_flush(engine)
+        n = db_insert_readings(engine, TABLE, new)
+        print(f"Inserted {n} new reading(s) ({flushed} from spool).")
+    except Exception as e:
+        _spool_append(new)
+        print(f"DB unavailable ({e}); spooled {len(new)} reading(s).")
+
+    newest = new["datetime"].max()
+    if _hwm is None or newest > _hwm:
+        _hwm = newest
+        _write_state(_hwm)
+
+
+if __name__ == "__main__":
+    _start()
+    ingest_device()
+    while True:
+        run_pending()
+        time.sleep(1)
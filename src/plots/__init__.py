@@ -1,8 +1,11 @@
-from .fig_time_series import fig_time_series
+from .lttb import lttb
+from .fig_time_series import fig_time_series, PLOT_POINTS
 from .fig_cpm_distribution import fig_cpm_distribution
 
 
 __all__ = [
+    "lttb",
+    "PLOT_POINTS",
     "fig_time_series",
     "fig_cpm_distribution",
 ]
@@ -1,14 +1,36 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 
 
-def fig_cpm_distribution(df: pd.DataFrame, bgcolor: str) -> go.Figure:
+def fig_cpm_distribution(hist: pd.Series, bgcolor: str, nbins: int = 40) -> go.Figure:
     """
     Generates a plotly graph object figure to visualize the CPM Distribution of a passed dataframe. In layman's terms the frequency of which a specific CPM number appears in the passed dataframe. EG: 5 counts of 15CPM, 2 counts of 20CPM, etc...
+
+    Takes the readings per CPM value (``count_histogram`` /
+    ``db_count_histogram``) and draws up to ``nbins`` pre-aggregated bars, so
+    the figure's size depends on the bins, not on the number of readings.
     """
+    fig = go.Figure()
+
+    if not hist.empty:
+        values = hist.index.to_numpy(dtype=np.int64)
+        lo, hi = values.min(), values.max()
+        width = max(1, -(-(hi - lo + 1) // nbins))  # ceil, whole CPM per bin
+        bins = (values - lo) // width
+        freq = np.bincount(bins, weights=hist.to_numpy())
+        left = lo + np.arange(len(freq)) * width
 
-    fig = px.histogram(df, x="count", nbins=40)
+        fig.add_trace(
+            go.Bar(
+                x=left + (width - 1) / 2,
+                y=freq,
+                width=width,
+                customdata=np.stack([left, left + width - 1], axis=-1),
+                hovertemplate="CPM %{customdata[0]}–%{customdata[1]}: %{y}<extra></extra>",
+                name="Readings",
+            )
+        )
 
     fig.update_layout(
         template="plotly_dark",
@@ -17,5 +39,6 @@ def fig_cpm_distribution(df: pd.DataFrame, bgcolor: str) -> go.Figure:
         margin=dict(l=20, r=20, t=40, b=30),
         xaxis_title="CPM",
         yaxis_title="Frequency",
+        bargap=0.05,
     )
     return fig
@@ -1,28 +1,82 @@
 import pandas as pd
 import plotly.graph_objects as go
+from . import lttb
 
+# Roughly what a wide chart can show; larger frames are decimated to this.
+PLOT_POINTS = 2000
 
-def fig_time_series(df: pd.DataFrame, bgcolor: str) -> go.Figure:
+# Above this many points per trace switch to WebGL (Scattergl).
+GL_THRESHOLD = 1000
+
+
+def fig_time_series(
+    df: pd.DataFrame,
+    bgcolor: str,
+    max_points: int = PLOT_POINTS,
+    gl_threshold: int = GL_THRESHOLD,
+) -> go.Figure:
     """
     Generates a plotly graph object figure to visualize a time series of
     CPM, µSv/hr, and the rolling CPM over the length of time present in the passed dataframe.
+    Frames longer than ``max_points`` are decimated with LTTB (keeping each
+    bucket's highest CPM so spikes stay), and traces switch to WebGL above
+    ``gl_threshold`` points, so the figure stays the same size whatever the
+    selected range.
     """
     fig = go.Figure()
 
+    if not df.empty and len(df) > max_points:
+        peak_col = "count_max" if "count_max" in df.columns else "count"
+        idx = lttb(
+            df["datetime"].to_numpy().view("i8"),
+            df["count"].to_numpy(),
+            max(max_points // 2, 3),
+            peaks=df[peak_col].to_numpy(),
+        )
+        df = df.iloc[idx]
+
+    Scatter = go.Scattergl if len(df) > gl_threshold else go.Scatter
+
+    if df.empty:
+        df = pd.DataFrame({"datetime": [], "count": []})
+
+    # Bucketed frames: shade the min/max envelope so spikes stay visible.
+    if "count_min" in df.columns and "count_max" in df.columns:
+        fig.add_trace(
+            Scatter(
+                x=df["datetime"],
+                y=df["count_max"],
+                mode="lines",
+                line=dict(width=0),
+                name="CPM max",
+                showlegend=False,
+            )
+        )
+        fig.add_trace(
+            Scatter(
+                x=df["datetime"],
+                y=df["count_min"],
+                mode="lines",
+                line=dict(width=0),
+                fill="tonexty",
+                name="CPM min/max",
+            )
+        )
+
     fig.add_trace(
-        go.Scatter(x=df["datetime"], y=df["count"], mode="lines+markers", name="CPM")
+        Scatter(x=df["datetime"], y=df["count"], mode="lines+markers", name="CPM")
     )
 
     if "rolling_cpm" in df.columns:
         fig.add_trace(
-            go.Scatter(
+            Scatter(
                 x=df["datetime"], y=df["rolling_cpm"], mode="lines", name="Rolling CPM"
             )
         )
 
     if "usv_hr" in df.columns:
         fig.add_trace(
-            go.Scatter(
+            Scatter(
                 x=df["datetime"],
                 y=df["usv_hr"],
                 mode="lines",
@@ -0,0 +1,51 @@
+import numpy as np
+from typing import Optional
+
+
+def lttb(
+    x: np.ndarray, y: np.ndarray, n_out: int, peaks: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling. Returns the sorted row
+    indices to plot: the first and last point plus, for each of ``n_out - 2``
+    buckets, the point forming the largest triangle with the previously kept
+    point and the next bucket's average, so the shape of the line survives.
+
+    If ``peaks`` is given (e.g. the counts), each bucket's highest point in it
+    is kept as well, so a short spike is never averaged or skipped away. That
+    can return up to ``2 * n_out - 2`` indices.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x).astype("float64")
+    y = np.asarray(y, dtype="float64")
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    spikes = []
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(hi, edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+
+        if peaks is not None:
+            spikes.append(lo + int(np.argmax(peaks[lo:hi])))
+
+    if spikes:
+        keep = np.union1d(keep, spikes)
+
+    return keep
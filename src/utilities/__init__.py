@@ -1,3 +1,15 @@
+from .history_reader import HistoryReader, HISTORY_COLUMNS, HISTORY_CHUNK
+from .device_session import (
+    DeviceSession,
+    DEVICE_PORT,
+    DEVICE_BAUDRATE,
+    DEVICE_RETRIES,
+    DEVICE_BACKOFF,
+    DEVICE_LOCK_PATH,
+    DEVICE_KEEP_OPEN,
+    DEVICE_ERRORS,
+)
+from .get_device_session import get_device_session
 from .device_info import device_info
 from .get_history_length import get_history_length
 from .erase_history import erase_history
@@ -7,6 +19,18 @@ from .set_device_clock import set_device_clock
 
 
 __all__ = [
+    "HistoryReader",
+    "HISTORY_COLUMNS",
+    "HISTORY_CHUNK",
+    "DeviceSession",
+    "DEVICE_PORT",
+    "DEVICE_BAUDRATE",
+    "DEVICE_RETRIES",
+    "DEVICE_BACKOFF",
+    "DEVICE_LOCK_PATH",
+    "DEVICE_KEEP_OPEN",
+    "DEVICE_ERRORS",
+    "get_device_session",
     "device_info",
     "get_history_length",
     "erase_history",
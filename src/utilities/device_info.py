@@ -1,38 +1,12 @@
-import pygmc
-from typing import Any
+from typing import Any, Optional
+from . import DeviceSession, get_device_session
 
 
-def device_info() -> dict[str, dict[str, Any]]:
+def device_info(session: Optional[DeviceSession] = None) -> dict[str, dict[str, Any]]:
     """Returns a dictionary of device info."""
-    gc = pygmc.GMCSE(port="COM3")
-    # gc = pygmc.connect()  # More generic, loses reference in IDE.
-
-    conn_details = gc.get_connection_details()
-
-    device_info: dict[str, dict[str, Any]] = {
-        "device_details": {
-            "version": gc.get_version(),
-            "serial_number": gc.get_serial(),
-        },
-        "com_port_details": {
-            "port": conn_details["port"],
-            "baudrate": conn_details["baudrate"],
-            "timeout": conn_details["timeout"],
-            "open": conn_details["is_open"],
-            "in_waiting": conn_details["in_waiting"],
-            "out_waiting": conn_details["out_waiting"],
-        },
-        "sensor_readings": {
-            "voltage": gc.get_voltage(),
-            "temp": gc.get_temp(),
-            "gyroscope": gc.get_gyro(),
-            "RTC": gc.get_datetime(),
-            "CPM": gc.get_cpm(),
-            "μSv_hr": gc.get_usv_h(),
-        },
-    }
-
-    return device_info
+    session = session or get_device_session()
+
+    return session.info()
 
 
 if __name__ == "__main__":
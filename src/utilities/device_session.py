@@ -0,0 +1,287 @@
+import csv
+import logging
+import os
+import struct
+import threading
+import pygmc
+import pandas as pd
+from datetime import datetime
+from time import sleep
+from typing import Any, Callable, Optional
+from . import HistoryReader, HISTORY_COLUMNS
+
+try:
+    import fcntl
+except ImportError:  # Windows: a COM port can only be open in one process
+    fcntl = None  # at a time, so the port itself is the cross-process lock.
+
+logger = logging.getLogger(__name__)
+
+# Serial port of the device, e.g. COM3 on Windows or /dev/ttyUSB0 on Linux.
+DEVICE_PORT = os.getenv("GMC_DEVICE_PORT", "COM3")
+DEVICE_BAUDRATE = int(os.getenv("GMC_DEVICE_BAUDRATE", "115200"))
+# Reconnect attempts per operation and the first wait between them (doubles).
+DEVICE_RETRIES = int(os.getenv("GMC_DEVICE_RETRIES", "4"))
+DEVICE_BACKOFF = float(os.getenv("GMC_DEVICE_BACKOFF", "1.0"))
+# Lock file shared by every process talking to the device (posix only).
+DEVICE_LOCK_PATH = os.getenv("GMC_DEVICE_LOCK", "./data/.device.lock")
+# Keep the port open between operations (only when a single process uses it).
+DEVICE_KEEP_OPEN = os.getenv("GMC_DEVICE_KEEP_OPEN", "0") == "1"
+
+# What a dropped or confused connection raises: serial/OS errors, and garbled
+# or short replies pygmc fails to decode.
+DEVICE_ERRORS = (OSError, RuntimeError, ValueError, IndexError, struct.error)
+
+# Menu key strokes to get to "erase history" and back out again.
+ERASE_KEYS = [3, 2, 2, 3, 2, 2, 2, 2, 3]
+EXIT_KEYS = [2, 3, 2, 2, 2, 2, 2, 3]
+
+
+class DeviceSession:
+    """
+    The connection to the GMC-SE, shared by everything in the process.
+    Operations are serialized with a lock, and with a lock file across
+    processes where ``fcntl`` exists. The port is opened (and the
+    version/serial handshake done) when the lock is taken and closed again
+    when it is released, so the scripts running side by side (and on Windows,
+    where only one process can have a COM port open) each get their turn;
+    ``keep_open`` leaves it open for a process that has the device to itself.
+    A failed operation gets a fresh connection and is retried with
+    exponential backoff, up to ``retries`` times.
+
+    Use it as a context manager to hold the lock (and the port) over several
+    operations::
+
+        with session:
+            session.save_log()
+            session.erase_history()
+
+    ``connect`` builds the pygmc device and defaults to
+    ``pygmc.GMCSE(port=port, baudrate=baudrate)``.
+    """
+
+    def __init__(
+        self,
+        port: str = DEVICE_PORT,
+        baudrate: int = DEVICE_BAUDRATE,
+        retries: int = DEVICE_RETRIES,
+        backoff: float = DEVICE_BACKOFF,
+        max_backoff: float = 30.0,
+        lock_path: Optional[str] = DEVICE_LOCK_PATH,
+        connect: Optional[Callable[[], Any]] = None,
+        keep_open: bool = DEVICE_KEEP_OPEN,
+    ):
+        self.port = port
+        self.baudrate = baudrate
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lock_path = lock_path
+        self.keep_open = keep_open
+        self.connect = connect or (
+            lambda: pygmc.GMCSE(port=self.port, baudrate=self.baudrate)
+        )
+
+        self.gc = None
+        self.version = None
+        self.serial = None
+        self.handshakes = 0
+        self.reader = HistoryReader()
+        self._log = None  # what save_log last wrote, to append to it next time
+
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._lock_file = None
+
+    # MARK: locking
+    def __enter__(self) -> "DeviceSession":
+        self._lock.acquire()
+        self._depth += 1
+        if self._depth == 1 and fcntl is not None and self.lock_path:
+            try:
+                os.makedirs(
+                    os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True
+                )
+                self._lock_file = open(self.lock_path, "a")
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            except BaseException:
+                self._release_file()
+                self._depth -= 1
+                self._lock.release()
+                raise
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            if not self.keep_open:
+                self.close()
+            self._release_file()
+        self._lock.release()
+
+    def _release_file(self) -> None:
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    # MARK: connection
+    def _open(self) -> None:
+        gc = self.connect()
+        self.version = gc.get_version()
+        self.serial = gc.get_serial()
+        self.handshakes += 1
+        self.gc = gc
+
+    def close(self) -> None:
+        """Closes the port; the next operation reopens it."""
+        with self._lock:
+            if self.gc is not None:
+                try:
+                    self.gc.connection.close_connection()
+                except Exception:
+                    pass
+            self.gc = None
+
+    def call(self, fn: Callable[[Any], Any], retry: bool = True) -> Any:
+        """
+        Runs ``fn(device)`` under the lock, (re)connecting first if needed. On
+        a serial/OS error or a reply that can't be decoded (``DEVICE_ERRORS``)
+        the port is closed, so the retry starts from a clean connection, and
+        the call retried after ``backoff``, ``2 * backoff``, ... seconds
+        (capped at ``max_backoff``).
+        With ``retry=False`` only the connect is retried, not a failed ``fn``
+        (for key sequences that can't safely start over half way through).
+        """
+        with self:
+            for attempt in range(self.retries + 1):
+                started = False
+                try:
+                    if self.gc is None:
+                        self._open()
+                    started = True
+                    return fn(self.gc)
+                except DEVICE_ERRORS as e:
+                    self.close()
+                    if attempt == self.retries or (started and not retry):
+                        raise
+                    wait = min(self.backoff * 2**attempt, self.max_backoff)
+                    logger.warning(
+                        "Device error on %s (%s); retrying in %gs.", self.port, e, wait
+                    )
+                    sleep(wait)
+
+    # MARK: operations
+    def info(self) -> dict[str, dict[str, Any]]:
+        """Device, port and sensor details (see ``device_info``)."""
+
+        def read(gc):
+            conn_details = gc.get_connection_details()
+            return {
+                "device_details": {
+                    "version": self.version,
+                    "serial_number": self.serial,
+                },
+                "com_port_details": {
+                    "port": conn_details["port"],
+                    "baudrate": conn_details["baudrate"],
+                    "timeout": conn_details["timeout"],
+                    "open": conn_details["is_open"],
+                    "in_waiting": conn_details["in_waiting"],
+                    "out_waiting": conn_details["out_waiting"],
+                },
+                "sensor_readings": {
+                    "voltage": gc.get_voltage(),
+                    "temp": gc.get_temp(),
+                    "gyroscope": gc.get_gyro(),
+                    "RTC": gc.get_datetime(),
+                    "CPM": gc.get_cpm(),
+                    "μSv_hr": gc.get_usv_h(),
+                },
+            }
+
+        return self.call(read)
+
+    def read_new(self) -> list[tuple]:
+        """
+        Reads only the history written since the last read (see
+        ``HistoryReader``) and returns the new rows.
+        """
+        return self.call(self.reader.poll)
+
+    def history(self) -> list:
+        """The device's history as rows, the first row being the column names."""
+        with self:
+            self.read_new()
+            return [list(HISTORY_COLUMNS)] + self.reader.rows
+
+    def history_df(self) -> pd.DataFrame:
+        """The device's history as a dataframe (see ``get_history_df``)."""
+        history = self.history()
+        return pd.DataFrame(history[1:], columns=history[0])
+
+    def history_length(self) -> int:
+        """Row count of the device's history log (including the header row)."""
+        with self:
+            self.read_new()
+            return len(self.reader.rows) + 1
+
+    def save_log(self, base_filename="GMC-SE", data_dir="./data/") -> str:
+        """
+        Writes the history to ``<data_dir><base_filename>_YYYYMMDD.csv`` in
+        pygmc's ``save_history_csv`` layout. When the file is still the one
+        written last time only the new rows are appended to it.
+        """
+        ds = datetime.now().strftime("_%Y%m%d")  # Suffix _YYYYMMDD
+        file = f"{data_dir}{base_filename}{ds}.csv"
+
+        with self:
+            self.read_new()
+            rows = self.reader.rows
+            log = self._log
+            append = (
+                log is not None
+                and log["file"] == file
+                and log["resets"] == self.reader.resets
+                and os.path.exists(file)
+                and os.path.getsize(file) == log["size"]
+            )
+            with open(file, "a" if append else "w", newline="") as f:
+                writer = csv.writer(f, delimiter=",")
+                if append:
+                    writer.writerows(rows[log["rows"] :])
+                else:
+                    writer.writerow(HISTORY_COLUMNS)
+                    writer.writerows(rows)
+            self._log = {
+                "file": file,
+                "resets": self.reader.resets,
+                "rows": len(rows),
+                "size": os.path.getsize(file),
+            }
+
+        return file
+
+    def set_clock(self) -> None:
+        """Sets the device's RTC to the local time."""
+        self.call(lambda gc: gc.set_datetime())
+
+    def erase_history(self) -> None:
+        """Walks the device menu to "erase history" (see ``erase_history``)."""
+
+        def erase(gc):
+            # Get to erase history menu item enter and wait 10s.
+            for i in ERASE_KEYS:
+                print(i)
+                gc.send_key(i)
+                sleep(0.5)
+            sleep(10.0)
+
+            # Exit menu
+            for i in EXIT_KEYS:
+                print(i)
+                gc.send_key(i)
+                sleep(0.5)
+
+        self.call(erase, retry=False)
+        self.reader.reset()
@@ -1,8 +1,12 @@
-import pygmc
-from datetime import datetime
+from typing import Optional
+from . import DeviceSession, get_device_session
 
 
-def get_device_log(base_filename="GMC-SE", data_dir="./data/") -> None:
+def get_device_log(
+    base_filename="GMC-SE",
+    data_dir="./data/",
+    session: Optional[DeviceSession] = None,
+) -> None:
     """
     Pulls device's log and writes it to GMC-SE_YYYYMMDD.csv in the repo's data dir.
 
@@ -10,19 +14,13 @@ def get_device_log(base_filename="GMC-SE", data_dir="./data/") -> None:
     base_filename (str): Optional, base filename. Default: ``GMC-SE``.
 
     data_dir (str): Optional, path to where we write the file. Default: ``./data/``
-    """
-    gc = pygmc.GMCSE(port="COM3")
-    # gc = pygmc.connect()  # More generic, loses reference in IDE.
 
-    gc.get_version()
-    gc.get_serial()
+    session (DeviceSession): Optional, defaults to the shared session.
+    """
+    session = session or get_device_session()
 
     # Pull log from GMC-SE
-    # ds = datetime.now().strftime("_%Y%m%d_%H%M%S") # Suffix _YYYYMMDD_HHMMSS
-    ds = datetime.now().strftime("_%Y%m%d")  # Suffix _YYYYMMDD
-    filename = f"{base_filename}{ds}.csv"
-    file = f"{data_dir}{filename}"
-    gc.save_history_csv(file)
+    file = session.save_log(base_filename, data_dir)
     print(f"{file} has been written!")
 
     # gc.heartbeat_live_print()
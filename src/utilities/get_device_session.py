@@ -0,0 +1,23 @@
+import threading
+from typing import Optional
+from . import DeviceSession, DEVICE_PORT
+
+# One session (and history reader) per port for the whole process.
+_SESSIONS: dict[str, DeviceSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_device_session(port: Optional[str] = None) -> DeviceSession:
+    """
+    Returns the process-wide ``DeviceSession`` for ``port`` (default
+    ``GMC_DEVICE_PORT``, else ``COM3``), creating it on first use.
+    """
+    port = port or DEVICE_PORT
+
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(port)
+        if session is None:
+            session = DeviceSession(port=port)
+            _SESSIONS[port] = session
+
+    return session
@@ -1,25 +1,21 @@
-import pygmc
 import pandas as pd
+from typing import Optional
+from . import DeviceSession, get_device_session
 
 
-def get_history_df() -> pd.DataFrame:
+def get_history_df(session: Optional[DeviceSession] = None) -> pd.DataFrame:
     """
     Fetches device's history as a list of tuples where the first row is column names and converts it to a pandas dataframe. Since the device's onboard ram is only 2MB with data logging size capped around 300KB before I started noticing issues with fetching the data from the device we can get away with just returning the pandas dataframe.
 
+    Only the history written since the session's last read goes over the
+    serial line (see ``HistoryReader``); the rest comes from its copy.
+
     Returns:
     df (DataFrame): Columns: "datetime", "count", "unit", "mode", "reference_datetime", "notes"
     """
-    gc = pygmc.GMCSE(port="COM3")
-    # gc = pygmc.connect()  # More generic, loses reference in IDE.
-
-    gc.get_version()
-    gc.get_serial()
-
-    history = gc.get_history_data()
-
-    df = pd.DataFrame(history[1:], columns=history[0])
+    session = session or get_device_session()
 
-    return df
+    return session.history_df()
 
 
 if __name__ == "__main__":
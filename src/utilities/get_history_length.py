@@ -1,18 +1,15 @@
-import pygmc
+from typing import Optional
+from . import DeviceSession, get_device_session
 
 
-def get_history_length() -> int:
+def get_history_length(session: Optional[DeviceSession] = None) -> int:
     """
-    Returns the current row count of the device's history log.
+    Returns the current row count of the device's history log. After the first
+    call this only reads the records written since the last one.
     """
-    gc = pygmc.GMCSE(port="COM3")
-    # gc = pygmc.connect()  # More generic, loses reference in IDE.
+    session = session or get_device_session()
 
-    gc.get_version()
-    gc.get_serial()
-
-    history = gc.get_history_data()
-    row_count = len(history)
+    row_count = session.history_length()
     print(f"Current row count: {row_count}")
     return row_count
 
@@ -0,0 +1,160 @@
+import os
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+HISTORY_COLUMNS = ["datetime", "count", "unit", "mode", "reference_datetime", "notes"]
+
+# Bytes read per poll once caught up; doubles up to a flash page while every
+# read comes back full.
+HISTORY_CHUNK = int(os.getenv("GMC_HISTORY_CHUNK", "256"))
+FLASH_PAGE = 2**11
+FLASH_SIZE = 2**21  # GMC-SE
+
+# The first context record (55 AA 00 + 9 bytes), re-read every poll to notice
+# the history being erased or rewritten.
+HEADER_BYTES = 12
+
+# save mode byte of a context record -> (unit, mode), as pygmc reads them
+SAVE_MODES = {
+    0: ("OFF", "off"),
+    1: ("CPS", "every second"),
+    2: ("CPM", "every minute"),
+    3: ("CPM", "every hour"),
+    4: ("CPS", "every second - threshold"),
+    5: ("CPM", "every minute - threshold"),
+}
+
+STEPS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+}
+
+
+class HistoryReader:
+    """
+    Keeps a decoded copy of the device's history and, on each ``poll()``,
+    reads only the flash written since the last one (``<SPIR>`` from the
+    last position instead of every page from 0). Records are decoded the way
+    pygmc's ``HistoryParser`` does, but the decoder state carries over between
+    polls. A record cut off at the end of what's written so far (or a trailing
+    ``0xFF``, which looks like erased flash) is picked up on the next poll.
+    If the first record changes (history erased) the copy starts over.
+    """
+
+    def __init__(self, chunk_size: int = HISTORY_CHUNK, flash_size: int = FLASH_SIZE):
+        self.chunk_size = chunk_size
+        self.flash_size = flash_size
+        self.bytes_read = 0
+        self.resets = 0  # bumped whenever the copy starts over
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything read so far; the next poll starts from 0."""
+        self.resets += 1
+        self.position = 0
+        self.header = None
+        self.rows: list[tuple] = []
+        self._dt: Optional[datetime] = None
+        self._unit = None
+        self._mode = None
+        self._ref = None
+        self._note = None
+
+    def _read(self, gc: Any, position: int, size: int) -> bytes:
+        data = gc._read_history_position(position, size)
+        self.bytes_read += len(data)
+        return data
+
+    def poll(self, gc: Any) -> list[tuple]:
+        """Reads what's new from ``gc`` (a pygmc device); returns the new rows."""
+        head = self._read(gc, 0, HEADER_BYTES)
+        # The header may only have been partly written last time.
+        known = (self.header or b"").rstrip(b"\xff")
+        if self.header is None or not head.startswith(known):
+            self.reset()
+        self.header = head
+
+        first = len(self.rows)
+        size = self.chunk_size
+        while self.position < self.flash_size:
+            size = min(size, self.flash_size - self.position)
+            chunk = self._read(gc, self.position, size)
+            data = chunk.rstrip(b"\xff")
+            self.position += self._decode(data)
+            if len(data) < len(chunk):
+                break  # reached the unwritten part
+            size = min(size * 2, FLASH_PAGE)
+
+        return self.rows[first:]
+
+    # MARK: decoding
+    def _context(self, data: bytes) -> None:
+        if data[8] in SAVE_MODES:
+            self._unit, self._mode = SAVE_MODES[data[8]]
+            self._ref = datetime(2000 + data[0], *data[1:6])
+        else:
+            self._unit, self._mode, self._ref = "Unknown", "Unknown", None
+        self._dt = self._ref
+
+    def _count(self, n: int) -> None:
+        if self._dt is None:
+            return
+        for unit, step in STEPS.items():
+            if unit in self._mode:
+                self._dt += step
+                break
+        self.rows.append((self._dt, n, self._unit, self._mode, self._ref, self._note))
+        self._note = None
+
+    def _decode(self, data: bytes) -> int:
+        """Decodes whole records from ``data``; returns how many bytes it used."""
+        i, end = 0, len(data)
+        while i < end:
+            b = data[i]
+            if b != 0x55:
+                self._count(b)
+                i += 1
+                continue
+            if i + 1 >= end:
+                break
+            if data[i + 1] != 0xAA:
+                self._count(b)
+                self._count(data[i + 1])
+                i += 2
+                continue
+            if i + 2 >= end:
+                break
+            kind = data[i + 2]
+            body = i + 3
+            if kind == 0:
+                if body + 9 > end:
+                    break
+                self._context(data[body : body + 9])
+                i = body + 9
+            elif kind in (1, 3, 4):
+                size = {1: 2, 3: 3, 4: 4}[kind]
+                if body + size > end:
+                    break
+                self._count(int.from_bytes(data[body : body + size], "big"))
+                i = body + size
+            elif kind == 2:
+                if body >= end or body + 1 + data[body] > end:
+                    break
+                note = data[body + 1 : body + 1 + data[body]]
+                try:
+                    self._note = note.decode("utf8")
+                except UnicodeDecodeError:
+                    pass
+                i = body + 1 + data[body]
+            elif kind == 5:
+                if body >= end:
+                    break
+                # Tube selection; some firmware leaves it out (next is 0x55).
+                i = body if data[body] == 0x55 else body + 1
+            else:
+                self._count(0x55)
+                self._count(0xAA)
+                self._count(kind)
+                i = body
+        return i
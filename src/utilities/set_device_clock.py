@@ -1,17 +1,14 @@
-import pygmc
+from typing import Optional
+from . import DeviceSession, get_device_session
 
 
-def set_device_clock() -> None:
+def set_device_clock(session: Optional[DeviceSession] = None) -> None:
     """
     Resets the device's internal RTC. So far I am not convinced.
     """
-    gc = pygmc.GMCSE(port="COM3")
-    # gc = pygmc.connect()  # More generic, loses reference in IDE.
+    session = session or get_device_session()
 
-    gc.get_version()
-    gc.get_serial()
-
-    gc.set_datetime()
+    session.set_clock()
 
 
 if __name__ == "__main__":
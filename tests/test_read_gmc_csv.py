@@ -0,0 +1,55 @@
+import importlib
+import io
+import pytest
+
+read_csv_mod = importlib.import_module("src.data_prep.read_gmc_csv")
+
+HEADER = b"datetime,count,unit,mode,reference_datetime,notes\n"
+GOOD = [b"2026-01-01 00:0%d:00,1%d,CPM,EVERY MINUTE,,a\n" % (i, i) for i in range(4)]
+LONG = b"2026-01-01 00:09:00,19,CPM,EVERY MINUTE,,a,extra\n"
+
+# The line with too many fields first (pandas would take it as the index),
+# in the middle and last.
+BODIES = {
+    "first": b"".join([LONG] + GOOD),
+    "middle": b"".join(GOOD[:2] + [LONG] + GOOD[2:]),
+    "last": b"".join(GOOD + [LONG]),
+}
+
+ENGINES = ["c", "python"]
+if importlib.util.find_spec("pyarrow"):
+    ENGINES.append("pyarrow")
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request, monkeypatch):
+    monkeypatch.setattr(read_csv_mod, "CSV_ENGINE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("where", BODIES)
+def test_read_gmc_csv_skips_long_line(engine, where):
+    df, dropped = read_csv_mod.read_gmc_csv(io.BytesIO(HEADER + BODIES[where]))
+    assert dropped == 1
+    assert df["count"].tolist() == [10, 11, 12, 13]
+    assert df["notes"].tolist() == ["a"] * 4
+
+
+@pytest.mark.parametrize("where", BODIES)
+def test_read_gmc_csv_skips_long_line_without_header(engine, where):
+    df, dropped = read_csv_mod.read_gmc_csv(
+        io.BytesIO(BODIES[where]), names=read_csv_mod.GMC_COLUMNS
+    )
+    assert dropped == 1
+    assert df["count"].tolist() == [10, 11, 12, 13]
+
+
+# Small chunk sizes put the long line first in its chunk
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 500_000])
+@pytest.mark.parametrize("where", BODIES)
+def test_read_gmc_csv_chunks_matches_whole_file(engine, where, chunksize):
+    chunks = list(
+        read_csv_mod.read_gmc_csv_chunks(io.BytesIO(HEADER + BODIES[where]), chunksize)
+    )
+    assert sum(bad for _, bad in chunks) == 1
+    assert [n for c, _ in chunks for n in c["count"]] == [10, 11, 12, 13]